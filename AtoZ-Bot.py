@@ -1,24 +1,71 @@
 import time
 import random
 import json
+import csv
 import ctypes
 import os
 import sys
 import subprocess
+import signal
 import ssl
-import certifi
+import re
+import base64
+import hashlib
+import shutil
+import urllib.request
+import sqlite3
+import socket
+import threading
+import cProfile
+import pstats
+import importlib
 from datetime import datetime, timedelta
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-
-os.environ['SSL_CERT_FILE'] = certifi.where()
-os.environ['SSL_CERT_DIR'] = os.path.dirname(certifi.where())
-ssl._create_default_https_context = lambda: ssl.create_default_context(cafile=certifi.where())
+from types import MappingProxyType
+from functools import lru_cache, wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException
+from shift_clock import MINUTES_PER_DAY, format_clock
+
+class LazyImport:
+    """Stands in for a module (or one name from it) and imports it on first use.
+
+    selenium and undetected_chromedriver take a noticeable part of a second to import and only
+    Browser needs them, so loading this file for its helpers (the GUI worker, the HTTP service,
+    benchmarks) doesn't pay for them.
+    """
+
+    def __init__(self, module, name=None):
+        self.module = module
+        self.name = name
+        self.target = None
+
+    def resolve(self):
+        if self.target is None:
+            target = importlib.import_module(self.module)
+            self.target = getattr(target, self.name) if self.name else target
+        return self.target
+
+    def __getattr__(self, attribute):
+        return getattr(self.resolve(), attribute)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+uc = LazyImport("undetected_chromedriver")
+webdriver = LazyImport("selenium.webdriver")
+By = LazyImport("selenium.webdriver.common.by", "By")
+Keys = LazyImport("selenium.webdriver.common.keys", "Keys")
+WebDriverWait = LazyImport("selenium.webdriver.support.wait", "WebDriverWait")
+EC = LazyImport("selenium.webdriver.support.expected_conditions")
+ChromeOptions = LazyImport("selenium.webdriver.chrome.options", "Options")
+ChromeService = LazyImport("selenium.webdriver.chrome.service", "Service")
+
+def use_certifi():
+    """Point urllib/ssl at certifi's CA bundle before uc downloads chromedriver."""
+    import certifi
+    os.environ['SSL_CERT_FILE'] = certifi.where()
+    os.environ['SSL_CERT_DIR'] = os.path.dirname(certifi.where())
+    ssl._create_default_https_context = lambda: ssl.create_default_context(cafile=certifi.where())
 
 def get_base_path():
     try:
@@ -36,51 +83,901 @@ else:
     CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
     CHROME_PROFILE_DIRECTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ChromeBotProfile")
 
-def load_config():
-    default_config = {
-        "STALL_AFTER_LOGIN": 2,
-        "EARLIEST_TIME": "18:15",
-        "LATEST_TIME": "18:30",
-        "LONGEST_SHIFT": 10,
-        "WEEKDAYS": [
-            "Monday",
-            "Tuesday",
-            "Sunday"
-        ],
-        "Amazon_Login": "jerdix",
-        "HOURS_TO_RUN": 48,
-        "SECONDS_BETWEEN_CHECKS": 15
-    }
-    if os.path.exists(CONFIG_FILE):
+# orchestrator.py points each account's worker at its own config and Chrome profile
+CONFIG_FILE = os.environ.get("ATOZ_CONFIG_FILE", CONFIG_FILE)
+CHROME_PROFILE_DIRECTORY_PATH = os.environ.get("ATOZ_PROFILE_DIR", CHROME_PROFILE_DIRECTORY_PATH)
+# When new matching shifts were seen, kept per config so each account learns its own release pattern
+RELEASE_HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "release_history.json")
+# History of every observed shift and claim attempt; shift_stats.py reads it
+SHIFT_STORE_FILE = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "shifts.db")
+# `python AtoZ-Bot.py --profile` runs every sweep under cProfile and dumps the stats here
+PROFILE = "--profile" in sys.argv
+PROFILE_FILE = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "sweep_profile.prof")
+
+def parse_hour(hora):
+    hour, mint = hora.split(":")
+    minute = "".join([i for i in mint if i.isdigit()])
+    section = mint[len(minute):]
+    hour, minute = int(hour), int(minute)
+    if section.lower() == "pm" and hour != 12:
+        hour += 12
+    return (hour, minute)
+
+def earlier_time(time1, time2):
+    if time1[0] > time2[0]:
+        return time2
+    elif time1[0] < time2[0]:
+        return time1
+    elif time1[1] > time2[1]:
+        return time2
+    else:
+        return time1
+
+def time_diff(time1, time2):
+    if time1[0] < time2[0]:
+        midnight_offset = 24 - time2[0]
+        time2 = list(time2)
+        time2[0] = - midnight_offset
+    diff = time1[0] - time2[0]
+    diff -= time1[1] / 60
+    diff += time2[1] / 60
+    return diff
+
+def parse_clock(value):
+    """Parse '18:15', '6:15pm' or '6:15 PM' into an (hour, minute) tuple."""
+    text = str(value).strip().lower()
+    suffix = text[-2:] if text.endswith(("am", "pm")) else ""
+    hour, minute = text[:len(text) - len(suffix)].strip().split(":")
+    hour, minute = int(hour), int(minute)
+    if suffix == "pm" and hour != 12:
+        hour += 12
+    elif suffix == "am" and hour == 12:
+        hour = 0
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"{value!r} is not a valid time of day")
+    return (hour, minute)
+
+def clock_minutes(clock):
+    return clock[0] * 60 + clock[1]
+
+@lru_cache(maxsize=4096)
+def parse_window(text):
+    """Parse '22:00-02:00' into (start, end) minutes since midnight; end < start spans midnight."""
+    start, end = str(text).split("-")
+    return (clock_minutes(parse_clock(start)), clock_minutes(parse_clock(end)))
+
+class Shift:
+    """A single shift row with its times as minutes since midnight."""
+    __slots__ = ("index", "start", "end", "duration", "text", "button_label", "button_text")
+
+    def __init__(self, index, start, end, text="", button_label=None, button_text=None):
+        self.index = index
+        self.start = start
+        self.end = end
+        # Overnight shifts wrap around midnight instead of going negative
+        self.duration = (end - start) % MINUTES_PER_DAY
+        self.text = text
+        self.button_label = button_label
+        self.button_text = button_text
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a Shift from a snapshot row, or return None if its time text doesn't parse."""
         try:
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-                return {**default_config, **config}
+            start, end = parse_window(row["time"])
+        except ValueError:
+            return None
+        return cls(row["index"], start, end, row["time"], row.get("button_label"), row.get("button_text"))
+
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+def full_weekday(day):
+    """"Mon", "mon" or "Monday" -> "Monday"; anything that isn't a weekday comes back unchanged."""
+    prefix = str(day).strip().lower()[:3]
+    for name in WEEKDAY_NAMES:
+        if len(prefix) == 3 and name.lower().startswith(prefix):
+            return name
+    return day
+
+class ShiftFilter:
+    """Per-weekday start windows and the longest allowed shift, compiled once per config snapshot."""
+
+    def __init__(self, windows_by_day, longest_minutes):
+        self.windows_by_day = windows_by_day
+        self.longest_minutes = longest_minutes
+        self.day_cache = {}
+
+    @classmethod
+    def from_config(cls, settings):
+        # WEEKDAYS use EARLIEST_TIME-LATEST_TIME unless SHIFT_WINDOWS gives the day its own windows
+        # Both are keyed by full weekday name, so an abbreviated SHIFT_WINDOWS key ("Mon") replaces its WEEKDAYS entry
+        default_windows = ((clock_minutes(settings["EARLIEST_TIME"]), clock_minutes(settings["LATEST_TIME"])),)
+        windows_by_day = {full_weekday(day): default_windows for day in settings["WEEKDAYS"]}
+        windows_by_day.update((full_weekday(day), windows) for day, windows in settings["SHIFT_WINDOWS"].items())
+        return cls(windows_by_day, round(settings["LONGEST_SHIFT"] * 60))
+
+    def windows_for(self, day_text):
+        """Return the start windows for a slider day's text, or None if that weekday is excluded."""
+        if day_text not in self.day_cache:
+            windows = None
+            for day, day_windows in self.windows_by_day.items():
+                if day in day_text:
+                    windows = day_windows
+                    break
+            self.day_cache[day_text] = windows
+        return self.day_cache[day_text]
+
+    def matches(self, day_text, shifts):
+        """Return the shifts from one day's batch that start inside a window and are short enough."""
+        windows = self.windows_for(day_text)
+        if not windows:
+            return []
+        longest = self.longest_minutes
+        matched = []
+        for shift in shifts:
+            if shift is None or shift.duration > longest:
+                continue
+            start = shift.start
+            for low, high in windows:
+                if (low <= start <= high) if low <= high else (start >= low or start <= high):
+                    matched.append(shift)
+                    break
+        return matched
+
+    def fingerprint(self):
+        """A string that changes whenever this filter could reach a different decision."""
+        return repr((sorted(self.windows_by_day.items()), self.longest_minutes))
+
+# Field names the shift opportunity payloads have been seen to use for start and end times
+PAYLOAD_START_KEYS = ("startDateTime", "startTime", "shiftStartTime", "start")
+PAYLOAD_END_KEYS = ("endDateTime", "endTime", "shiftEndTime", "end")
+
+def parse_payload_datetime(value):
+    """Accept ISO strings or epoch seconds/milliseconds, returning a naive local datetime."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000 if value > 1e11 else value)
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        # Offset-aware times are shown to the associate in local time
+        return parsed.astimezone().replace(tzinfo=None) if parsed.tzinfo else parsed
+    return None
+
+def decode_shift_payload(payload):
+    """Find every shift-like object in a JSON payload and return its (start, end) datetimes."""
+    found = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            start = next((parse_payload_datetime(node[key]) for key in PAYLOAD_START_KEYS if key in node), None)
+            end = next((parse_payload_datetime(node[key]) for key in PAYLOAD_END_KEYS if key in node), None)
+            if start and end:
+                found.append((start, end))
+            else:
+                stack.extend(node.values())
+    return found
+
+class NetworkShiftSource:
+    """Shift opportunities decoded from the SPA's own JSON responses, read through chromedriver's performance log."""
+
+    def __init__(self, driver, url_pattern):
+        self.driver = driver
+        self.url_pattern = url_pattern
+        self.pending = {}
+        self.shifts_by_date = {}
+        self.payloads = 0
+        self.driver.execute_cdp_cmd("Network.enable", {})
+
+    def begin_sweep(self):
+        """Drop responses from earlier sweeps so only data the SPA fetched this sweep is trusted."""
+        self.poll()
+        self.shifts_by_date = {}
+        self.payloads = 0
+
+    def poll(self):
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            params = message.get("params", {})
+            if message.get("method") == "Network.responseReceived":
+                response = params.get("response", {})
+                if "json" in response.get("mimeType", "") and self.url_pattern.search(response.get("url", "")):
+                    self.pending[params["requestId"]] = response["url"]
+            elif message.get("method") == "Network.loadingFinished" and params.get("requestId") in self.pending:
+                self.read_body(params["requestId"], self.pending.pop(params["requestId"]))
+
+    def read_body(self, request_id, url):
+        try:
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            text = base64.b64decode(body["body"]).decode("utf-8") if body.get("base64Encoded") else body["body"]
+            pairs = decode_shift_payload(json.loads(text))
         except Exception as e:
+            print(f"Could not read shift payload from {url}: {e}")
+            return
+        if pairs:
+            self.payloads += 1
+        for start, end in pairs:
+            start_minutes, end_minutes = start.hour * 60 + start.minute, end.hour * 60 + end.minute
+            day = self.shifts_by_date.setdefault(start.date(), {})
+            day[(start_minutes, end_minutes)] = Shift(None, start_minutes, end_minutes, f"{format_clock(start_minutes)} - {format_clock(end_minutes)}")
+
+    def covers(self, day):
+        """True if the captured payloads span this date, so a date with no entries really has no shifts."""
+        return bool(self.shifts_by_date) and min(self.shifts_by_date) <= day <= max(self.shifts_by_date)
+
+    def shifts_for(self, day):
+        return list(self.shifts_by_date.get(day, {}).values())
+
+DEFAULT_CONFIG = {
+    "STALL_AFTER_LOGIN": 2,
+    "EARLIEST_TIME": "18:15",
+    "LATEST_TIME": "18:30",
+    "LONGEST_SHIFT": 10,
+    "WEEKDAYS": [
+        "Monday",
+        "Tuesday",
+        "Sunday"
+    ],
+    "Amazon_Login": "",
+    "HOURS_TO_RUN": 48,
+    "SECONDS_BETWEEN_CHECKS": 15,
+    "BULK_EXTRACTION": True,
+    "SHIFT_WINDOWS": {},
+    "RESIDENT_MODE": False,
+    "RESIDENT_RELOAD_EVERY": 20,
+    "EVENT_MODE": False,
+    "EVENT_FULL_SWEEP_SECONDS": 0,
+    "NETWORK_CAPTURE": False,
+    "NETWORK_SHIFT_URL_PATTERN": "opportunit|shift",
+    "LEAN_MODE": False,
+    "LEAN_HEADLESS": False,
+    "LEAN_WINDOW_SIZE": "1024,768",
+    "BLOCKED_URL_PATTERNS": [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*"
+    ],
+    "SWEEP_OFFSET_SECONDS": 0,
+    "SCAN_TABS": 1,
+    "FAST_CLAIM": True,
+    "CLAIM_CONFIRM_TIMEOUT": 5,
+    "WAIT_POLL_MS": 50,
+    "RENDER_SETTLE_MS": 250,
+    "RENDER_QUIET_MS": 600,
+    "RENDER_TIMEOUT": 10,
+    "CLICK_PAUSE_SECONDS": [0.1, 0.3],
+    "ADAPTIVE_POLLING": False,
+    "POLL_MIN_SECONDS": 10,
+    "POLL_MAX_SECONDS": 300,
+    "POLL_BACKOFF": 2.0,
+    "POLL_JITTER": 0.2,
+    "HOT_WINDOW_SHARE": 0.25,
+    "SHIFT_STORE": True,
+    "INCREMENTAL_SWEEP": False,
+    "FULL_SWEEP_EVERY": 10,
+    "METRICS_PORT": 0,
+    "METRICS_FILE": "",
+    "ATTACH_CHROME": False,
+    "CHROME_DEBUG_PORT": 0,
+    "ATTACH_LAUNCH": True,
+    "SWEEP_DEADLINE": 300,
+    "RELAUNCH_BACKOFF_MIN": 5,
+    "RELAUNCH_BACKOFF_MAX": 300,
+    "MEMORY_CHECK_EVERY": 10,
+    "TAB_RECYCLE_HEAP_MB": 256,
+    "BROWSER_RECYCLE_RSS_MB": 2048,
+    "MEMORY_LOG_FILE": "memory_log.csv",
+    "PROFILE_PRUNE": True,
+    "DISK_CACHE_DIR": "",
+    "DISK_CACHE_SIZE_MB": 64
+}
+
+def parse_click_pause(pause):
+    """Parse [low, high] seconds for random.uniform(); anything but two non-negative numbers is rejected."""
+    if isinstance(pause, (str, bytes)) or len(pause) != 2:
+        raise ValueError(f"expected [low, high] seconds, got {pause!r}")
+    low, high = sorted(float(seconds) for seconds in pause)
+    if low < 0:
+        raise ValueError(f"pauses can't be negative, got {pause!r}")
+    return (low, high)
+
+def parse_output_file(name):
+    """Parse a file name the bot writes to, which is resolved against config.json's directory and has to stay in it."""
+    name = str(name)
+    normalized = os.path.normpath(name)
+    if name and (os.path.isabs(name) or os.path.splitdrive(name)[0] or normalized == os.pardir or normalized.startswith(os.pardir + os.sep)):
+        raise ValueError(f"expected a file name inside the config directory, got {name!r}")
+    return name
+
+# Applied once per reload so the scanning loop only ever sees parsed, typed values
+CONFIG_NORMALIZERS = {
+    "STALL_AFTER_LOGIN": float,
+    "EARLIEST_TIME": parse_clock,
+    "LATEST_TIME": parse_clock,
+    "LONGEST_SHIFT": float,
+    "WEEKDAYS": lambda days: frozenset(str(day) for day in days),
+    "Amazon_Login": str,
+    "HOURS_TO_RUN": float,
+    "SECONDS_BETWEEN_CHECKS": float,
+    "BULK_EXTRACTION": bool,
+    "RESIDENT_MODE": bool,
+    "RESIDENT_RELOAD_EVERY": int,
+    "EVENT_MODE": bool,
+    "EVENT_FULL_SWEEP_SECONDS": float,
+    "NETWORK_CAPTURE": bool,
+    "NETWORK_SHIFT_URL_PATTERN": re.compile,
+    "LEAN_MODE": bool,
+    "LEAN_HEADLESS": bool,
+    "LEAN_WINDOW_SIZE": lambda size: ",".join(str(int(part)) for part in str(size).split(",")),
+    "BLOCKED_URL_PATTERNS": lambda patterns: tuple(str(pattern) for pattern in patterns),
+    "SWEEP_OFFSET_SECONDS": float,
+    "SCAN_TABS": lambda tabs: max(1, int(tabs)),
+    "FAST_CLAIM": bool,
+    "CLAIM_CONFIRM_TIMEOUT": float,
+    "WAIT_POLL_MS": lambda ms: max(10, int(ms)),
+    "RENDER_SETTLE_MS": int,
+    "RENDER_QUIET_MS": int,
+    "RENDER_TIMEOUT": float,
+    "CLICK_PAUSE_SECONDS": parse_click_pause,
+    "ADAPTIVE_POLLING": bool,
+    "POLL_MIN_SECONDS": lambda seconds: max(1.0, float(seconds)),
+    "POLL_MAX_SECONDS": float,
+    "POLL_BACKOFF": lambda factor: max(1.0, float(factor)),
+    "POLL_JITTER": lambda jitter: min(max(float(jitter), 0.0), 0.9),
+    "HOT_WINDOW_SHARE": float,
+    "SHIFT_STORE": bool,
+    "INCREMENTAL_SWEEP": bool,
+    "FULL_SWEEP_EVERY": lambda sweeps: max(1, int(sweeps)),
+    "METRICS_PORT": int,
+    "METRICS_FILE": parse_output_file,
+    "ATTACH_CHROME": bool,
+    "CHROME_DEBUG_PORT": int,
+    "ATTACH_LAUNCH": bool,
+    "SWEEP_DEADLINE": float,
+    "RELAUNCH_BACKOFF_MIN": lambda seconds: max(1.0, float(seconds)),
+    "RELAUNCH_BACKOFF_MAX": float,
+    "MEMORY_CHECK_EVERY": lambda sweeps: max(0, int(sweeps)),
+    "TAB_RECYCLE_HEAP_MB": float,
+    "BROWSER_RECYCLE_RSS_MB": float,
+    "MEMORY_LOG_FILE": parse_output_file,
+    "PROFILE_PRUNE": bool,
+    "DISK_CACHE_DIR": lambda path: os.path.expandvars(os.path.expanduser(str(path))),
+    "DISK_CACHE_SIZE_MB": lambda mb: max(0, int(mb)),
+    "SHIFT_WINDOWS": lambda windows: MappingProxyType({
+        str(day): tuple(parse_window(span) for span in spans) for day, spans in windows.items()
+    }),
+}
+
+def normalize_config(raw):
+    """Validate and convert a raw config dict into an immutable snapshot."""
+    normalized = dict(raw)
+    for key, normalize in CONFIG_NORMALIZERS.items():
+        try:
+            normalized[key] = normalize(raw[key])
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"{key}: {e}")
+    return MappingProxyType(normalized)
+
+def stays_on_find_shifts(settings):
+    """Event mode watches the Find Shifts DOM between sweeps, so it needs the page kept open like resident mode."""
+    return settings["RESIDENT_MODE"] or settings["EVENT_MODE"]
+
+def event_full_sweep_seconds(settings):
+    """Seconds between event mode's full sweeps, at most SECONDS_BETWEEN_CHECKS.
+
+    The observer only sees the day on screen; every other day is checked by the full sweep
+    alone, so spacing those further apart than polling would make event mode slower.
+    """
+    interval = settings["SECONDS_BETWEEN_CHECKS"]
+    if settings["EVENT_FULL_SWEEP_SECONDS"] > 0:
+        interval = min(interval, settings["EVENT_FULL_SWEEP_SECONDS"])
+    return interval
+
+class Config:
+    """config.json, re-read only when the file's modification time or size changes."""
+
+    def __init__(self, path):
+        self.path = path
+        self.stamp = None
+        self.file_stamp = None
+        self.current = None
+        # Why the settings in use aren't all the file's, or None; main() won't start sweeping while set
+        self.error = None
+        self.compiled = None
+        self.compiled_for = None
+        # Values sent by the GUI over the event channel; they apply until config.json next changes
+        self.overrides = {}
+        self.overrides_version = 0
+
+    def read_stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def snapshot(self):
+        file_stamp = self.read_stamp()
+        if file_stamp != self.file_stamp:
+            self.file_stamp = file_stamp
+            self.overrides = {}
+        stamp = (file_stamp, self.overrides_version)
+        if self.current is not None and stamp == self.stamp:
+            return self.current
+        self.stamp = stamp
+
+        raw = dict(DEFAULT_CONFIG)
+        try:
+            if file_stamp is not None:
+                with open(self.path, "r") as f:
+                    raw.update(json.load(f))
+        except (OSError, ValueError) as e:
+            # The GUI saves on every keystroke, so a half-written file is expected; keep the last good config
             print(f"Error loading config: {e}")
-    return default_config
+            if self.current is None:
+                self.error = f"{self.path} could not be read: {e}"
+                self.current = normalize_config(DEFAULT_CONFIG)
+            return self.current
+        raw.update(self.overrides)
+
+        # A value that doesn't parse keeps its last good value; the file's other settings still apply
+        fallback = self.current or normalize_config(DEFAULT_CONFIG)
+        snapshot = dict(raw)
+        bad = []
+        for key, normalize in CONFIG_NORMALIZERS.items():
+            try:
+                snapshot[key] = normalize(raw[key])
+            except (TypeError, ValueError) as e:
+                snapshot[key] = fallback[key]
+                bad.append(f"{key}: {e}")
+        if bad:
+            print(f"Error loading config, keeping the last good value of {'; '.join(bad)}")
+        # With no earlier good value the fallback is only a default, which must never be swept with
+        self.error = f"invalid {'; '.join(bad)}" if bad and (self.current is None or self.error) else None
+        snapshot = MappingProxyType(snapshot)
+
+        if self.current is not None:
+            changed = [key for key in snapshot if snapshot[key] != self.current.get(key)]
+            if changed:
+                print(f"Config reloaded from {self.path}: {', '.join(changed)} changed.")
+        self.current = snapshot
+        return snapshot
+
+    def apply_overrides(self, values):
+        """Layer values over config.json from another thread; the next snapshot() picks them up."""
+        self.overrides = {**self.overrides, **values}
+        self.overrides_version += 1
+
+    def shift_filter(self, snapshot):
+        """Return the ShiftFilter for a snapshot, compiling it only the first time it is asked for."""
+        if self.compiled_for is not snapshot:
+            self.compiled = ShiftFilter.from_config(snapshot)
+            self.compiled_for = snapshot
+        return self.compiled
+
+config = Config(CONFIG_FILE)
+app_config = config.snapshot()
+
+class EventChannel:
+    """Typed JSON-lines events for the GUI over a localhost socket. Does nothing unless ATOZ_EVENT_PORT is set."""
+
+    def __init__(self, port=None):
+        self.sock = None
+        if not port:
+            return
+        try:
+            self.sock = socket.create_connection(("127.0.0.1", int(port)), timeout=5)
+            self.sock.settimeout(None)
+        except (OSError, ValueError) as e:
+            print(f"Event channel unavailable, logging to stdout only: {e}")
+            self.sock = None
+
+    def emit(self, kind, **fields):
+        sock = self.sock
+        if sock is None:
+            return
+        fields["type"] = kind
+        fields["time"] = time.time()
+        try:
+            sock.sendall((json.dumps(fields, default=str) + "\n").encode("utf-8"))
+        except OSError:
+            self.sock = None
+
+events = EventChannel(os.environ.get("ATOZ_EVENT_PORT"))
+
+# Set by bot_worker.py to end main() at the next day boundary or wait, leaving the process running
+stop_requested = threading.Event()
+
+class Metrics:
+    """Counters and timers for the scanning loop, exported in Prometheus text format. Disabled, every call returns at once."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        # (name, labels) -> value, and name -> [count, total seconds, longest]
+        self.counters = {}
+        self.timers = {}
+        self.server = None
+
+    def count(self, name, amount=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, seconds):
+        if not self.enabled:
+            return
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+    def render(self):
+        lines = []
+        family = None
+        for (name, labels), value in sorted(list(self.counters.items())):
+            if name != family:
+                lines.append(f"# TYPE atoz_{name} counter")
+                family = name
+            label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+            lines.append(f"atoz_{name}{{{label_text}}} {value}" if labels else f"atoz_{name} {value}")
+        for name, (count, total, longest) in sorted(list(self.timers.items())):
+            lines.append(f"# TYPE atoz_{name}_seconds summary")
+            lines.append(f"atoz_{name}_seconds_count {count}")
+            lines.append(f"atoz_{name}_seconds_sum {total:.6f}")
+            lines.append(f"# TYPE atoz_{name}_seconds_max gauge")
+            lines.append(f"atoz_{name}_seconds_max {longest:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def write_file(self, path):
+        # Written beside and renamed over the old file so a scraper never reads half of it
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as f:
+            f.write(self.render())
+        os.replace(temporary, path)
+
+    def serve(self, port):
+        """Serve /metrics on localhost from a daemon thread."""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.render().encode("utf-8")
+                self.send_response(200 if self.path in ("/", "/metrics") else 404)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.server = server
+        return server
+
+metrics = Metrics()
+
+def metered(name):
+    """Time every call of the decorated function into the `name` timer."""
+    def decorate(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return function(*args, **kwargs)
+            started = time.monotonic()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                metrics.observe(name, time.monotonic() - started)
+        return wrapper
+    return decorate
+
+class MeteredWait:
+    """WebDriverWait that counts the waits that time out."""
+
+    def __init__(self, driver, timeout, *args, **kwargs):
+        self.wait = WebDriverWait(driver, timeout, *args, **kwargs)
+
+    def until(self, method, message=""):
+        try:
+            return self.wait.until(method, message)
+        except TimeoutException:
+            metrics.count("timeouts_total", wait="webdriver")
+            raise
+
+# Error text that means the session itself is gone (Chrome crashed or was closed, chromedriver died)
+# rather than something wrong with the page
+DRIVER_GONE_MARKERS = (
+    "invalid session id", "no such session", "session deleted", "disconnected", "chrome not reachable",
+    "no such window", "target window already closed", "connection refused", "connection aborted",
+    "max retries exceeded", "remote end closed",
+)
 
-app_config = load_config()
+def driver_is_gone(error):
+    """True if `error` means the WebDriver session is dead, so retrying on the same driver is pointless."""
+    if isinstance(error, (InvalidSessionIdException, ConnectionError)):
+        return True
+    return any(marker in str(error).lower() for marker in DRIVER_GONE_MARKERS)
 
-STALL_AFTER_LOGIN = app_config.get("STALL_AFTER_LOGIN", 2)
-EARLIEST_TIME = app_config.get("EARLIEST_TIME", "18:15")
-LATEST_TIME = app_config.get("LATEST_TIME", "18:30")
-LONGEST_SHIFT = app_config.get("LONGEST_SHIFT", 10)
-WEEKDAYS = app_config.get("WEEKDAYS", [])
-Amazon_Login = app_config.get("Amazon_Login", "jerdix")
-HOURS_TO_RUN = app_config.get("HOURS_TO_RUN", 48)
-SECONDS_BETWEEN_CHECKS = app_config.get("SECONDS_BETWEEN_CHECKS", 15)
+# WebDriver commands that return located elements
+FIND_COMMANDS = frozenset(("findElement", "findElements", "findChildElement", "findChildElements"))
 
-# Automatically set the search window from today to 30 days in the future
-today = datetime.now()
-START_DATE = today.strftime("%b %d") 
-END_DATE = (today + timedelta(days=30)).strftime("%b %d") 
+# Read each day's shift rows with one script call instead of one WebDriver call per element
+BULK_EXTRACTION = app_config["BULK_EXTRACTION"]
+
+# Shifts are searched from today to SEARCH_DAYS ahead; see search_window()
+SEARCH_DAYS = 30
 
 LOGIN_URL = "https://atoz-login.amazon.work"
 
 HOMEPAGE_IDENTIFIER = "//*[@id='atoz-app-root']/div[2]/div[1]/div[3]/h2"
 MENU_BURGER = "//*[@id='atoz-global-nav-header']/div/div/header/div/div/nav/ul/li[1]/button"
 
+SCHEDULE_NAV_BUTTON = "/html/body/div[3]/div[2]/div/div[2]/div/nav/div[2]/div/ul/li[2]/button"
+FIND_SHIFTS_NAV_LINK = "/html/body/div[3]/div[2]/div/div[2]/div/nav/div[2]/div/ul/li[2]/div/ul/li[4]/div/a"
+SUCCESS_DONE_BUTTON = "//button[@data-test-id='AddOpportunityModalSuccessDoneButton']"
+
+DAY_SLIDER_XPATH = "//*[@id='atoz-app-root']/div[1]/div/div[2]/div/div"
+SHIFT_ROWS_XPATH = "//*[@id='atoz-app-root']/div[1]/div/div[3]/div[1]/div/div[3]/div[2]/div"
+# Relative to a single shift row
+SHIFT_TIME_XPATH = "/div/div[1]/div[1]/div[1]/div[1]/div/strong"
+SHIFT_BUTTON_XPATH = "/div/div[2]/div/button"
+
+# Pulls the whole day slider and the visible shift list in one WebDriver round trip.
+# arguments[0] is the day slider XPath, arguments[1] the shift rows XPath (either may be null).
+SNAPSHOT_SCRIPT = """
+function all(path) {
+    var result = document.evaluate(path, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var k = 0; k < result.snapshotLength; k++) nodes.push(result.snapshotItem(k));
+    return nodes;
+}
+function first(path, context) {
+    return document.evaluate(path, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function text(node) {
+    return node ? node.innerText.trim() : "";
+}
+var days = arguments[0] ? all(arguments[0]).map(function (day, k) {
+    return {
+        index: k + 1,
+        weekday: text(first("./div/div[1]", day)),
+        date: text(first("./div/div[2]", day)).replace(/\\n/g, " ")
+    };
+}) : [];
+var timePath = "." + arguments[2], buttonPath = "." + arguments[3];
+var shifts = arguments[1] ? all(arguments[1]).map(function (row, k) {
+    var timeText = text(first(timePath, row));
+    var parts = timeText.split("-");
+    var button = first(buttonPath, row);
+    return {
+        index: k + 1,
+        time: timeText,
+        start: parts.length === 2 ? parts[0].trim() : null,
+        end: parts.length === 2 ? parts[1].trim() : null,
+        button_label: button ? (button.getAttribute("aria-label") || "") : "",
+        button_text: text(button),
+        button_disabled: button ? button.disabled : null
+    };
+}) : [];
+return {days: days, shifts: shifts};
+"""
+
+# The element whose children are the shift rows
+SHIFT_LIST_XPATH = SHIFT_ROWS_XPATH[:SHIFT_ROWS_XPATH.rindex("/")]
+
+# Installs a MutationObserver that queues which shift rows changed into window.__atozShiftChanges.
+# Returns false if an observer is already installed on this page. arguments[0] is the shift list XPath.
+INSTALL_OBSERVER_SCRIPT = """
+if (window.__atozObserver) return false;
+var listPath = arguments[0];
+window.__atozShiftChanges = [];
+window.__atozObserver = new MutationObserver(function (mutations) {
+    var list = document.evaluate(listPath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!list) return;
+    mutations.forEach(function (mutation) {
+        if (!list.contains(mutation.target)) return;
+        if (mutation.target === list) {
+            window.__atozShiftChanges.push({kind: "list"});
+            return;
+        }
+        var row = mutation.target;
+        while (row && row.parentNode !== list) row = row.parentNode;
+        if (row) window.__atozShiftChanges.push({kind: "row", index: Array.prototype.indexOf.call(list.children, row) + 1});
+    });
+});
+window.__atozObserver.observe(document.getElementById("atoz-app-root") || document.body, {
+    subtree: true, childList: true, characterData: true, attributes: true,
+    attributeFilter: ["aria-label", "disabled", "class"]
+});
+return true;
+"""
+
+# Async script: resolves with the queued changes as soon as there are any, or with [] after
+# arguments[0] milliseconds. Resolves with null if the observer is gone (the page was reloaded).
+WAIT_FOR_CHANGES_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var deadline = Date.now() + arguments[0];
+(function poll() {
+    var changes = window.__atozShiftChanges;
+    if (changes === undefined) {
+        done(null);
+    } else if (changes.length || Date.now() >= deadline) {
+        window.__atozShiftChanges = [];
+        done(changes);
+    } else {
+        setTimeout(poll, 50);
+    }
+})();
+"""
+
+# Transfer size of everything the page fetched since the last call, plus the document's load timings.
+# Clearing the resource buffer makes each report a delta, which also covers SPA route changes.
+PAGE_STATS_SCRIPT = """
+var nav = performance.getEntriesByType("navigation")[0];
+var resources = performance.getEntriesByType("resource");
+var bytes = 0;
+resources.forEach(function (entry) { bytes += entry.transferSize || 0; });
+var fresh = !window.__atozStatsSeen;
+window.__atozStatsSeen = true;
+if (fresh && nav) bytes += nav.transferSize || 0;
+performance.clearResourceTimings();
+return {
+    url: location.href,
+    bytes: bytes,
+    requests: resources.length + (fresh && nav ? 1 : 0),
+    new_document: fresh,
+    load_ms: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null,
+    dom_ms: nav && nav.domContentLoadedEventEnd ? nav.domContentLoadedEventEnd - nav.startTime : null
+};
+"""
+
+# Clicks a row's Add button in the page itself, re-checking that it still says Add at the moment of the click.
+# arguments[0] is the button's XPath.
+CLAIM_SCRIPT = """
+var button = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!button) return "missing";
+var label = (button.getAttribute("aria-label") || "") + " " + button.innerText;
+if (label.indexOf("Add") === -1 || button.disabled) return "unavailable";
+button.click();
+return "clicked";
+"""
+
+# Async script: polls every 25ms until the success modal appears (and dismisses it), or until the
+# deadline. arguments are the Add button XPath, the modal's Done button XPath and the timeout in ms.
+# Without the modal the result comes from the button as it is at the deadline, not from a re-render
+# that briefly removed it: "button-changed" if it no longer offers Add, otherwise "timeout".
+CONFIRM_CLAIM_SCRIPT = """
+var buttonPath = arguments[0], donePath = arguments[1], deadline = Date.now() + arguments[2];
+var done = arguments[arguments.length - 1];
+function find(path) {
+    return document.evaluate(path, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+(function poll() {
+    var doneButton = find(donePath);
+    if (doneButton) {
+        doneButton.click();
+        done("confirmed");
+        return;
+    }
+    if (Date.now() >= deadline) {
+        var button = find(buttonPath);
+        var offersAdd = button && ((button.getAttribute("aria-label") || "") + " " + button.innerText).indexOf("Add") !== -1;
+        done(offersAdd ? "timeout" : "button-changed");
+        return;
+    }
+    setTimeout(poll, 25);
+})();
+"""
+
+# Async script that replaces the fixed sleep after a day click. Polls the shift list until it has changed
+# from the last render (rows swapped out, or new network responses finished) and then stayed unchanged for
+# settleMs, or until quietMs passes with no change at all (the day shows the same rows). The result carries
+# a hash of every row's text and button states, which incremental sweeps compare between sweeps.
+# arguments are rowsXPath, pollMs, settleMs, quietMs and timeoutMs.
+WAIT_FOR_RENDER_SCRIPT = """
+var rowsPath = arguments[0], pollMs = arguments[1], settleMs = arguments[2], quietMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var started = Date.now(), deadline = started + arguments[4];
+if (!window.__atozResources) {
+    // Counted with an observer because the resource timing buffer stops growing once it is full
+    window.__atozResources = {count: 0};
+    new PerformanceObserver(function (list) {
+        window.__atozResources.count += list.getEntries().length;
+    }).observe({type: "resource"});
+}
+function state() {
+    var rows = document.evaluate(rowsPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var signature = rows.snapshotLength + ":";
+    if (rows.snapshotLength) signature += rows.snapshotItem(0).innerText + "|" + rows.snapshotItem(rows.snapshotLength - 1).innerText;
+    return {rows: rows.snapshotLength, signature: signature, resources: window.__atozResources.count};
+}
+var last = state(), previous = window.__atozRenderState || last, lastChange = started, changed = false;
+function fingerprint() {
+    var rows = document.evaluate(rowsPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var hash = 2166136261;
+    for (var k = 0; k < rows.snapshotLength; k++) {
+        var row = rows.snapshotItem(k), text = row.innerText;
+        row.querySelectorAll("button").forEach(function (button) {
+            text += "|" + (button.getAttribute("aria-label") || "") + (button.disabled ? "!" : "");
+        });
+        text += "\\n";
+        for (var c = 0; c < text.length; c++) hash = Math.imul(hash ^ text.charCodeAt(c), 16777619) >>> 0;
+    }
+    return rows.snapshotLength + ":" + hash.toString(16);
+}
+function finish(reason) {
+    window.__atozRenderState = last;
+    done({reason: reason, elapsed: Date.now() - started, rows: last.rows, fingerprint: fingerprint()});
+}
+(function poll() {
+    var now = Date.now(), current = state();
+    if (current.signature !== last.signature || current.resources !== last.resources) lastChange = now;
+    last = current;
+    if (current.signature !== previous.signature || current.resources !== previous.resources) changed = true;
+    if (changed && now - lastChange >= settleMs) return finish("settled");
+    if (!changed && now - started >= quietMs) return finish("unchanged");
+    if (now >= deadline) return finish("timeout");
+    setTimeout(poll, pollMs);
+})();
+"""
+
+# Async script: waits until an element's position stops changing, e.g. a slide-out menu finishing its animation.
+# arguments are the element, pollMs and timeoutMs.
+WAIT_UNTIL_STILL_SCRIPT = """
+var element = arguments[0], pollMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var started = Date.now(), deadline = started + arguments[2];
+function box() {
+    var rect = element.getBoundingClientRect();
+    return [rect.left, rect.top, rect.width, rect.height].join(",");
+}
+var last = box();
+(function poll() {
+    setTimeout(function () {
+        var current = box();
+        if (current === last || Date.now() >= deadline) {
+            done({reason: current === last ? "still" : "timeout", elapsed: Date.now() - started});
+        } else {
+            last = current;
+            poll();
+        }
+    }, pollMs);
+})();
+"""
+
+# Navigation states tracked by Browser so resident mode can stay on Find Shifts between sweeps
+NAV_UNKNOWN = "unknown"
+NAV_HOME = "home"
+NAV_FIND_SHIFTS = "find-shifts"
+NAV_MODAL = "modal"
+
+# Works out which page the SPA is showing in one round trip.
+# arguments are the success modal, day slider and homepage XPaths, checked in that order.
+NAV_STATE_SCRIPT = """
+function exists(path) {
+    return document.evaluate(path, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+}
+if (exists(arguments[0])) return "modal";
+if (exists(arguments[1])) return "find-shifts";
+if (exists(arguments[2])) return "home";
+return "unknown";
+"""
+
 # Windows API Constants for preventing sleep
 ES_CONTINUOUS = 0x80000000
 ES_SYSTEM_REQUIRED = 0x00000001
@@ -133,22 +1030,642 @@ def get_date_object(date_str):
     except ValueError:
         return None
 
+def search_window():
+    """Today and SEARCH_DAYS ahead as slider-style dates, worked out each sweep so long runs and later Starts roll over."""
+    today = datetime.now()
+    return today.strftime("%b %d"), (today + timedelta(days=SEARCH_DAYS)).strftime("%b %d")
+
+HOURS_PER_WEEK = 7 * 24
+
+def hour_of_week(when):
+    return when.weekday() * 24 + when.hour
+
+class PollScheduler:
+    """Picks the delay before the next sweep from an hour-of-week histogram of when new matches appeared."""
+
+    # An hour needs at least this many releases on record before it counts as hot
+    min_releases = 2
+
+    def __init__(self, min_interval, max_interval, backoff=2.0, jitter=0.2, hot_share=0.25, history_file=None, rng=None):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self.jitter = jitter
+        self.hot_share = hot_share
+        self.history_file = history_file
+        self.rng = rng or random.Random()
+        self.histogram = [0] * HOURS_PER_WEEK
+        self.interval = min_interval
+        self.load()
+
+    @classmethod
+    def from_config(cls, settings, history_file=None):
+        scheduler = cls(settings["POLL_MIN_SECONDS"], settings["POLL_MAX_SECONDS"], history_file=history_file)
+        scheduler.configure(settings)
+        return scheduler
+
+    def configure(self, settings):
+        self.min_interval = settings["POLL_MIN_SECONDS"]
+        self.max_interval = max(self.min_interval, settings["POLL_MAX_SECONDS"])
+        self.backoff = settings["POLL_BACKOFF"]
+        self.jitter = settings["POLL_JITTER"]
+        self.hot_share = settings["HOT_WINDOW_SHARE"]
+
+    def load(self):
+        if not self.history_file or not os.path.exists(self.history_file):
+            return
+        try:
+            with open(self.history_file, "r") as f:
+                histogram = json.load(f)["hour_of_week"]
+            if len(histogram) == HOURS_PER_WEEK:
+                self.histogram = [int(count) for count in histogram]
+        except Exception as e:
+            print(f"Ignoring unreadable release history {self.history_file}: {e}")
+
+    def save(self):
+        if not self.history_file:
+            return
+        try:
+            with open(self.history_file, "w") as f:
+                json.dump({"hour_of_week": self.histogram}, f)
+        except OSError as e:
+            print(f"Could not save release history: {e}")
+
+    def record(self, when, new_matches):
+        """Feed back one sweep: reset to the fastest rate after new matches, back off otherwise."""
+        if new_matches:
+            self.histogram[hour_of_week(when)] += new_matches
+            self.interval = self.min_interval
+            self.save()
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+
+    def is_hot(self, bucket):
+        count = self.histogram[bucket % HOURS_PER_WEEK]
+        return count >= self.min_releases and count >= self.hot_share * max(self.histogram)
+
+    def next_delay(self, now):
+        if self.is_hot(hour_of_week(now)):
+            delay = self.min_interval
+        else:
+            delay = self.interval
+            # Wake up for the start of the next hot hour rather than sleeping through it
+            hour_start = now.replace(minute=0, second=0, microsecond=0)
+            for ahead in range(1, int(delay // 3600) + 2):
+                upcoming = hour_start + timedelta(hours=ahead)
+                if (upcoming - now).total_seconds() >= delay:
+                    break
+                if self.is_hot(hour_of_week(upcoming)):
+                    delay = (upcoming - now).total_seconds()
+                    break
+        delay *= self.rng.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(self.max_interval, max(self.min_interval, delay))
+
+SHIFT_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shifts (
+    date TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    text TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    gone_at REAL,
+    rejected_by TEXT,
+    PRIMARY KEY (date, start, end, location)
+);
+CREATE INDEX IF NOT EXISTS shifts_rejected ON shifts (rejected_by, date);
+CREATE TABLE IF NOT EXISTS claims (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    text TEXT,
+    attempted_at REAL NOT NULL,
+    outcome TEXT,
+    click_ms REAL,
+    confirm_ms REAL
+);
+"""
+
+class ShiftStore:
+    """SQLite (WAL) history of observed shifts and claim attempts, buffered and written once per sweep."""
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SHIFT_STORE_SCHEMA)
+        # key -> [text, seen_at, evaluated, rejected_by]; keys are (date, start, end, location)
+        self.observed = {}
+        self.scanned_dates = {}
+        self.claims = []
+        self.rejected = set()
+        self.filter_key = None
+        self.skipped = 0
+
+    def use_filter(self, shift_filter):
+        """Load the rows this filter has already turned down, once per filter change."""
+        key = shift_filter.fingerprint()
+        if key == self.filter_key:
+            return
+        self.flush()
+        self.filter_key = key
+        rows = self.connection.execute(
+            "SELECT date, start, end, location FROM shifts WHERE rejected_by = ? AND date >= ?",
+            (key, datetime.now().date().isoformat()),
+        )
+        self.rejected = {tuple(row) for row in rows}
+
+    def triage(self, date, shifts, complete=True):
+        """Record a day's rows as seen and return the ones that still need evaluating.
+
+        The DOM doesn't expose a location, so it is stored as an empty string. `complete` says the
+        rows are the day's whole list, which lets rows missing from it be marked as gone.
+        """
+        seen_at = time.time()
+        date_text = date.isoformat()
+        if complete:
+            self.scanned_dates[date_text] = seen_at
+        fresh = []
+        for shift in shifts:
+            if shift is None:
+                continue
+            key = (date_text, shift.start, shift.end, "")
+            if key in self.rejected:
+                self.skipped += 1
+                self.observed[key] = [shift.text, seen_at, False, None]
+            else:
+                self.observed[key] = [shift.text, seen_at, True, None]
+                fresh.append(shift)
+        return fresh
+
+    def reject(self, date, shifts, matched):
+        date_text = date.isoformat()
+        for shift in shifts:
+            if shift not in matched:
+                key = (date_text, shift.start, shift.end, "")
+                self.rejected.add(key)
+                self.observed[key][3] = self.filter_key
+
+    def record_claim(self, date, shift, outcome, click_ms=None, confirm_ms=None):
+        self.claims.append((date.isoformat(), shift.start, shift.end, "", shift.text, time.time(), outcome, click_ms, confirm_ms))
+
+    def flush(self):
+        """Write everything buffered since the last flush in one transaction."""
+        if not (self.observed or self.claims):
+            return
+        evaluated = [(*key, text, seen_at, seen_at, rejected_by) for key, (text, seen_at, was_evaluated, rejected_by) in self.observed.items() if was_evaluated]
+        skipped = [(*key, text, seen_at, seen_at, None) for key, (text, seen_at, was_evaluated, _) in self.observed.items() if not was_evaluated]
+        upsert = (
+            "INSERT INTO shifts (date, start, end, location, text, first_seen, last_seen, rejected_by) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (date, start, end, location) DO UPDATE SET text = excluded.text, last_seen = excluded.last_seen, gone_at = NULL"
+        )
+        with self.connection:
+            self.connection.executemany(upsert + ", rejected_by = excluded.rejected_by", evaluated)
+            self.connection.executemany(upsert, skipped)
+            self.connection.executemany(
+                "UPDATE shifts SET gone_at = ? WHERE date = ? AND gone_at IS NULL AND last_seen < ?",
+                [(scanned_at, date_text, scanned_at) for date_text, scanned_at in self.scanned_dates.items()],
+            )
+            self.connection.executemany(
+                "INSERT INTO claims (date, start, end, location, text, attempted_at, outcome, click_ms, confirm_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self.claims,
+            )
+        self.observed = {}
+        self.scanned_dates = {}
+        self.claims = []
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+# Caches and history Chrome rebuilds on its own. Cookies, Local Storage, IndexedDB and the rest of
+# the login state are left alone. The first list sits in the profile root, the second in each profile
+# inside it (Default, Profile 1, ...).
+PROFILE_ROOT_CACHES = ("ShaderCache", "GrShaderCache", "GraphiteDawnCache")
+PROFILE_CACHES = (
+    "Cache", "Code Cache", "GPUCache", "DawnCache", "DawnGraphiteCache", "DawnWebGPUCache",
+    os.path.join("Service Worker", "CacheStorage"), os.path.join("Service Worker", "ScriptCache"),
+    "History", "History-journal", "Visited Links", "Top Sites", "Top Sites-journal",
+)
+
+def path_size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path) if os.path.isfile(path) else 0
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(directory, name)).st_size
+            except OSError:
+                pass
+    return total
+
+def profile_in_use(path):
+    """Whether a Chrome still has the profile open, going by the lock it keeps there."""
+    if sys.platform == "win32":
+        # Chrome holds "lockfile" open while running, so only a leftover one can be removed
+        lock = os.path.join(path, "lockfile")
+        try:
+            if os.path.exists(lock):
+                os.remove(lock)
+        except OSError:
+            return True
+        return False
+    try:
+        # A symlink to "<hostname>-<pid>"; a crash can leave it behind, so check the process too
+        pid = int(os.readlink(os.path.join(path, "SingletonLock")).rsplit("-", 1)[1])
+        os.kill(pid, 0)
+    except (OSError, IndexError, ValueError):
+        return False
+    return True
+
+def prune_profile(path):
+    """Delete the caches in PROFILE_ROOT_CACHES/PROFILE_CACHES. Returns (profile bytes before, bytes freed)."""
+    before = path_size(path)
+    targets = [os.path.join(path, name) for name in PROFILE_ROOT_CACHES]
+    for entry in os.listdir(path):
+        if entry == "Default" or entry.startswith("Profile "):
+            targets += [os.path.join(path, entry, name) for name in PROFILE_CACHES]
+    freed = 0
+    for target in targets:
+        if not os.path.lexists(target):
+            continue
+        size = path_size(target)
+        try:
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            else:
+                os.remove(target)
+            freed += size
+        except OSError as e:
+            print(f"Could not prune {target}: {e}")
+    return before, freed
+
+def maintain_profile(settings):
+    """Run before launching Chrome: prune the profile's caches so start-up has less to load."""
+    path = CHROME_PROFILE_DIRECTORY_PATH
+    if not (settings["PROFILE_PRUNE"] and path and os.path.isdir(path)):
+        return
+    if profile_in_use(path):
+        print("Chrome has the profile open, skipping profile pruning.")
+        return
+    started = time.monotonic()
+    before, freed = prune_profile(path)
+    print(f"Pruned the Chrome profile from {before / 1024 / 1024:.0f} MB to {(before - freed) / 1024 / 1024:.0f} MB in {time.monotonic() - started:.1f}s.")
+
+def cache_arguments(settings, profile=None):
+    """Chrome flags that cap the disk cache and, with DISK_CACHE_DIR, move it off the profile, e.g. to a tmpfs."""
+    arguments = []
+    if settings["DISK_CACHE_DIR"]:
+        profile = os.path.abspath(profile or CHROME_PROFILE_DIRECTORY_PATH or "")
+        # One directory per profile, so accounts run by orchestrator.py never share a cache
+        name = "atoz-" + hashlib.sha1(profile.encode("utf-8")).hexdigest()[:10]
+        arguments.append(f"--disk-cache-dir={os.path.join(settings['DISK_CACHE_DIR'], name)}")
+    if settings["DISK_CACHE_SIZE_MB"]:
+        arguments.append(f"--disk-cache-size={settings['DISK_CACHE_SIZE_MB'] * 1024 * 1024}")
+    return arguments
+
+def chrome_debugger_info(port, timeout=2):
+    """Health check for a Chrome started with --remote-debugging-port: its /json/version, or None if it isn't answering."""
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=timeout) as response:
+            info = json.load(response)
+        return info if info.get("webSocketDebuggerUrl") else None
+    except (OSError, ValueError):
+        return None
+
+def debug_port_for(settings):
+    """CHROME_DEBUG_PORT, or when that is 0 a port derived from the profile path, so each account's Chrome gets its own."""
+    if settings["CHROME_DEBUG_PORT"]:
+        return settings["CHROME_DEBUG_PORT"]
+    digest = hashlib.sha1(os.path.abspath(CHROME_PROFILE_DIRECTORY_PATH or "").encode("utf-8")).hexdigest()
+    return 9222 + int(digest[:8], 16) % 1000
+
+def profile_debug_port():
+    """The debugging port Chrome last wrote to DevToolsActivePort in the bot's profile, or None."""
+    try:
+        with open(os.path.join(CHROME_PROFILE_DIRECTORY_PATH, "DevToolsActivePort")) as f:
+            return int(f.readline())
+    except (OSError, TypeError, ValueError):
+        return None
+
+def stop_process(process, timeout=10):
+    try:
+        process.terminate()
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+    except OSError:
+        pass
+
+def launch_debug_chrome(port, settings, headless=False, timeout=20):
+    """Start Chrome on the bot's profile with a debugging port, detached so it keeps running after the bot exits.
+
+    Returns (its /json/version, the process), or (None, None) if it never answered; that Chrome is stopped again.
+    """
+    arguments = [
+        uc.find_chrome_executable(),
+        f"--remote-debugging-port={port}",
+        "--remote-debugging-address=127.0.0.1",
+        f"--user-data-dir={CHROME_PROFILE_DIRECTORY_PATH}",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--no-service-autorun",
+        "--password-store=basic",
+    ]
+    if settings["LEAN_MODE"]:
+        arguments += ["--disable-gpu", "--disable-extensions", f"--window-size={settings['LEAN_WINDOW_SIZE']}"]
+    if headless:
+        arguments.append("--headless=new")
+    if settings["SCAN_TABS"] > 1:
+        arguments += ["--disable-background-timer-throttling", "--disable-backgrounding-occluded-windows", "--disable-renderer-backgrounding"]
+    arguments += cache_arguments(settings)
+    arguments.append(LOGIN_URL)
+    try:
+        if sys.platform == "win32":
+            flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            process = subprocess.Popen(arguments, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=flags)
+        else:
+            process = subprocess.Popen(arguments, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    except (OSError, TypeError) as e:
+        print(f"Could not start Chrome: {e}")
+        return None, None
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        info = chrome_debugger_info(port)
+        if info is not None:
+            return info, process
+        time.sleep(0.25)
+    # Left running it would hold the profile that the cold launch is about to use
+    stop_process(process)
+    return None, None
+
+def patched_chromedriver():
+    """uc's patched chromedriver, reusing the copy an earlier run left behind; None lets Selenium find a driver itself."""
+    try:
+        patcher = uc.Patcher(user_multi_procs=True)
+        patcher.auto()
+        return patcher.executable_path
+    except Exception as e:
+        print(f"Could not prepare the patched chromedriver, using Selenium's: {e}")
+        return None
+
+def process_table():
+    """{pid: (parent pid, resident KB)} for every process on the machine, or {} if it can't be listed."""
+    try:
+        if sys.platform == "win32":
+            command = "Get-CimInstance Win32_Process | ForEach-Object { \"$($_.ProcessId) $($_.ParentProcessId) $([int64]($_.WorkingSetSize / 1024))\" }"
+            output = subprocess.run(["powershell", "-NoProfile", "-Command", command], capture_output=True, text=True, timeout=30, creationflags=subprocess.CREATE_NO_WINDOW).stdout
+        else:
+            output = subprocess.run(["ps", "-axo", "pid=,ppid=,rss="], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    table = {}
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) == 3 and all(field.isdigit() for field in fields):
+            table[int(fields[0])] = (int(fields[1]), int(fields[2]))
+    return table
+
+def process_tree_rss_mb(roots):
+    """Resident memory of the given processes and all their descendants, counting each process once."""
+    table = process_table()
+    children = {}
+    for pid, (parent, _) in table.items():
+        children.setdefault(parent, []).append(pid)
+    seen = set()
+    pending = [pid for pid in roots if pid in table]
+    while pending:
+        pid = pending.pop()
+        if pid not in seen:
+            seen.add(pid)
+            pending.extend(children.get(pid, []))
+    return sum(table[pid][1] for pid in seen) / 1024 if seen else None
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[round((len(ordered) - 1) * fraction)]
+
 class Browser:
-    def __init__(self):
+    def __init__(self, settings=None):
+        settings = settings or config.snapshot()
+        use_certifi()
         self.options = ChromeOptions()
         
         if CHROME_PROFILE_DIRECTORY_PATH:
             self.options.add_argument(f"--user-data-dir={CHROME_PROFILE_DIRECTORY_PATH}")
+
+        if settings["NETWORK_CAPTURE"]:
+            self.options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        self.lean = settings["LEAN_MODE"]
+        self.headless = self.lean and settings["LEAN_HEADLESS"]
+        if self.lean:
+            self.options.add_argument("--disable-gpu")
+            self.options.add_argument("--disable-extensions")
+            self.options.add_argument(f"--window-size={settings['LEAN_WINDOW_SIZE']}")
+
+        if settings["SCAN_TABS"] > 1:
+            # Background tabs would otherwise have their timers and rendering throttled while they load rows
+            self.options.add_argument("--disable-background-timer-throttling")
+            self.options.add_argument("--disable-backgrounding-occluded-windows")
+            self.options.add_argument("--disable-renderer-backgrounding")
+        for argument in cache_arguments(settings):
+            self.options.add_argument(argument)
             
-        self.driver = uc.Chrome(options=self.options)
-        self.driver.get(LOGIN_URL)
-        self.wait = WebDriverWait(self.driver, 10)
+        self.attached = False
+        started = time.monotonic()
+        self.driver = self.attach(settings) if settings["ATTACH_CHROME"] else None
+        if self.driver is None:
+            # uc applies --headless=new itself and scrubs "HeadlessChrome" from the user agent
+            self.driver = uc.Chrome(options=self.options, headless=self.headless)
+        self.launch_time = time.monotonic() - started
+        print(f"Chrome {'attached' if self.attached else 'started'} in {self.launch_time:.2f}s.")
+        metrics.observe("chrome_launch", self.launch_time)
+        self.round_trips = 0
+        self.count_round_trips()
+        self.network_source = None
+        if settings["NETWORK_CAPTURE"]:
+            try:
+                self.network_source = NetworkShiftSource(self.driver, settings["NETWORK_SHIFT_URL_PATTERN"])
+            except Exception as e:
+                print(f"Network capture unavailable, scraping the DOM only: {e}")
+        self.bulk_extraction = BULK_EXTRACTION
+        self.store = None
+        if settings["SHIFT_STORE"]:
+            try:
+                self.store = ShiftStore(SHIFT_STORE_FILE)
+            except sqlite3.Error as e:
+                print(f"Shift history disabled, could not open {SHIFT_STORE_FILE}: {e}")
+        self.nav_state = NAV_UNKNOWN
+        self.resident_sweeps = 0
+        self.navigation_time = 0.0
+        self.scan_time = 0.0
+        self.current_day = None
+        self.current_date = None
+        self.claimed = set()
+        self.sweeps = 0
+        self.sweep_seconds = 0.0
+        self.day_fingerprints = {}
+        self.pending_fingerprints = {}
+        self.fingerprint_filter = None
+        self.incremental_sweeps = 0
+        self.day_costs = {}
+        self.skipped_days = 0
+        self.time_saved = 0.0
+        self.seen_matches = set()
+        self.new_matches = []
+        self.claim_attempts = []
+        self.reported_attempts = 0
+        self.waits = []
+        self.main_tab = None
+        self.extra_tabs = []
+        self.find_shifts_url = None
+        self.blocked_url_patterns = settings["BLOCKED_URL_PATTERNS"] if self.lean else ()
+        self.block_urls()
+        if not (self.attached and self.reuse_atoz_tab()):
+            self.driver.get(LOGIN_URL)
+        self.wait = MeteredWait(self.driver, 10)
+
+    def attach(self, settings):
+        """Connect to the long-lived Chrome for the bot's profile, starting it if allowed. None means cold-launch instead."""
+        port = debug_port_for(settings)
+        started = time.monotonic()
+        info = chrome_debugger_info(port)
+        spawned = None
+        if info is not None and profile_debug_port() != port:
+            # Chrome writes its port into the profile it runs on; a mismatch means another profile's Chrome,
+            # e.g. a different account's under orchestrator.py
+            print(f"The Chrome on port {port} is not running on {CHROME_PROFILE_DIRECTORY_PATH}. Cold-launching instead.")
+            return None
+        if info is None and settings["ATTACH_LAUNCH"]:
+            print(f"No Chrome is listening on port {port}. Starting one that will outlive the bot...")
+            info, spawned = launch_debug_chrome(port, settings, self.headless)
+        if info is None:
+            print(f"Chrome on port {port} is not answering. Cold-launching instead.")
+            return None
+
+        options = ChromeOptions()
+        options.debugger_address = f"127.0.0.1:{port}"
+        if settings["NETWORK_CAPTURE"]:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        try:
+            driver = webdriver.Chrome(service=ChromeService(patched_chromedriver()), options=options)
+        except Exception as e:
+            if spawned is None:
+                # That Chrome has the profile open, so a cold launch on it would fail too
+                raise RuntimeError(f"Could not attach to the Chrome on port {port}, which has the bot's profile open: {e}. Close it and start again.")
+            print(f"Could not attach to Chrome on port {port}: {e}. Closing it and cold-launching instead.")
+            stop_process(spawned)
+            return None
+        self.attached = True
+        print(f"Attached to {info.get('Browser', 'Chrome')} on port {port} in {time.monotonic() - started:.1f}s.")
+        return driver
+
+    def reuse_atoz_tab(self):
+        """Switch to a tab the attached Chrome already has open on A to Z. False if there is none."""
+        try:
+            for handle in self.driver.window_handles:
+                self.driver.switch_to.window(handle)
+                # Both the login pages (atoz-login.) and the app itself live under amazon.work
+                if "amazon.work" in self.driver.current_url:
+                    print(f"Reusing the open A to Z tab at {self.driver.current_url}.")
+                    return True
+        except Exception as e:
+            print(f"Could not look through the attached Chrome's tabs: {e}")
+        return False
+
+    def count_round_trips(self):
+        """Count every command sent to chromedriver, including the ones issued through WebElements."""
+        execute = self.driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.round_trips += 1
+            if not metrics.enabled:
+                return execute(driver_command, params)
+            metrics.count("webdriver_calls_total", command=driver_command)
+            response = execute(driver_command, params)
+            if driver_command in FIND_COMMANDS and response:
+                value = response.get("value")
+                metrics.count("elements_located_total", len(value) if isinstance(value, list) else 1)
+            return response
+
+        self.driver.execute = counting_execute
         
+    def block_urls(self):
+        """Stop the current tab fetching images, fonts and telemetry the bot never reads."""
+        if not self.blocked_url_patterns:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(self.blocked_url_patterns)})
+        except Exception as e:
+            print(f"Could not set blocked URLs: {e}")
+
+    def report_page_stats(self):
+        try:
+            stats = self.driver.execute_script(PAGE_STATS_SCRIPT)
+        except Exception:
+            return
+        if not stats:
+            return
+        mode = "lean" if self.lean else "full"
+        line = f"Page stats ({mode}): {stats['bytes'] / 1024:.1f} KB over {stats['requests']} requests since last report"
+        if stats["new_document"] and stats["load_ms"] is not None:
+            line += f", page load {stats['load_ms'] / 1000:.2f}s (DOM ready {stats['dom_ms'] / 1000:.2f}s)"
+        print(f"{line}.")
+
     def wait_and_click(self, element):
-        WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(element))
-        time.sleep(random.uniform(0.3, 0.7))
+        MeteredWait(self.driver, 10).until(EC.element_to_be_clickable(element))
+        self.wait_until_still(element)
+        time.sleep(random.uniform(*config.snapshot()["CLICK_PAUSE_SECONDS"]))
         element.click()
 
+    def wait_until_still(self, element):
+        settings = config.snapshot()
+        self.driver.set_script_timeout(settings["RENDER_TIMEOUT"] + 5)
+        result = self.driver.execute_async_script(WAIT_UNTIL_STILL_SCRIPT, element, settings["WAIT_POLL_MS"], int(settings["RENDER_TIMEOUT"] * 1000))
+        self.record_wait("still", result)
+
+    @metered("render_wait")
+    def wait_for_render(self):
+        """Wait for the shift list to finish re-rendering after a day click instead of sleeping a fixed time."""
+        settings = config.snapshot()
+        self.driver.set_script_timeout(settings["RENDER_TIMEOUT"] + 5)
+        result = self.driver.execute_async_script(
+            WAIT_FOR_RENDER_SCRIPT,
+            SHIFT_ROWS_XPATH,
+            settings["WAIT_POLL_MS"],
+            settings["RENDER_SETTLE_MS"],
+            settings["RENDER_QUIET_MS"],
+            int(settings["RENDER_TIMEOUT"] * 1000),
+        )
+        self.record_wait("render", result)
+        return result
+
+    def record_wait(self, kind, result):
+        if result:
+            self.waits.append((kind, result["elapsed"] / 1000, result["reason"]))
+            if result["reason"] == "timeout":
+                metrics.count("timeouts_total", wait=kind)
+
+    def report_waits(self):
+        if not self.waits:
+            return
+        total = sum(seconds for _, seconds, _ in self.waits)
+        line = f"Waited {total:.2f}s over {len(self.waits)} condition waits"
+        renders = [seconds * 1000 for kind, seconds, _ in self.waits if kind == "render"]
+        if renders:
+            line += f"; render p50 {percentile(renders, 0.5):.0f} ms, p90 {percentile(renders, 0.9):.0f} ms, max {max(renders):.0f} ms"
+        timeouts = sum(1 for _, _, reason in self.waits if reason == "timeout")
+        if timeouts:
+            line += f"; {timeouts} timed out"
+        print(f"{line}.")
+
     def delay_typing(self, element, text):
         for char in text:
             element.send_keys(char)
@@ -156,53 +1673,71 @@ class Browser:
 
     def is_logged_in(self):
         try:
-            WebDriverWait(self.driver, 5).until(
+            MeteredWait(self.driver, 5).until(
                 EC.presence_of_element_located((By.XPATH, HOMEPAGE_IDENTIFIER))
             )
             return True 
         except Exception as error:
             return False
 
-    def login(self):
-        print("Checking for existing session...")
-
-        if self.is_logged_in():
-            print("Already logged in! Skipping login sequence.")
-            return  
-
-        print("Session not found. Attempting login...")
-
+    def enter_login(self, login_name):
+        """Type the login into the first and, if it shows up, the secondary login form. True once the homepage shows."""
         try:
             uname = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//*[@id='associate-login-input']"))
             )
-            self.delay_typing(uname, Amazon_Login)
+            self.delay_typing(uname, login_name)
 
             login_button = self.driver.find_element(By.XPATH, "//*[@id='login-form-login-btn']")
             self.wait_and_click(login_button)
             
             try:
-                short_wait = WebDriverWait(self.driver, 5) 
+                short_wait = MeteredWait(self.driver, 5) 
                 short_wait.until(EC.presence_of_element_located((By.XPATH, HOMEPAGE_IDENTIFIER)))
                 print("Login successful after first step! bypassing secondary steps.")
-                return 
+                return True
             except:
                 print("Homepage not detected immediately. Proceeding to secondary login...")
 
         except Exception as error:
             print(f"Error during Step 1 | {error}")
+            events.emit("error", where="login", message=str(error))
 
         try:
             uname2 = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//*[@id='input-id-4']"))
             )
-            self.delay_typing(uname2, Amazon_Login)
+            self.delay_typing(uname2, login_name)
 
             login_button2 = self.driver.find_element(By.XPATH, "//*[@id='root']/div[1]/div[2]/div/div[2]/div/button")
             self.wait_and_click(login_button2)
 
         except Exception as error:
-            pass 
+            pass
+        return False
+
+    @metered("login")
+    def login(self):
+        print("Checking for existing session...")
+
+        if self.attached and self.detect_nav_state() in (NAV_HOME, NAV_FIND_SHIFTS):
+            print("Attached tab is already signed in. Skipping login sequence.")
+            return
+
+        if self.is_logged_in():
+            print("Already logged in! Skipping login sequence.")
+            return  
+
+        print("Session not found. Attempting login...")
+        if self.headless:
+            print("Running headless: the passkey prompt can't be completed. Log in once with LEAN_HEADLESS off.")
+
+        # Read now rather than at load, so a login edited in the GUI applies to the next Start
+        login_name = config.snapshot()["Amazon_Login"]
+        if not login_name:
+            print("Amazon_Login is not set in config.json. Please sign in by hand in the browser window.")
+        elif self.enter_login(login_name):
+            return
 
         try:
             passkey_element = self.wait.until(
@@ -218,14 +1753,14 @@ class Browser:
 
         print(f"Waiting for homepage element: {HOMEPAGE_IDENTIFIER}")
         try:
-            WebDriverWait(self.driver, 60).until(
+            MeteredWait(self.driver, 60).until(
                 EC.presence_of_element_located((By.XPATH, HOMEPAGE_IDENTIFIER))
             )
             print("Login Successful! Homepage detected. Resuming script...")
 
         except TimeoutException: 
             print("Timed out waiting for login. Exiting.")
-            self.driver.quit()
+            self.exit()
             exit()
     
     def save_cookies(self):
@@ -233,9 +1768,91 @@ class Browser:
         json.dump(cookies, open("cookies", "wt", encoding="utf8"))
 
     def exit(self):
-        self.driver.quit()
+        if self.store is not None:
+            self.store.close()
+        if self.attached:
+            self.detach()
+        else:
+            self.driver.quit()
+
+    def detach(self):
+        """Stop chromedriver but leave the attached Chrome, and its signed-in tab, running for the next start."""
+        try:
+            for handle in self.extra_tabs:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            if self.extra_tabs:
+                self.driver.switch_to.window(self.main_tab)
+        except Exception as e:
+            print(f"Could not close the extra scanning tabs: {e}")
+        self.extra_tabs = []
+        self.driver.service.stop()
+        print("Detached from Chrome; it stays open for the next run.")
+
+    def kill(self):
+        """Hard-stop a dead or hung session: kill chromedriver, and the Chrome it launched unless attached.
+
+        Safe to call from another thread; a WebDriver call blocked on the session fails once chromedriver is gone.
+        """
+        service = getattr(self.driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is not None:
+            try:
+                process.kill()
+            except OSError:
+                pass
+        browser_pid = getattr(self.driver, "browser_pid", None)
+        if browser_pid and not self.attached:
+            try:
+                os.kill(browser_pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+    def sample_memory(self):
+        """JS heap of the scanning tab and resident memory of chromedriver plus Chrome, in MB; None where unavailable."""
+        try:
+            heap = self.driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : null;")
+        except Exception as e:
+            if driver_is_gone(e):
+                raise
+            heap = None
+        roots = []
+        process = getattr(getattr(self.driver, "service", None), "process", None)
+        if process is not None:
+            roots.append(process.pid)
+        if getattr(self.driver, "browser_pid", None):
+            roots.append(self.driver.browser_pid)
+        try:
+            # Also finds an attached Chrome's processes, which aren't chromedriver's children
+            info = self.driver.execute_cdp_cmd("SystemInfo.getProcessInfo", {})
+            roots += [entry["id"] for entry in info.get("processInfo", [])]
+        except Exception:
+            pass
+        return {"heap_mb": heap / 1024 / 1024 if heap else None, "rss_mb": process_tree_rss_mb(roots)}
+
+    def recycle_tab(self):
+        """Replace the scanning tabs with one fresh tab, freeing the old renderer and its heap; cookies keep the login."""
+        old_tabs = [self.main_tab or self.driver.current_window_handle] + self.extra_tabs
+        self.driver.switch_to.new_window("tab")
+        fresh_tab = self.driver.current_window_handle
+        for handle in old_tabs:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(fresh_tab)
+        self.main_tab = None
+        self.extra_tabs = []
+        self.find_shifts_url = None
+        self.nav_state = NAV_UNKNOWN
+        self.current_day = None
+        self.current_date = None
+        self.resident_sweeps = 0
+        self.block_urls()
+        self.driver.get(LOGIN_URL)
+        self.login()
 
+    @metered("back_home")
     def back_home(self):
+        started = time.monotonic()
         try:
             menu_burger = self.wait.until(
                 EC.presence_of_element_located((By.XPATH, MENU_BURGER))
@@ -246,188 +1863,903 @@ class Browser:
             home_nav_button = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//*[@id='side-nav-item-top-level-home_nav_item_0']"))
             )
-            time.sleep(0.5)
+            self.wait_until_still(home_nav_button)
             home_nav_button.click()
+            self.nav_state = NAV_HOME
         except Exception as e:
+            if driver_is_gone(e):
+                raise
+            self.nav_state = NAV_UNKNOWN
             print(f"Error returning home: {e}")
+            events.emit("error", where="back_home", message=str(e))
+        self.navigation_time += time.monotonic() - started
 
-    def find_shifts(self):
+    def detect_nav_state(self):
+        try:
+            self.nav_state = self.driver.execute_script(NAV_STATE_SCRIPT, SUCCESS_DONE_BUTTON, f"{DAY_SLIDER_XPATH}[1]", HOMEPAGE_IDENTIFIER)
+        except Exception:
+            self.nav_state = NAV_UNKNOWN
+        return self.nav_state
+
+    @metered("navigate")
+    def navigate_to_find_shifts(self):
         print("Attempting to navigate to shifts...")
         
         try:
-            burger_menu = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//*[@id='atoz-global-nav-header']/div/div/header/div/div/nav/ul/li[1]/button"))) 
+            burger_menu = self.wait.until(EC.element_to_be_clickable((By.XPATH, MENU_BURGER))) 
             burger_menu.click()
 
-            schedule_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "/html/body/div[3]/div[2]/div/div[2]/div/nav/div[2]/div/ul/li[2]/button")))
+            schedule_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, SCHEDULE_NAV_BUTTON)))
             schedule_button.click()
 
-            find_shifts_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "/html/body/div[3]/div[2]/div/div[2]/div/nav/div[2]/div/ul/li[2]/div/ul/li[4]/div/a"))) 
+            find_shifts_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, FIND_SHIFTS_NAV_LINK))) 
             find_shifts_button.click()
+            self.nav_state = NAV_FIND_SHIFTS
+            self.current_day = None
+            self.find_shifts_url = None
             print("Navigated to Find Shifts.")
+            return True
 
         except Exception as e:
+            if driver_is_gone(e):
+                raise
+            self.nav_state = NAV_UNKNOWN
             print(f"Navigation failed: {e}")
-            return 
-        
-        print(f"Checking schedule from {START_DATE} to {END_DATE}...")
+            return False
 
-        start_dt = get_date_object(START_DATE)
-        end_dt = get_date_object(END_DATE)
+    def open_find_shifts(self, settings):
+        """Get onto Find Shifts, staying put in resident mode unless the bot has been bounced off the page."""
+        if not stays_on_find_shifts(settings):
+            return self.navigate_to_find_shifts()
 
-        if not start_dt or not end_dt:
-            print("ERROR: START_DATE or END_DATE is invalid or empty. Please check config.")
+        state = self.detect_nav_state()
+        if state == NAV_MODAL:
+            try:
+                self.driver.find_element(By.XPATH, SUCCESS_DONE_BUTTON).click()
+            except Exception:
+                pass
+            state = self.detect_nav_state()
+
+        if state != NAV_FIND_SHIFTS:
+            print(f"Not on Find Shifts (page looks like: {state}). Navigating there.")
+            self.resident_sweeps = 0
+            return self.navigate_to_find_shifts()
+
+        self.resident_sweeps += 1
+        if settings["RESIDENT_RELOAD_EVERY"] and self.resident_sweeps % settings["RESIDENT_RELOAD_EVERY"] == 0:
+            # An occasional in-place reload keeps the SPA from serving a stale slider forever
+            self.driver.refresh()
+            self.current_day = None
+            try:
+                self.wait.until(EC.presence_of_element_located((By.XPATH, f"{DAY_SLIDER_XPATH}[1]")))
+            except TimeoutException:
+                print("Reload left Find Shifts. Navigating there.")
+                return self.navigate_to_find_shifts()
+            print("Reloaded Find Shifts in place.")
+        return True
+
+    def snapshot_page(self, include_days=True, include_shifts=True):
+        """Read the day slider and the visible shift rows in a single execute_script call."""
+        return self.driver.execute_script(
+            SNAPSHOT_SCRIPT,
+            DAY_SLIDER_XPATH if include_days else None,
+            SHIFT_ROWS_XPATH if include_shifts else None,
+            SHIFT_TIME_XPATH,
+            SHIFT_BUTTON_XPATH,
+        )
+
+    def read_day_map(self):
+        """Read the whole day slider once into {index: (date, weekday text)}."""
+        self.wait.until(EC.presence_of_element_located((By.XPATH, f"{DAY_SLIDER_XPATH}[1]")))
+        days = self.snapshot_page(include_shifts=False)["days"]
+        return {day["index"]: (get_date_object(day["date"]), day["weekday"]) for day in days}
+
+    def plan_days(self, day_map, start_dt, end_dt, shift_filter):
+        """Pick the slider indices whose date is in the search window and whose weekday is allowed."""
+        planned = []
+        for i, (current_dt, full_day_text) in day_map.items():
+            if current_dt is None:
+                print(f"Could not parse the date for Day {i} ({full_day_text}). Skipping.")
+                continue
+            if start_dt <= current_dt <= end_dt and shift_filter.windows_for(full_day_text):
+                planned.append(i)
+        return planned
+
+    def read_shifts(self):
+        if self.bulk_extraction:
+            return self.snapshot_page(include_days=False)["shifts"]
+
+        shifts = []
+        shift_rows = self.driver.find_elements(By.XPATH, SHIFT_ROWS_XPATH)
+        for j, row in enumerate(shift_rows, start=1):
+            try:
+                time_text = row.find_element(By.XPATH, f"{SHIFT_ROWS_XPATH}[{j}]{SHIFT_TIME_XPATH}").text
+            except Exception:
+                continue
+            shifts.append({"index": j, "time": time_text, "button_label": None, "button_text": None})
+        return shifts
+
+    @metered("claim")
+    def claim_shift(self, shift, detected_at=None):
+        # Every claim, from any tab, goes through here; the claimed set stops a confirmed shift being submitted again
+        claim_key = (self.current_date, shift.text)
+        if claim_key in self.claimed:
+            print("    Already claimed this shift. Skipping.")
+            return
+        if config.snapshot()["FAST_CLAIM"]:
+            self.fast_claim(shift, claim_key, detected_at or time.monotonic())
             return
+        button_xpath = f"{SHIFT_ROWS_XPATH}[{shift.index}]{SHIFT_BUTTON_XPATH}"
+        # Bulk snapshots already carry the button state, so only the click touches the element
+        add_button = None
+        button_label, button_text = shift.button_label, shift.button_text
+        if button_label is None:
+            add_button = self.driver.find_element(By.XPATH, button_xpath)
+            button_label, button_text = add_button.get_attribute("aria-label") or "", add_button.text
 
-        for i in range(1, 60):
-            current_config = load_config()
-            current_weekdays = current_config.get("WEEKDAYS", [])
-            current_longest_shift = current_config.get("LONGEST_SHIFT", 10)
-            current_earliest_time = current_config.get("EARLIEST_TIME", "18:15")
-            current_latest_time = current_config.get("LATEST_TIME", "18:30")
+        if "Add" in button_label or "Add" in button_text:
+            if add_button is None:
+                add_button = self.driver.find_element(By.XPATH, button_xpath)
+            self.wait_and_click(add_button)
+            try:
+                done_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, SUCCESS_DONE_BUTTON)))
+                done_button.click()
+                self.claimed.add(claim_key)
+                self.record_claim(shift, "confirmed")
+                print("    Shift Added Successfully!")
+            except:
+                self.record_claim(shift, "timeout")
 
-            day_container_xpath = f"//*[@id='atoz-app-root']/div[1]/div/div[2]/div/div[{i}]"
-            day_name_xpath = f"{day_container_xpath}/div/div[1]"
-            day_date_xpath = f"{day_container_xpath}/div/div[2]"
-            
+    def record_claim(self, shift, outcome, click_ms=None, confirm_ms=None):
+        metrics.count("claims_total", outcome=outcome)
+        events.emit("claim", date=self.current_date, shift=shift.text, outcome=outcome, click_ms=click_ms, confirm_ms=confirm_ms)
+        if self.store is not None and self.current_date is not None:
+            self.store.record_claim(self.current_date, shift, outcome, click_ms, confirm_ms)
+
+    def fast_claim(self, shift, claim_key, detected_at):
+        """Claim with no pacing: one script call to click, one async script call to confirm and dismiss the modal."""
+        if shift.button_label is not None and "Add" not in shift.button_label and "Add" not in (shift.button_text or ""):
+            return
+
+        button_xpath = f"{SHIFT_ROWS_XPATH}[{shift.index}]{SHIFT_BUTTON_XPATH}"
+        attempt = {"date": self.current_date, "shift": shift.text, "detected": detected_at, "clicked": None, "confirmed": None}
+        self.claim_attempts.append(attempt)
+
+        attempt["outcome"] = self.driver.execute_script(CLAIM_SCRIPT, button_xpath)
+        if attempt["outcome"] != "clicked":
+            self.record_claim(shift, attempt["outcome"])
+            print(f"    Add button {attempt['outcome']}; not claimed.")
+            return
+        attempt["clicked"] = time.monotonic()
+
+        timeout = config.snapshot()["CLAIM_CONFIRM_TIMEOUT"]
+        self.driver.set_script_timeout(timeout + 5)
+        attempt["outcome"] = self.driver.execute_async_script(CONFIRM_CLAIM_SCRIPT, button_xpath, SUCCESS_DONE_BUTTON, int(timeout * 1000))
+        click_ms = (attempt["clicked"] - detected_at) * 1000
+        if attempt["outcome"] == "timeout":
+            metrics.count("timeouts_total", wait="claim_confirm")
+            self.record_claim(shift, "timeout", click_ms)
+            print(f"    No confirmation within {timeout:g}s; the claim may not have gone through.")
+            return
+
+        if attempt["outcome"] != "confirmed":
+            # Not marked claimed: if the row still offers Add at the next sweep, it is tried again
+            self.record_claim(shift, attempt["outcome"], click_ms)
+            print("    Add button changed but no success modal appeared; will check the shift again next sweep.")
+            return
+
+        attempt["confirmed"] = time.monotonic()
+        self.claimed.add(claim_key)
+        confirm_ms = (attempt["confirmed"] - detected_at) * 1000
+        self.record_claim(shift, attempt["outcome"], click_ms, confirm_ms)
+        print(f"    Shift Added Successfully! (click {click_ms:.0f} ms, confirmed {confirm_ms:.0f} ms after detection)")
+
+    def report_claim_latency(self):
+        if len(self.claim_attempts) == self.reported_attempts:
+            return
+        self.reported_attempts = len(self.claim_attempts)
+        clicked = [(a["clicked"] - a["detected"]) * 1000 for a in self.claim_attempts if a["clicked"] is not None]
+        confirmed = [(a["confirmed"] - a["detected"]) * 1000 for a in self.claim_attempts if a["confirmed"] is not None]
+        line = f"Claim latency over {len(self.claim_attempts)} attempts ({len(confirmed)} confirmed)"
+        for label, values in (("detect->click", clicked), ("detect->confirm", confirmed)):
+            if values:
+                line += f"; {label} p50 {percentile(values, 0.5):.0f} ms, p90 {percentile(values, 0.9):.0f} ms, p99 {percentile(values, 0.99):.0f} ms"
+        print(f"{line}.")
+
+    def evaluate_shifts(self, full_day_text, shifts, shift_filter, complete=True):
+        detected_at = time.monotonic()
+        store = self.store if self.current_date is not None else None
+        if store is not None:
+            store.use_filter(shift_filter)
+            shifts = store.triage(self.current_date, shifts, complete)
+        matched = shift_filter.matches(full_day_text, shifts)
+        metrics.count("rows_evaluated_total", len(shifts))
+        metrics.count("matches_total", len(matched))
+        if store is not None:
+            store.reject(self.current_date, shifts, matched)
+        for shift in matched:
+            print(f"    MATCH! Found {shift.duration / 60:.3g}hr shift: {shift.text}")
+            events.emit("shift_matched", date=self.current_date, weekday=full_day_text, shift=shift.text, hours=shift.duration / 60)
+            match_key = (self.current_date, shift.text)
+            if match_key not in self.seen_matches:
+                self.seen_matches.add(match_key)
+                self.new_matches.append(match_key)
             try:
-                day_date_element = self.wait.until(EC.presence_of_element_located((By.XPATH, day_date_xpath)))
-                date_text = day_date_element.text.strip().replace("\n", " ") 
-                
-                current_dt = get_date_object(date_text)
-                
-                if current_dt is None:
-                    print(f"Could not parse date '{date_text}' for Day {i}. Skipping.")
-                    continue
+                self.claim_shift(shift, detected_at)
+            except Exception as e:
+                if driver_is_gone(e):
+                    raise
+                continue
+        return matched
 
-                if current_dt > end_dt:
-                    print(f"--- Reached {date_text}. This is after {END_DATE}. Stopping check. ---")
-                    break 
-                
-                if current_dt < start_dt:
-                    print(f"Day {i} ({date_text}) is before {START_DATE}. Skipping.")
-                    continue 
-                
-                day_name_element = self.driver.find_element(By.XPATH, day_name_xpath)
-                full_day_text = day_name_element.text.strip()
-                
-                is_allowed_weekday = False
-                for allowed_day in current_weekdays:
-                    if allowed_day in full_day_text:
-                        is_allowed_weekday = True
-                        break
-                
-                if not is_allowed_weekday:
-                    print(f"--- Day {i} ({full_day_text}, {date_text}) is excluded by Weekday filter. Skipping. ---")
+    def wait_for_shift_changes(self, timeout):
+        """Block in the browser until the observer queues a change, returning the changes ([] on timeout)."""
+        self.driver.set_script_timeout(timeout + 5)
+        return self.driver.execute_async_script(WAIT_FOR_CHANGES_SCRIPT, int(timeout * 1000))
+
+    def watch_shifts(self, until):
+        """Evaluate changed rows on the displayed day as they appear, until the next full sweep is due at `until`.
+
+        Returns False if an error ended the watching early (it still waits out `until`), True otherwise.
+        """
+        if self.current_day is None:
+            stop_requested.wait(max(0, until - time.time()))
+            return True
+
+        print(f"Watching {self.current_day} for shift changes until the next full sweep...")
+        while not stop_requested.is_set():
+            remaining = until - time.time()
+            if remaining <= 0:
+                return True
+            try:
+                changes = self.wait_for_shift_changes(min(remaining, 5))
+                if changes is None:
+                    self.driver.execute_script(INSTALL_OBSERVER_SCRIPT, SHIFT_LIST_XPATH)
+                    continue
+                if not changes:
                     continue
 
+                settings = config.snapshot()
+                shift_filter = config.shift_filter(settings)
+                rows = self.read_shifts()
+                complete = any(change["kind"] == "list" for change in changes)
+                if not complete:
+                    changed = {change["index"] for change in changes}
+                    rows = [row for row in rows if row["index"] in changed]
+                print(f"  Change detected on {self.current_day}: re-evaluating {len(rows)} rows.")
+                self.evaluate_shifts(self.current_day, [Shift.from_row(row) for row in rows], shift_filter, complete=complete)
+                if self.store is not None:
+                    self.store.flush()
+            except Exception as e:
+                if driver_is_gone(e):
+                    raise
+                print(f"Stopped watching for shift changes: {e}")
+                events.emit("error", where="watch_shifts", message=str(e))
+                stop_requested.wait(max(0, until - time.time()))
+                return False
+        return True
+
+    @metered("sweep")
+    def find_shifts(self):
+        """Run one sweep and return the matches that had not been seen in earlier sweeps."""
+        trips_before = self.round_trips
+        self.navigation_time = 0.0
+        self.scan_time = 0.0
+        self.waits = []
+        self.new_matches = []
+        self.skipped_days = 0
+        self.time_saved = 0.0
+        self.sweeps += 1
+        started = time.monotonic()
+        events.emit("sweep_start", sweep=self.sweeps)
+        try:
+            self.scan_shifts()
+            return self.new_matches
+        finally:
+            events.emit(
+                "sweep_end",
+                sweep=self.sweeps,
+                duration=time.monotonic() - started,
+                navigation=self.navigation_time,
+                scanning=self.scan_time,
+                round_trips=self.round_trips - trips_before,
+                new_matches=len(self.new_matches),
+                skipped_days=self.skipped_days,
+            )
+            self.sweep_seconds = time.monotonic() - started
+            mode = "bulk" if self.bulk_extraction else "per-element"
+            print(f"Sweep used {self.round_trips - trips_before} WebDriver round trips ({mode} extraction).")
+            self.report_page_stats()
+            self.report_claim_latency()
+            if self.skipped_days:
+                print(f"Incremental sweep skipped {self.skipped_days} unchanged days, saving about {self.time_saved:.2f}s.")
+            if self.store is not None:
+                if self.store.skipped:
+                    print(f"Skipped {self.store.skipped} rows the current filter already rejected.")
+                    self.store.skipped = 0
+                self.store.flush()
+
+    def scan_shifts(self):
+        # One snapshot per sweep, so a config edit never applies halfway through the slider
+        settings = config.snapshot()
+        shift_filter = config.shift_filter(settings)
+        self.bulk_extraction = settings["BULK_EXTRACTION"]
+
+        if self.network_source is not None:
+            self.network_source.begin_sweep()
+
+        started = time.monotonic()
+        on_page = self.open_find_shifts(settings)
+        self.navigation_time += time.monotonic() - started
+        if not on_page:
+            return
+
+        started = time.monotonic()
+        try:
+            self.scan_days(shift_filter)
+        finally:
+            self.scan_time += time.monotonic() - started
+
+    def scan_days(self, shift_filter):
+        start_date, end_date = search_window()
+        print(f"Checking schedule from {start_date} to {end_date}...")
+
+        start_dt = get_date_object(start_date)
+        end_dt = get_date_object(end_date)
+
+        if not start_dt or not end_dt:
+            print("ERROR: The search window dates are invalid. Please check config.")
+            return
+
+        try:
+            day_map = self.read_day_map()
+        except Exception as e:
+            if driver_is_gone(e):
+                raise
+            print(f"Could not read the schedule slider: {e}")
+            events.emit("error", where="read_day_map", message=str(e))
+            return
+
+        planned = self.plan_days(day_map, start_dt, end_dt, shift_filter)
+        print(f"Slider has {len(day_map)} days; {len(planned)} match the date window and weekday filter.")
+
+        network = self.network_source
+        if network is not None:
+            network.poll()
+            if network.shifts_by_date:
+                print(f"Network data: {sum(len(day) for day in network.shifts_by_date.values())} shifts over {len(network.shifts_by_date)} dates from {network.payloads} payloads.")
+            else:
+                print("No shift payload captured this sweep; scanning the DOM.")
+
+        if network is not None and network.shifts_by_date:
+            planned = [i for i in planned if self.has_network_match(day_map, i, shift_filter)]
+
+        settings = config.snapshot()
+        if shift_filter.fingerprint() != self.fingerprint_filter:
+            # Rows that were rejected before may match a new filter
+            self.fingerprint_filter = shift_filter.fingerprint()
+            self.day_fingerprints = {}
+        full_pass = not settings["INCREMENTAL_SWEEP"] or self.incremental_sweeps % settings["FULL_SWEEP_EVERY"] == 0
+        self.incremental_sweeps += 1
+        self.pending_fingerprints = {}
+        if settings["INCREMENTAL_SWEEP"] and not full_pass and network is not None and network.shifts_by_date:
+            planned = [i for i in planned if not self.network_day_unchanged(day_map, i)]
+
+        tab_count = settings["SCAN_TABS"]
+        if tab_count > 1 and len(planned) > 1:
+            self.scan_days_in_tabs(day_map, planned, shift_filter, tab_count, full_pass)
+            return
+
+        try:
+            for i in planned:
+                if stop_requested.is_set():
+                    break
+                current_dt, full_day_text = day_map[i]
+                date_text = current_dt.strftime("%b %d")
+
                 print(f"--- Checking Day {i}: {full_day_text}, {date_text} ---")
                 
-                day_button = self.driver.find_element(By.XPATH, day_container_xpath)
+                visit_started = time.monotonic()
+                day_button = self.driver.find_element(By.XPATH, f"{DAY_SLIDER_XPATH}[{i}]")
                 day_button.click()
-                time.sleep(2) 
+                self.current_day, self.current_date = full_day_text, current_dt.date()
+                render = self.wait_for_render()
+                self.track_cost("visit", time.monotonic() - visit_started)
 
-                shift_container_xpath = "//*[@id='atoz-app-root']/div[1]/div/div[3]/div[1]/div/div[3]/div[2]/div"
-                shift_rows = self.driver.find_elements(By.XPATH, shift_container_xpath)
-                
-                if len(shift_rows) == 0:
-                    print("  No shifts found.")
-
-                for j, row in enumerate(shift_rows, start=1):
-                    try:
-                        time_xpath = f"//*[@id='atoz-app-root']/div[1]/div/div[3]/div[1]/div/div[3]/div[2]/div[{j}]/div/div[1]/div[1]/div[1]/div[1]/div/strong"
-                        button_xpath = f"//*[@id='atoz-app-root']/div[1]/div/div[3]/div[1]/div/div[3]/div[2]/div[{j}]/div/div[2]/div/button"
-
-                        time_element = row.find_element(By.XPATH, time_xpath)
-                        time_text = time_element.text 
-                        
-                        if "-" in time_text:
-                            start_str, end_str = time_text.split("-")
-                            start_parsed = parse_hour(start_str.strip())
-                            
-                            if parse_hour(current_earliest_time) <= start_parsed <= parse_hour(current_latest_time):
-                                end_parsed = parse_hour(end_str.strip())
-                                duration = time_diff(end_parsed, start_parsed)
-                                
-                                if duration <= current_longest_shift:
-                                    print(f"    MATCH! Found {duration}hr shift: {time_text}")
-                                    add_button = row.find_element(By.XPATH, button_xpath)
-                                    
-                                    if "Add" in add_button.get_attribute("aria-label") or "Add" in add_button.text:
-                                        self.wait_and_click(add_button)
-                                        try:
-                                            done_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@data-test-id='AddOpportunityModalSuccessDoneButton']")))
-                                            done_button.click()
-                                            print("    Shift Added Successfully!")
-                                        except:
-                                            pass
-                    except:
-                        continue
+                self.read_and_evaluate_day(full_day_text, shift_filter, render, full_pass)
 
-            except Exception as e:
-                print(f"End of schedule slider reached or error at Day {i}. Stopping.")
+        except Exception as e:
+            if driver_is_gone(e):
+                raise
+            print(f"Error while scanning Day {i}: {e}. Stopping.")
+            events.emit("error", where="scan_days", day=i, message=str(e))
+
+    def read_and_evaluate_day(self, full_day_text, shift_filter, render, full_pass):
+        """Read and evaluate the displayed day, unless its rows are the same as at the last sweep."""
+        key = ("dom", self.current_date)
+        fingerprint = render.get("fingerprint") if render else None
+        if not full_pass and fingerprint is not None and self.day_fingerprints.get(key) == fingerprint:
+            print("  Rows unchanged since the last sweep. Skipping.")
+            self.skip_day(("read",))
+            metrics.count("days_scanned_total", result="skipped")
+            events.emit("day_scanned", date=self.current_date, weekday=full_day_text, rows=render.get("rows"), skipped=True)
+            return
+
+        started = time.monotonic()
+        shifts = [Shift.from_row(row) for row in self.read_shifts()]
+        if len(shifts) == 0:
+            print("  No shifts found.")
+        matched = self.evaluate_shifts(full_day_text, shifts, shift_filter)
+        self.track_cost("read", time.monotonic() - started)
+        metrics.count("days_scanned_total", result="read")
+        events.emit("day_scanned", date=self.current_date, weekday=full_day_text, rows=len(shifts), matches=len(matched), duration=time.monotonic() - started)
+
+        # A match still showing an Add button keeps the day un-fingerprinted so the next sweep retries the claim
+        keys = [key, ("network", self.current_date)]
+        retry = any(
+            (self.current_date, shift.text) not in self.claimed
+            and (shift.button_label is None or "Add" in shift.button_label or "Add" in (shift.button_text or ""))
+            for shift in matched
+        )
+        if fingerprint is None or retry:
+            for stale in keys:
+                self.day_fingerprints.pop(stale, None)
+            return
+        self.day_fingerprints[key] = fingerprint
+        if self.current_date in self.pending_fingerprints:
+            self.day_fingerprints[keys[1]] = self.pending_fingerprints.pop(self.current_date)
+
+    def network_day_unchanged(self, day_map, i):
+        current_dt, full_day_text = day_map[i]
+        day = current_dt.date()
+        if not self.network_source.covers(day):
+            return False
+        fingerprint = repr(sorted((shift.start, shift.end) for shift in self.network_source.shifts_for(day)))
+        if self.day_fingerprints.get(("network", day)) == fingerprint:
+            print(f"--- Day {i} ({full_day_text}, {current_dt:%b %d}) is unchanged in network data. Skipping. ---")
+            self.skip_day(("visit", "read"))
+            metrics.count("days_scanned_total", result="skipped")
+            events.emit("day_scanned", date=day, weekday=full_day_text, skipped=True)
+            return True
+        self.pending_fingerprints[day] = fingerprint
+        return False
+
+    def track_cost(self, step, seconds):
+        # Moving average of what each step of a day visit costs, used to estimate time saved by skipping it
+        previous = self.day_costs.get(step)
+        self.day_costs[step] = seconds if previous is None else 0.8 * previous + 0.2 * seconds
+
+    def skip_day(self, steps):
+        self.skipped_days += 1
+        self.time_saved += sum(self.day_costs.get(step, 0.0) for step in steps)
+
+    def has_network_match(self, day_map, i, shift_filter):
+        current_dt, full_day_text = day_map[i]
+        if not self.network_source.covers(current_dt.date()):
+            return True
+        if shift_filter.matches(full_day_text, self.network_source.shifts_for(current_dt.date())):
+            return True
+        print(f"--- Day {i} ({full_day_text}, {current_dt:%b %d}) has no matching shifts in network data. Skipping. ---")
+        return False
+
+    def open_scan_tabs(self, count, day_map):
+        """Keep `count` tabs open on Find Shifts, the main tab first, and return the handles of those showing `day_map`.
+
+        An extra tab is reloaded only when its slider differs from the main tab's (yesterday's days after
+        midnight) or the app bounced it off Find Shifts. A tab that still differs after the reload is left out.
+        """
+        # The main tab's slider was just read, so it is on Find Shifts
+        self.find_shifts_url = self.driver.current_url
+
+        while len(self.extra_tabs) > count - 1:
+            self.driver.switch_to.window(self.extra_tabs.pop())
+            self.driver.close()
+        while len(self.extra_tabs) < count - 1:
+            self.driver.switch_to.new_window("tab")
+            self.block_urls()
+            self.driver.get(self.find_shifts_url)
+            self.extra_tabs.append(self.driver.current_window_handle)
+
+        tabs = [self.main_tab]
+        for k, handle in enumerate(self.extra_tabs, start=2):
+            self.driver.switch_to.window(handle)
+            # Off Find Shifts the slider wait would only time out, so check the URL first
+            tab_day_map = self.read_tab_day_map() if self.driver.current_url == self.find_shifts_url else None
+            if tab_day_map != day_map:
+                self.driver.get(self.find_shifts_url)
+                tab_day_map = self.read_tab_day_map()
+            if tab_day_map == day_map:
+                tabs.append(handle)
+            else:
+                print(f"Tab {k} is not showing the same days as the main tab; leaving it out of this sweep.")
+                events.emit("error", where="open_scan_tabs", tab=k, message="slider differs from the main tab")
+        self.driver.switch_to.window(self.main_tab)
+        return tabs
+
+    def read_tab_day_map(self):
+        """read_day_map() for an extra tab, or None if its slider can't be read."""
+        try:
+            return self.read_day_map()
+        except Exception as e:
+            if driver_is_gone(e):
+                raise
+            return None
+
+    def scan_days_in_tabs(self, day_map, planned, shift_filter, tab_count, full_pass=True):
+        """Click a batch of days in separate tabs so their rows render concurrently, then read and claim one tab at a time."""
+        started = time.monotonic()
+        i = None
+        main_tab_day = (None, None)
+        if self.main_tab is None:
+            self.main_tab = self.driver.current_window_handle
+        tabs = [self.main_tab]
+        tab_times = [0.0]
+        try:
+            # Clicking index i in a tab is only safe because its slider matched day_map just now
+            tabs = self.open_scan_tabs(min(tab_count, len(planned)), day_map)
+            tab_times = [0.0] * len(tabs)
+            for batch_start in range(0, len(planned), len(tabs)):
+                batch = list(enumerate(planned[batch_start:batch_start + len(tabs)]))
+
+                for k, i in batch:
+                    tab_started = time.monotonic()
+                    self.driver.switch_to.window(tabs[k])
+                    self.wait.until(EC.element_to_be_clickable((By.XPATH, f"{DAY_SLIDER_XPATH}[{i}]"))).click()
+                    tab_times[k] += time.monotonic() - tab_started
+
+                for k, i in batch:
+                    tab_started = time.monotonic()
+                    self.driver.switch_to.window(tabs[k])
+                    render = self.wait_for_render()
+                    current_dt, full_day_text = day_map[i]
+                    print(f"--- Checking Day {i}: {full_day_text}, {current_dt:%b %d} (tab {k + 1}) ---")
+                    self.current_day, self.current_date = full_day_text, current_dt.date()
+                    if k == 0:
+                        main_tab_day = (self.current_day, self.current_date)
+
+                    self.read_and_evaluate_day(full_day_text, shift_filter, render, full_pass)
+                    tab_times[k] += time.monotonic() - tab_started
+
+        except Exception as e:
+            if driver_is_gone(e):
+                raise
+            print(f"Error while scanning Day {i} in tabs: {e}. Stopping.")
+            events.emit("error", where="scan_days_in_tabs", day=i, message=str(e))
+        finally:
+            self.driver.switch_to.window(self.main_tab)
+            # Event mode goes on watching whichever day the main tab was left showing
+            self.current_day, self.current_date = main_tab_day
+            per_tab = ", ".join(f"tab {k + 1}: {seconds:.2f}s" for k, seconds in enumerate(tab_times))
+            print(f"Scanned {len(planned)} days across {len(tabs)} tabs in {time.monotonic() - started:.2f}s ({per_tab}).")
+
+# Sweeps that fail this many times in a row on a live session get a fresh browser anyway
+RELAUNCH_AFTER_ERRORS = 3
+
+class BrowserSupervisor:
+    """Owns main()'s Browser: runs each sweep under a watchdog and replaces the browser when its session dies.
+
+    A sweep that runs past SWEEP_DEADLINE gets its chromedriver killed, which makes the hung call fail.
+    Sessions that are gone (see driver_is_gone) are relaunched on the same Chrome profile, so the login
+    carries over. Relaunches wait RELAUNCH_BACKOFF_MIN seconds, doubling up to RELAUNCH_BACKOFF_MAX, for as
+    long as sweeps keep failing. Any other error is logged and the sweep tried again on the same browser,
+    up to RELAUNCH_AFTER_ERRORS times in a row.
+    """
+
+    def __init__(self):
+        self.browser = None
+        self.failures = 0
+        # Consecutive tasks that failed without losing the session
+        self.errors = 0
+        self.restarts = 0
+        self.downtime = 0.0
+        self.started = time.monotonic()
+        self.expired = False
+        self.recycles = 0
+        self.sweep_times = []
+
+    def launch(self):
+        self.browser = Browser()
+        self.browser.login()
+        return self.browser
+
+    def run(self, task, extra_seconds=0):
+        """Return task(browser), or None if it failed: `errors` is then non-zero unless the browser was replaced."""
+        deadline = config.snapshot()["SWEEP_DEADLINE"]
+        self.expired = False
+        watchdog = None
+        if deadline > 0:
+            watchdog = threading.Timer(deadline + extra_seconds, self.expire, args=(self.browser,))
+            watchdog.daemon = True
+            watchdog.start()
+        error = None
+        try:
+            result = task(self.browser)
+        except Exception as e:
+            error = e
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+        # Also when the task finished just as the watchdog fired: its chromedriver is gone either way
+        if self.expired or (error is not None and driver_is_gone(error)):
+            self.recover("watchdog" if self.expired else "session lost", error)
+            return None
+        if error is not None:
+            self.task_failed(error)
+            return None
+        self.failures = 0
+        self.errors = 0
+        return result
+
+    def task_failed(self, error):
+        """Log an error that left the session up; relaunch once they keep coming."""
+        self.errors += 1
+        print(f"Sweep failed ({type(error).__name__}: {error}).")
+        events.emit("error", where="sweep", message=str(error))
+        metrics.count("sweep_errors_total")
+        if self.errors >= RELAUNCH_AFTER_ERRORS:
+            self.errors = 0
+            self.recover(f"{RELAUNCH_AFTER_ERRORS} errors in a row", error)
+        else:
+            print("Trying again at the next sweep.")
+
+    def expire(self, browser):
+        self.expired = True
+        print(f"Sweep ran past SWEEP_DEADLINE ({config.snapshot()['SWEEP_DEADLINE']:.0f}s). Killing the hung WebDriver session.")
+        browser.kill()
+
+    def recover(self, reason, error):
+        down_since = time.monotonic()
+        self.restarts += 1
+        print(f"Browser session lost ({reason}{f': {error}' if error else ''}). Relaunching...")
+        events.emit("browser_restart", reason=reason, message=str(error) if error else None)
+        metrics.count("browser_restarts_total", reason=reason)
+        self.discard()
+
+        while not stop_requested.is_set():
+            settings = config.snapshot()
+            self.failures += 1
+            if self.failures > 1:
+                delay = min(settings["RELAUNCH_BACKOFF_MAX"], settings["RELAUNCH_BACKOFF_MIN"] * 2 ** (self.failures - 2))
+                print(f"Waiting {delay:.0f}s before relaunching (attempt {self.failures}).")
+                if stop_requested.wait(delay):
+                    break
+            try:
+                self.launch()
                 break
+            except Exception as e:
+                print(f"Relaunch failed: {e}")
+                events.emit("error", where="relaunch", message=str(e))
+                self.discard()
 
-def parse_hour(hora):
-    hour, mint = hora.split(":")
-    minute = "".join([i for i in mint if i.isdigit()])
-    section = mint[len(minute):]
-    hour, minute = int(hour), int(minute)
-    if section.lower() == "pm" and hour != 12:
-        hour += 12
-    return (hour, minute)
+        downtime = time.monotonic() - down_since
+        self.downtime += downtime
+        metrics.observe("browser_downtime", downtime)
+        if self.browser is not None:
+            print(f"Browser back after {downtime:.1f}s. {self.uptime_report()}")
 
-def earlier_time(time1, time2):
-    if time1[0] > time2[0]:
-        return time2
-    elif time1[0] < time2[0]:
-        return time1
-    elif time1[1] > time2[1]:
-        return time2
-    else:
-        return time1
+    def discard(self):
+        browser, self.browser = self.browser, None
+        if browser is None:
+            return
+        if browser.store is not None:
+            try:
+                browser.store.close()
+            except sqlite3.Error as e:
+                print(f"Could not save the shift history: {e}")
+        browser.kill()
 
-def time_diff(time1, time2):
-    if time1[0] < time2[0]:
-        midnight_offset = 24 - time2[0]
-        time2 = list(time2)
-        time2[0] = - midnight_offset
-    diff = time1[0] - time2[0]
-    diff -= time1[1] / 60
-    diff += time2[1] / 60
-    return diff
+    def after_sweep(self, settings):
+        """Every MEMORY_CHECK_EVERY sweeps, log memory against sweep time and recycle the tab or browser past the limits.
+
+        Called between sweeps, so no claim is in flight when a tab or browser goes away.
+        """
+        browser = self.browser
+        self.sweep_times.append(browser.sweep_seconds)
+        every = settings["MEMORY_CHECK_EVERY"]
+        if not every or browser.sweeps % every:
+            return
+        # Under the watchdog like a sweep: a dead or hung session gets a new browser, not a crash
+        sample = self.run(lambda browser: browser.sample_memory())
+        if sample is None:
+            return
+        sweep_seconds = sum(self.sweep_times) / len(self.sweep_times)
+        self.sweep_times = []
+
+        action = ""
+        if settings["BROWSER_RECYCLE_RSS_MB"] and (sample["rss_mb"] or 0) >= settings["BROWSER_RECYCLE_RSS_MB"]:
+            # An attached Chrome outlives the bot, so a fresh tab is as far as it can go
+            action = "tab" if browser.attached else "browser"
+        elif settings["TAB_RECYCLE_HEAP_MB"] and (sample["heap_mb"] or 0) >= settings["TAB_RECYCLE_HEAP_MB"]:
+            action = "tab"
+        heap = "?" if sample["heap_mb"] is None else f"{sample['heap_mb']:.0f} MB"
+        rss = "?" if sample["rss_mb"] is None else f"{sample['rss_mb']:.0f} MB"
+        print(f"Memory after {browser.sweeps} sweeps: JS heap {heap}, Chrome {rss}, sweeps averaging {sweep_seconds:.2f}s.")
+        write_memory_log(settings, self.restarts + self.recycles, browser.sweeps, sweep_seconds, sample, action)
+        if not action:
+            return
+
+        print(f"Recycling the {action} to release memory.")
+        events.emit("recycle", target=action, heap_mb=sample["heap_mb"], rss_mb=sample["rss_mb"])
+        metrics.count("browser_recycles_total", target=action)
+        self.recycles += 1
+        if action == "tab":
+            self.run(lambda browser: browser.recycle_tab())
+            return
+        self.browser = None
+        try:
+            browser.exit()
+        except Exception as e:
+            print(f"Could not close Chrome cleanly: {e}")
+            browser.kill()
+        try:
+            self.launch()
+        except Exception as e:
+            self.recover("recycle failed", e)
+
+    def uptime_report(self):
+        elapsed = time.monotonic() - self.started
+        share = 1 - self.downtime / elapsed if elapsed > 0 else 1
+        return f"Scan uptime {share:.1%}: {self.restarts} browser restarts, {self.downtime:.0f}s down in {elapsed / 3600:.1f}h."
+
+    def exit(self):
+        browser, self.browser = self.browser, None
+        if browser is not None:
+            try:
+                browser.exit()
+            except Exception as e:
+                # A Chrome left running would hold the profile lock for the next start
+                print(f"Could not close the browser cleanly ({e}); killing it.")
+                browser.kill()
+        if self.restarts:
+            print(self.uptime_report())
+
+def wait_for_valid_config():
+    """Block until config.json loads cleanly, so the bot never logs in or sweeps with default settings."""
+    while config.snapshot() is not None and config.error:
+        print(f"Config error, waiting for config.json to be fixed: {config.error}")
+        if stop_requested.wait(5):
+            return False
+    return True
+
+def sweep_slot(now, interval, offset):
+    """The first time at or after `now` on the wall-clock grid offset + k * interval.
+
+    Accounts run by orchestrator.py share the clock and differ only in offset, so they stay staggered
+    however long each one's sweeps take, instead of drifting back into step after the first sweep.
+    """
+    if interval <= 0:
+        return now
+    return now + (offset - now) % interval
+
+def start_metrics(settings):
+    """Turn instrumentation on if anything will read it, and start the /metrics endpoint if configured."""
+    metrics.enabled = bool(settings["METRICS_PORT"] or settings["METRICS_FILE"] or PROFILE)
+    # A worker that runs main() more than once keeps the endpoint from the first run
+    if settings["METRICS_PORT"] and metrics.server is None:
+        try:
+            metrics.serve(settings["METRICS_PORT"])
+            print(f"Serving metrics on http://127.0.0.1:{settings['METRICS_PORT']}/metrics")
+        except OSError as e:
+            print(f"Could not serve metrics on port {settings['METRICS_PORT']}: {e}")
+
+def write_metrics_file(settings):
+    if not settings["METRICS_FILE"]:
+        return
+    path = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), settings["METRICS_FILE"])
+    try:
+        metrics.write_file(path)
+    except OSError as e:
+        print(f"Could not write metrics to {path}: {e}")
+
+def write_memory_log(settings, generation, sweeps, sweep_seconds, sample, action):
+    """Append a row to MEMORY_LOG_FILE, a CSV of sweep time against memory for long runs."""
+    if not settings["MEMORY_LOG_FILE"]:
+        return
+    path = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), settings["MEMORY_LOG_FILE"])
+    try:
+        new_file = not os.path.exists(path)
+        with open(path, "a", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(["time", "generation", "sweeps", "sweep_seconds", "js_heap_mb", "rss_mb", "recycled"])
+            writer.writerow([
+                datetime.now().isoformat(timespec="seconds"), generation, sweeps, f"{sweep_seconds:.3f}",
+                "" if sample["heap_mb"] is None else f"{sample['heap_mb']:.1f}",
+                "" if sample["rss_mb"] is None else f"{sample['rss_mb']:.1f}",
+                action,
+            ])
+    except OSError as e:
+        print(f"Could not write the memory log {path}: {e}")
 
 def main():
     prevent_sleep()
     start = time.time()
+    start_metrics(config.snapshot())
+    profiler = cProfile.Profile() if PROFILE else None
+    supervisor = BrowserSupervisor()
+
+    def sweep(browser):
+        if profiler is not None:
+            new_matches = profiler.runcall(browser.find_shifts)
+            profiler.dump_stats(PROFILE_FILE)
+        else:
+            new_matches = browser.find_shifts()
+        if not stays_on_find_shifts(config.snapshot()):
+            browser.back_home()
+        return new_matches
+
     try:
-        browser = Browser()
-        browser.login()
-        while True:
-            current_config = load_config()
-            hours_to_run = current_config.get("HOURS_TO_RUN", 48)
+        if not wait_for_valid_config():
+            return
+        maintain_profile(config.snapshot())
+        supervisor.launch()
+
+        settings = config.snapshot()
+        if settings["SWEEP_OFFSET_SECONDS"] > 0:
+            first = sweep_slot(time.time(), settings["SECONDS_BETWEEN_CHECKS"], settings["SWEEP_OFFSET_SECONDS"])
+            print(f"Waiting {first - time.time():.1f}s for this account's first sweep slot.")
+            stop_requested.wait(first - time.time())
+
+        scheduler = PollScheduler.from_config(config.snapshot(), RELEASE_HISTORY_FILE)
+        while not stop_requested.is_set():
+            hours_to_run = config.snapshot()["HOURS_TO_RUN"]
             if time.time() - start >= hours_to_run * 60 * 60:
                 break
                 
-            browser.find_shifts()
-            browser.back_home()
+            new_matches = supervisor.run(sweep)
+            if new_matches is None and not supervisor.errors:
+                # Relaunched after a crash or hang; sweep again straight away to close the gap
+                continue
+            settings = config.snapshot()
+            if new_matches is None:
+                # Failed on a live session; try again after the usual wait
+                new_matches = []
+            else:
+                browser = supervisor.browser
+                print(f"Cycle timing: {browser.navigation_time:.2f}s navigating, {browser.scan_time:.2f}s scanning.")
+                browser.report_waits()
+                metrics.observe("navigation", browser.navigation_time)
+                metrics.observe("scanning", browser.scan_time)
+                write_metrics_file(settings)
+                supervisor.after_sweep(settings)
             done = time.time()
+
+            if settings["EVENT_MODE"]:
+                # The observer handles changes between sweeps; full sweeps remain as a safety net
+                full_sweep = event_full_sweep_seconds(settings)
+                supervisor.run(lambda browser: browser.watch_shifts(done + full_sweep), full_sweep)
+                continue
+            
+            delay = None
+            if settings["ADAPTIVE_POLLING"]:
+                scheduler.configure(settings)
+                scheduler.record(datetime.now(), len(new_matches))
+                delay = scheduler.next_delay(datetime.now())
+                print(f"Next check in {delay:.0f}s (adaptive, backoff interval {scheduler.interval:.0f}s).")
             
             while True:
-                current_config = load_config()
-                seconds_between = current_config.get("SECONDS_BETWEEN_CHECKS", 15)
-                if time.time() - done >= seconds_between:
+                settings = config.snapshot()
+                if delay is not None:
+                    next_sweep = done + delay
+                elif settings["SWEEP_OFFSET_SECONDS"] > 0:
+                    next_sweep = sweep_slot(done, settings["SECONDS_BETWEEN_CHECKS"], settings["SWEEP_OFFSET_SECONDS"])
+                else:
+                    next_sweep = done + settings["SECONDS_BETWEEN_CHECKS"]
+                # Never sleep past the end of HOURS_TO_RUN
+                remaining = min(next_sweep, start + settings["HOURS_TO_RUN"] * 60 * 60) - time.time()
+                if remaining <= 0 or stop_requested.wait(min(5, remaining)):
                     break
-                time.sleep(5) 
-                
-        browser.exit()
     except KeyboardInterrupt:
         print("\nScript manually stopped by user.")
-        try:
-            browser.exit()
-        except:
-            pass
     finally:
+        # However main() ends, close Chrome so it doesn't keep the profile locked
+        supervisor.exit()
         allow_sleep()
+        if profiler is not None and os.path.exists(PROFILE_FILE):
+            print(f"Sweep profile saved to {PROFILE_FILE}. Top functions by cumulative time:")
+            pstats.Stats(PROFILE_FILE).sort_stats("cumulative").print_stats(20)
 
 if __name__ == "__main__":
+    # orchestrator.py and service managers stop the bot with SIGTERM; finish up and close Chrome like Ctrl+C would
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_requested.set())
     main()
\ No newline at end of file
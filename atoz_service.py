@@ -0,0 +1,298 @@
+import argparse
+import collections
+import hmac
+import json
+import os
+import secrets
+import signal
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bot_worker import BotRunner
+
+# Runs the bot without the GUI, for always-on machines, and controls it over a small JSON
+# API on localhost:
+#
+#     GET  /status                  running or not, sweeps, last sweep, errors
+#     POST /start, POST /stop       start main(), or end it at the next day or wait
+#     GET  /config                  config.json with any overrides applied
+#     POST /config                  {"values": {...}, "save": false} overrides settings, or writes them to config.json
+#     GET  /claims?limit=20         recent claim attempts, newest first
+#
+# Every request needs the token from atoz_service.token (beside config.json, new on each
+# launch unless --token or ATOZ_SERVICE_TOKEN fixes it), and POSTs a JSON Content-Type.
+# Requests naming another Host or Origin are refused, so web pages open in a browser on the
+# same machine can't drive the API.
+#
+#     python atoz_service.py [--port 8740] [--start]
+#     curl -X POST -H "Authorization: Bearer $(cat atoz_service.token)" -H "Content-Type: application/json" http://127.0.0.1:8740/start
+#
+# SIGTERM or Ctrl+C stops the bot cleanly (browser.exit and allow_sleep run) before exiting.
+
+if getattr(sys, 'frozen', False):
+    BOT_SCRIPT = os.path.join(sys._MEIPASS, "AtoZ-Bot.py")
+else:
+    BOT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "AtoZ-Bot.py")
+
+TOKEN_FILE_NAME = "atoz_service.token"
+# The names a loopback client can reach the API by; anything else in Host is DNS rebinding
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "[::1]")
+# Paths the bot uses as they are rather than inside the config directory, so only config.json can set them
+FILE_ONLY_KEYS = frozenset(("DISK_CACHE_DIR",))
+
+class Service:
+    def __init__(self, runner):
+        self.runner = runner
+        self.started_at = time.time()
+        self.runs = 0
+        self.sweeps = 0
+        self.errors = 0
+        self.last_sweep = None
+        self.last_error = None
+        # Claim events, for when the shift store is off
+        self.claims = collections.deque(maxlen=100)
+        self.lock = threading.Lock()
+
+        # The bot reports sweeps, claims and errors over the same JSON-lines channel the GUI listens on
+        self.event_server = socket.create_server(("127.0.0.1", 0))
+        os.environ["ATOZ_EVENT_PORT"] = str(self.event_server.getsockname()[1])
+        threading.Thread(target=self.accept_events, daemon=True).start()
+
+    def accept_events(self):
+        while True:
+            try:
+                connection, _ = self.event_server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self.read_events, args=(connection,), daemon=True).start()
+
+    def read_events(self, connection):
+        try:
+            with connection.makefile("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.record(event)
+        except OSError:
+            pass
+
+    def record(self, event):
+        kind = event.get("type")
+        with self.lock:
+            if kind == "sweep_end":
+                self.sweeps += 1
+                self.last_sweep = event
+            elif kind == "claim":
+                self.claims.appendleft(event)
+            elif kind == "error":
+                self.errors += 1
+                self.last_error = event
+
+    def start(self):
+        if self.runner.running():
+            stopping = self.runner.bot["stop_requested"].is_set()
+            return {"ok": False, "error": "still stopping" if stopping else "already running"}
+        self.runner.start()
+        self.runs += 1
+        return {"ok": True, "running": True}
+
+    def stop(self):
+        if not self.runner.running():
+            return {"ok": False, "error": "not running"}
+        self.runner.stop()
+        return {"ok": True, "stopping": True}
+
+    def status(self):
+        bot = self.runner.bot
+        with self.lock:
+            return {
+                "running": self.runner.running(),
+                "stopping": self.runner.running() and bot["stop_requested"].is_set(),
+                "uptime": time.time() - self.started_at,
+                "runs": self.runs,
+                "sweeps": self.sweeps,
+                "errors": self.errors,
+                "last_sweep": self.last_sweep,
+                "last_error": self.last_error,
+            }
+
+    def read_config_file(self):
+        """config.json as saved, the defaults if there is none yet. Raises ValueError if it is half-written or not JSON."""
+        bot = self.runner.load()
+        try:
+            with open(bot["config"].path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return dict(bot["DEFAULT_CONFIG"])
+
+    def get_config(self):
+        config = self.runner.load()["config"]
+        try:
+            raw = self.read_config_file()
+        except (OSError, ValueError) as e:
+            return 503, {"ok": False, "error": f"could not read {config.path}: {e}"}
+        return 200, {"config": {**raw, **config.overrides}, "overrides": config.overrides, "path": config.path}
+
+    def set_config(self, body):
+        values = body.get("values")
+        if not isinstance(values, dict) or not values:
+            return 400, {"ok": False, "error": 'expected {"values": {...}}'}
+        refused = sorted(FILE_ONLY_KEYS.intersection(values))
+        if refused:
+            return 403, {"ok": False, "error": f"{', '.join(refused)} can only be changed in config.json"}
+        bot = self.runner.load()
+        path = bot["config"].path
+        try:
+            raw = self.read_config_file()
+        except (OSError, ValueError) as e:
+            return 503, {"ok": False, "error": f"could not read {path}: {e}"}
+        try:
+            bot["normalize_config"]({**bot["DEFAULT_CONFIG"], **raw, **bot["config"].overrides, **values})
+        except (KeyError, ValueError) as e:
+            return 400, {"ok": False, "error": str(e)}
+
+        if body.get("save"):
+            raw.update(values)
+            # Written beside and renamed over config.json, so the bot never reloads half a file
+            temporary = f"{path}.tmp"
+            try:
+                with open(temporary, "w") as f:
+                    json.dump(raw, f, indent=4)
+                os.replace(temporary, path)
+            except OSError as e:
+                return 500, {"ok": False, "error": f"could not write {path}: {e}"}
+        else:
+            bot["config"].apply_overrides(values)
+        return 200, {"ok": True, "saved": bool(body.get("save")), "values": values}
+
+    def recent_claims(self, limit):
+        path = self.runner.load()["SHIFT_STORE_FILE"]
+        if os.path.exists(path):
+            connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                connection.row_factory = sqlite3.Row
+                rows = connection.execute(
+                    "SELECT date, start, end, text, attempted_at, outcome, click_ms, confirm_ms FROM claims ORDER BY attempted_at DESC LIMIT ?",
+                    (limit,),
+                ).fetchall()
+                return {"source": "shift_store", "claims": [dict(row) for row in rows]}
+            except sqlite3.Error:
+                pass
+            finally:
+                connection.close()
+        with self.lock:
+            return {"source": "events", "claims": list(self.claims)[:limit]}
+
+def make_handler(service, token):
+    class Handler(BaseHTTPRequestHandler):
+        def refuse(self):
+            """Reply with an error and return True unless the request comes from a local client holding the token."""
+            port = self.server.server_address[1]
+            local = {f"{host}:{port}" for host in LOOPBACK_HOSTS}
+            if self.headers.get("Host") not in local:
+                self.reply(403, {"ok": False, "error": "unexpected Host"})
+            elif "Origin" in self.headers and self.headers["Origin"] not in {f"http://{host}" for host in local}:
+                self.reply(403, {"ok": False, "error": "cross-origin requests are not allowed"})
+            elif not hmac.compare_digest(self.headers.get("Authorization", ""), f"Bearer {token}"):
+                self.reply(401, {"ok": False, "error": f"missing or wrong token (see {TOKEN_FILE_NAME})"})
+            elif self.command == "POST" and self.headers.get("Content-Type", "").split(";")[0].strip() != "application/json":
+                self.reply(415, {"ok": False, "error": "expected Content-Type: application/json"})
+            else:
+                return False
+            return True
+
+        def reply(self, status, body):
+            data = json.dumps(body, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.refuse():
+                return
+            path, _, query = self.path.partition("?")
+            if path == "/status":
+                self.reply(200, service.status())
+            elif path == "/config":
+                self.reply(*service.get_config())
+            elif path == "/claims":
+                params = dict(part.split("=", 1) for part in query.split("&") if "=" in part)
+                limit = int(params["limit"]) if params.get("limit", "").isdigit() else 20
+                self.reply(200, service.recent_claims(limit))
+            else:
+                self.reply(404, {"ok": False, "error": f"unknown path {path}"})
+
+        def do_POST(self):
+            if self.refuse():
+                return
+            path = self.path.partition("?")[0]
+            if path == "/start":
+                body = service.start()
+                self.reply(200 if body["ok"] else 409, body)
+            elif path == "/stop":
+                body = service.stop()
+                self.reply(200 if body["ok"] else 409, body)
+            elif path == "/config":
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self.reply(400, {"ok": False, "error": "body is not JSON"})
+                    return
+                self.reply(*service.set_config(body))
+            else:
+                self.reply(404, {"ok": False, "error": f"unknown path {path}"})
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the shift bot headless, controlled over a local JSON API.")
+    parser.add_argument("--port", type=int, default=8740, help="Port for the control API on 127.0.0.1 (0 picks a free one)")
+    parser.add_argument("--start", action="store_true", help="Start the bot right away instead of waiting for POST /start")
+    parser.add_argument("--stop-timeout", type=float, default=60, help="Seconds to wait for the bot to close Chrome on shutdown")
+    parser.add_argument("--token", default=os.environ.get("ATOZ_SERVICE_TOKEN"), help="API token to use instead of a new random one")
+    args = parser.parse_args()
+
+    service = Service(BotRunner(BOT_SCRIPT))
+    bot = service.runner.load()
+    token = args.token or secrets.token_urlsafe(32)
+    token_file = os.path.join(os.path.dirname(os.path.abspath(bot["config"].path)), TOKEN_FILE_NAME)
+    # Created afresh so it is readable by this user only, whatever an older file allowed
+    try:
+        os.remove(token_file)
+    except FileNotFoundError:
+        pass
+    with open(os.open(token_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "w") as f:
+        f.write(token)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(service, token))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Control API on http://127.0.0.1:{server.server_address[1]}, token in {token_file}")
+
+    shutdown = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: shutdown.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: shutdown.set())
+    if args.start:
+        service.start()
+
+    while not shutdown.wait(1):
+        pass
+
+    print("Shutting down...")
+    # main() runs browser.exit() and allow_sleep() on its way out
+    service.runner.stop(timeout=args.stop_timeout)
+    server.shutdown()
+    service.event_server.close()
+
+if __name__ == "__main__":
+    main()
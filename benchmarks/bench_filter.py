@@ -0,0 +1,148 @@
+"""Correctness check and microbenchmark for the compiled shift filter.
+
+Runs the compiled ShiftFilter against synthetic shift lists, checks every
+decision against a plain datetime-based reference, and compares throughput
+with the old per-row parse_hour/time_diff path.
+
+    python benchmarks/bench_filter.py [--rows 1000 10000 100000]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from common import load_bot
+from shift_clock import format_clock
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+def synthetic_rows(count, seed=1):
+    rng = random.Random(seed)
+    rows = []
+    for index in range(1, count + 1):
+        start = rng.randrange(0, 24 * 60, 15)
+        length = rng.randrange(4 * 60, 12 * 60 + 1, 30)
+        rows.append({
+            "index": index,
+            "day": rng.choice(WEEKDAYS),
+            "time": f"{format_clock(start)} - {format_clock(start + length)}",
+            "button_label": "Add shift",
+            "button_text": "Add",
+        })
+    return rows
+
+def reference_match(settings, day, time_text):
+    """Straightforward datetime version of the filter rules, used to check the compiled one."""
+    # SHIFT_WINDOWS keys may be abbreviated ("Mon") and win over the same day in WEEKDAYS
+    spans = next((spans for key, spans in settings["SHIFT_WINDOWS"].items() if day.lower().startswith(key.lower()[:3])), None)
+    if spans is not None:
+        windows = [span.split("-") for span in spans]
+    elif day in settings["WEEKDAYS"]:
+        windows = [(settings["EARLIEST_TIME"], settings["LATEST_TIME"])]
+    else:
+        return False
+
+    def clock(text):
+        return datetime.strptime(text.strip().upper(), "%I:%M%p" if text.strip()[-2:].isalpha() else "%H:%M")
+
+    start_text, end_text = time_text.split("-")
+    start, end = clock(start_text), clock(end_text)
+    if end <= start:
+        end += timedelta(days=1)
+    if end - start > timedelta(hours=settings["LONGEST_SHIFT"]):
+        return False
+    for low_text, high_text in windows:
+        low, high = clock(low_text), clock(high_text)
+        if low <= high and low <= start <= high:
+            return True
+        if low > high and (start >= low or start <= high):
+            return True
+    return False
+
+def legacy_filter(bot, settings, rows):
+    earliest = settings["EARLIEST_TIME"]
+    latest = settings["LATEST_TIME"]
+    matched = 0
+    for row in rows:
+        if not any(day in row["day"] for day in settings["WEEKDAYS"]):
+            continue
+        start_str, end_str = row["time"].split("-")
+        start_parsed = bot["parse_hour"](start_str.strip())
+        if bot["parse_hour"](earliest) <= start_parsed <= bot["parse_hour"](latest):
+            duration = bot["time_diff"](bot["parse_hour"](end_str.strip()), start_parsed)
+            if duration <= settings["LONGEST_SHIFT"]:
+                matched += 1
+    return matched
+
+def compiled_filter(bot, shift_filter, rows_by_day):
+    matched = 0
+    for day, rows in rows_by_day.items():
+        shifts = [bot["Shift"].from_row(row) for row in rows]
+        matched += len(shift_filter.matches(day, shifts))
+    return matched
+
+def match_only(shift_filter, shifts_by_day):
+    return sum(len(shift_filter.matches(day, shifts)) for day, shifts in shifts_by_day.items())
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    bot = load_bot()
+    raw = {
+        **bot["DEFAULT_CONFIG"],
+        "EARLIEST_TIME": "06:00",
+        "LATEST_TIME": "10:00",
+        "LONGEST_SHIFT": 10,
+        "WEEKDAYS": ["Monday", "Wednesday", "Sunday"],
+        "SHIFT_WINDOWS": {
+            "Tuesday": ["06:00-10:00", "18:00-19:00"],
+            "Friday": ["22:00-02:00"],
+            "Mon": ["12:00-14:00"],
+        },
+    }
+    settings = bot["normalize_config"](raw)
+    shift_filter = bot["ShiftFilter"].from_config(settings)
+
+    failures = 0
+    for row in synthetic_rows(20000, seed=7):
+        expected = reference_match(raw, row["day"], row["time"])
+        actual = bool(shift_filter.matches(row["day"], [bot["Shift"].from_row(row)]))
+        if expected != actual:
+            failures += 1
+            if failures <= 10:
+                print(f"MISMATCH {row['day']} {row['time']}: expected {expected}, got {actual}")
+    print(f"Correctness: {20000 - failures}/20000 decisions agree with the reference.")
+
+    # The legacy path only understands a single EARLIEST/LATEST window, so it is timed on that config
+    single_window = bot["normalize_config"]({**raw, "SHIFT_WINDOWS": {}})
+    single_filter = bot["ShiftFilter"].from_config(single_window)
+    legacy_settings = {**raw, "SHIFT_WINDOWS": {}}
+
+    print(f"{'rows':>8} {'legacy rows/s':>15} {'compiled rows/s':>16} {'match-only rows/s':>18} {'speedup':>8}")
+    for count in args.rows:
+        rows = synthetic_rows(count)
+        rows_by_day = {}
+        for row in rows:
+            rows_by_day.setdefault(row["day"], []).append(row)
+        legacy_matches, legacy_time = timed(legacy_filter, bot, legacy_settings, rows)
+        compiled_matches, compiled_time = timed(compiled_filter, bot, single_filter, rows_by_day)
+        shifts_by_day = {day: [bot["Shift"].from_row(row) for row in day_rows] for day, day_rows in rows_by_day.items()}
+        _, match_time = timed(match_only, single_filter, shifts_by_day)
+        if legacy_matches != compiled_matches:
+            print(f"  note: legacy matched {legacy_matches}, compiled matched {compiled_matches} "
+                  f"(legacy time_diff miscounts minutes)")
+        print(f"{count:>8} {count / legacy_time:>15,.0f} {count / compiled_time:>16,.0f} "
+              f"{count / match_time:>18,.0f} {legacy_time / compiled_time:>7.1f}x")
+
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Shared helpers for the scripts in benchmarks/."""
+import json
+import os
+import pathlib
+import runpy
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BOT_SCRIPT = os.path.join(ROOT, "AtoZ-Bot.py")
+FIXTURE = pathlib.Path(ROOT, "benchmarks", "fixtures", "find_shifts.html").as_uri()
+
+# AtoZ-Bot.py and the benchmarks import the repo's shared modules (shift_clock.py)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+def write_config(config):
+    """Write `config` to a config.json in a fresh temporary directory and return its path."""
+    directory = tempfile.mkdtemp(prefix="atoz-bench-")
+    path = os.path.join(directory, "config.json")
+    with open(path, "w") as f:
+        json.dump(config, f)
+    return path
+
+def load_bot(config=None, profile=None):
+    """Load AtoZ-Bot.py as a namespace without running main().
+
+    The bot reads `config` over its defaults from a temporary config.json and keeps its shift
+    store and Chrome profile (or `profile`) beside it, so benchmark runs neither depend on nor
+    touch the user's settings, shift history or logged-in profile.
+    """
+    path = write_config(config or {})
+    os.environ["ATOZ_CONFIG_FILE"] = path
+    os.environ["ATOZ_PROFILE_DIR"] = profile or os.path.join(os.path.dirname(path), "ChromeBotProfile")
+    return runpy.run_path(BOT_SCRIPT, run_name="atoz_bot")
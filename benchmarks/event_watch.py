@@ -0,0 +1,55 @@
+"""Measure how quickly event mode notices newly released shifts.
+
+Opens benchmarks/fixtures/find_shifts.html in a real Chrome through Browser, lets the
+page release a shift every --release-every milliseconds, and runs Browser.watch_shifts
+against it. Reports the delay between each release and the bot evaluating that row.
+
+    python benchmarks/event_watch.py [--seconds 30] [--release-every 3000]
+"""
+import argparse
+import statistics
+import time
+
+from common import FIXTURE, load_bot
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--release-every", type=int, default=3000)
+    args = parser.parse_args()
+
+    bot = load_bot({"SHIFT_STORE": False})
+    browser = bot["Browser"]()
+    try:
+        browser.driver.get(f"{FIXTURE}?days=3&rows=3&mutate={args.release_every}")
+        day_map = browser.read_day_map()
+        browser.current_day = day_map[1][1]
+
+        detected = {}
+        evaluate_shifts = browser.evaluate_shifts
+
+        def recording_evaluate(full_day_text, shifts, shift_filter, complete=True):
+            now = time.time() * 1000
+            for shift in shifts:
+                if shift is not None:
+                    detected.setdefault(shift.text, now)
+            return evaluate_shifts(full_day_text, shifts, shift_filter, complete=complete)
+
+        browser.evaluate_shifts = recording_evaluate
+        trips_before = browser.round_trips
+        if not browser.watch_shifts(time.time() + args.seconds):
+            # A swallowed error would otherwise show up as a run that simply detected nothing
+            raise SystemExit("watch_shifts stopped early on an error (see above); no valid measurement.")
+        releases = browser.driver.execute_script("return window.__releases")
+    finally:
+        browser.exit()
+
+    delays = [detected[release["time"]] - release["releasedAt"] for release in releases if release["time"] in detected]
+    print(f"Releases: {len(releases)}, detected: {len(delays)}, WebDriver round trips: {browser.round_trips - trips_before}")
+    if delays:
+        print(f"Detection delay ms: median {statistics.median(delays):.0f}, max {max(delays):.0f}")
+    interval = bot["config"].snapshot()["SECONDS_BETWEEN_CHECKS"]
+    print(f"Polling every {interval:g}s would average about {interval * 500:.0f} ms.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Local stand-in for the A to Z Find Shifts front end, for offline testing.
+
+Serves the fixture page at /find-shifts and a JSON endpoint at /api/opportunities
+that the page fetches (with ?source=api) the same way the real SPA loads its data.
+
+    python benchmarks/fake_atoz.py [--port 8765]
+    open http://127.0.0.1:8765/find-shifts?source=api&days=14&rows=6
+"""
+import argparse
+import json
+import os
+import random
+import threading
+from datetime import datetime, timedelta
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def generate_opportunities(days=14, rows=6, seed=1):
+    rng = random.Random(seed)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    opportunities = []
+    for day in range(days):
+        for _ in range(rows):
+            start = today + timedelta(days=day, minutes=rng.randrange(0, 24 * 60, 15))
+            end = start + timedelta(minutes=rng.randrange(4 * 60, 12 * 60 + 1, 30))
+            opportunities.append({
+                "opportunityId": f"opp-{len(opportunities) + 1}",
+                "startDateTime": start.isoformat(),
+                "endDateTime": end.isoformat(),
+                "location": "FAKE1",
+            })
+    return opportunities
+
+class FakeAtoZHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=FIXTURES_DIR, **kwargs)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/api/opportunities":
+            query = {key: int(values[0]) for key, values in parse_qs(url.query).items() if values[0].isdigit()}
+            body = json.dumps({"opportunities": generate_opportunities(
+                query.get("days", 14), query.get("rows", 6), query.get("seed", 1)
+            )}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if url.path in ("/", "/find-shifts"):
+            self.path = "/find_shifts.html" + (f"?{url.query}" if url.query else "")
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+def start_server(port=0):
+    """Start the fake site on a background thread and return (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), FakeAtoZHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), FakeAtoZHandler)
+    print(f"Fake A to Z running at http://127.0.0.1:{args.port}/find-shifts?source=api")
+    server.serve_forever()
@@ -0,0 +1,275 @@
+"""In-process stand-in for Chrome + chromedriver, for benchmarking Browser without a browser.
+
+FakeDriver answers the WebDriver commands and page scripts Browser uses from an
+in-memory FakeSite (a day slider and shift rows generated like fake_atoz's API
+data). Every command goes through FakeDriver.execute, so Browser's round-trip
+counter sees it, and each one advances a simulated clock by the configured
+latency instead of sleeping. Day clicks also cost a simulated render time.
+"""
+import itertools
+import re
+from datetime import datetime
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webelement import WebElement
+
+import fake_atoz
+
+HOME_NAV_ITEM = "//*[@id='side-nav-item-top-level-home_nav_item_0']"
+
+class FakeSite:
+    """Slider days and their shift rows; rows are [time text, claimed]."""
+
+    def __init__(self, bot, days=14, rows=6, seed=1):
+        today = datetime.now().date()
+        self.days = []
+        self.rows = {}
+        for index in range(1, days + 1):
+            self.rows[index] = []
+        for opportunity in fake_atoz.generate_opportunities(days, rows, seed):
+            start = datetime.fromisoformat(opportunity["startDateTime"])
+            end = datetime.fromisoformat(opportunity["endDateTime"])
+            index = (start.date() - today).days + 1
+            text = f"{bot['format_clock'](start.hour * 60 + start.minute)} - {bot['format_clock'](end.hour * 60 + end.minute)}"
+            self.rows[index].append([text, False])
+        for index in range(1, days + 1):
+            day = datetime.fromordinal(today.toordinal() + index - 1)
+            self.days.append({"index": index, "weekday": day.strftime("%A"), "date": day.strftime("%b %d")})
+
+    def shift_rows(self, day):
+        rows = []
+        for index, (text, claimed) in enumerate(self.rows.get(day, []), start=1):
+            start, _, end = text.partition(" - ")
+            rows.append({
+                "index": index,
+                "time": text,
+                "start": start,
+                "end": end,
+                "button_label": "Remove shift" if claimed else "Add shift",
+                "button_text": "Remove" if claimed else "Add",
+                "button_disabled": False,
+            })
+        return rows
+
+    def fingerprint(self, day):
+        rows = self.rows.get(day, [])
+        return f"{len(rows)}:{hash(tuple(map(tuple, rows))) & 0xffffffff:x}"
+
+class FakeElement(WebElement):
+    def __init__(self, driver, xpath, text="", label="", on_click=None):
+        super().__init__(driver, f"fake-{next(driver.element_ids)}")
+        self.driver = driver
+        self.xpath = xpath
+        self._text = text
+        self.label = label
+        self.on_click = on_click
+
+    @property
+    def text(self):
+        self.driver.execute("getElementText")
+        return self._text
+
+    def get_attribute(self, name):
+        self.driver.execute("getElementAttribute")
+        return self.label if name == "aria-label" else None
+
+    def is_displayed(self):
+        self.driver.execute("isElementDisplayed")
+        return True
+
+    def is_enabled(self):
+        self.driver.execute("isElementEnabled")
+        return True
+
+    def click(self):
+        self.driver.execute("clickElement")
+        if self.on_click is not None:
+            self.on_click()
+
+    def send_keys(self, *value):
+        self.driver.execute("sendKeysToElement")
+
+    def find_element(self, by="id", value=None):
+        # Browser always passes absolute XPaths, even from a row element
+        return self.driver.find_element(by, value)
+
+class SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.execute("switchToWindow")
+        self.driver.current_window_handle = handle
+
+    def new_window(self, kind="tab"):
+        self.driver.execute("newWindow")
+        handle = f"tab-{len(self.driver.tab_days) + 1}"
+        self.driver.tab_days[handle] = None
+        self.driver.current_window_handle = handle
+
+class FakeDriver:
+    def __init__(self, bot, site, latency_ms=30, render_ms=400, confirm_ms=600):
+        self.bot = bot
+        self.site = site
+        self.latency_ms = latency_ms
+        self.render_ms = render_ms
+        self.confirm_ms = confirm_ms
+        self.simulated_ms = 0.0
+        self.commands = {}
+        self.element_ids = itertools.count(1)
+        self.page = bot["NAV_HOME"]
+        self.modal_open = False
+        self.current_window_handle = "tab-1"
+        self.tab_days = {"tab-1": None}
+        self.switch_to = SwitchTo(self)
+        self.current_url = "fake://atoz/find-shifts"
+        self.day_pattern = re.compile(re.escape(bot["DAY_SLIDER_XPATH"]) + r"\[(\d+)\]$")
+        self.row_pattern = re.compile(re.escape(bot["SHIFT_ROWS_XPATH"]) + r"\[(\d+)\](.*)$")
+
+    def execute(self, driver_command, params=None):
+        self.commands[driver_command] = self.commands.get(driver_command, 0) + 1
+        self.simulated_ms += self.latency_ms
+        return {"value": None}
+
+    @property
+    def current_day(self):
+        return self.tab_days[self.current_window_handle]
+
+    def open_page(self, page):
+        self.page = page
+        if page != self.bot["NAV_FIND_SHIFTS"]:
+            for handle in self.tab_days:
+                self.tab_days[handle] = None
+
+    def show_day(self, index):
+        self.tab_days[self.current_window_handle] = index
+
+    def find_element(self, by="id", value=None):
+        self.execute("findElement")
+        return self.locate(value)
+
+    def find_elements(self, by="id", value=None):
+        self.execute("findElements")
+        if value == self.bot["SHIFT_ROWS_XPATH"] and self.page == self.bot["NAV_FIND_SHIFTS"]:
+            return [FakeElement(self, f"{value}[{k}]") for k in range(1, len(self.site.rows.get(self.current_day, [])) + 1)]
+        return []
+
+    def locate(self, xpath):
+        bot = self.bot
+        on_find_shifts = self.page == bot["NAV_FIND_SHIFTS"]
+        if xpath == bot["HOMEPAGE_IDENTIFIER"] and self.page == bot["NAV_HOME"]:
+            return FakeElement(self, xpath)
+        if xpath in (bot["MENU_BURGER"], bot["SCHEDULE_NAV_BUTTON"]):
+            return FakeElement(self, xpath)
+        if xpath == bot["FIND_SHIFTS_NAV_LINK"]:
+            return FakeElement(self, xpath, on_click=lambda: self.open_page(bot["NAV_FIND_SHIFTS"]))
+        if xpath == HOME_NAV_ITEM:
+            return FakeElement(self, xpath, on_click=lambda: self.open_page(bot["NAV_HOME"]))
+        if xpath == bot["SUCCESS_DONE_BUTTON"] and self.modal_open:
+            return FakeElement(self, xpath, on_click=self.close_modal)
+
+        day = self.day_pattern.match(xpath or "")
+        if day and on_find_shifts and int(day.group(1)) <= len(self.site.days):
+            index = int(day.group(1))
+            return FakeElement(self, xpath, on_click=lambda: self.show_day(index))
+
+        row = self.row_pattern.match(xpath or "")
+        if row and on_find_shifts:
+            rows = self.site.rows.get(self.current_day, [])
+            k = int(row.group(1))
+            if k <= len(rows):
+                text, claimed = rows[k - 1]
+                if row.group(2) == bot["SHIFT_TIME_XPATH"]:
+                    return FakeElement(self, xpath, text=text)
+                if row.group(2) == bot["SHIFT_BUTTON_XPATH"]:
+                    label, button_text = ("Remove shift", "Remove") if claimed else ("Add shift", "Add")
+                    return FakeElement(self, xpath, text=button_text, label=label, on_click=lambda: self.open_modal(k))
+                return FakeElement(self, xpath)
+        raise NoSuchElementException(f"No fake element for {xpath}")
+
+    def open_modal(self, k):
+        self.modal_open = k
+
+    def close_modal(self):
+        if self.modal_open:
+            self.site.rows[self.current_day][self.modal_open - 1][1] = True
+        self.modal_open = False
+
+    def execute_script(self, script, *args):
+        self.execute("executeScript")
+        bot = self.bot
+        if script is bot["SNAPSHOT_SCRIPT"]:
+            on_find_shifts = self.page == bot["NAV_FIND_SHIFTS"]
+            return {
+                "days": self.site.days if args[0] and on_find_shifts else [],
+                "shifts": self.site.shift_rows(self.current_day) if args[1] and on_find_shifts else [],
+            }
+        if script is bot["NAV_STATE_SCRIPT"]:
+            return bot["NAV_MODAL"] if self.modal_open else self.page
+        if script is bot["CLAIM_SCRIPT"]:
+            row = self.row_pattern.match(args[0])
+            rows = self.site.rows.get(self.current_day, [])
+            k = int(row.group(1)) if row else 0
+            if not 0 < k <= len(rows):
+                return "missing"
+            if rows[k - 1][1]:
+                return "unavailable"
+            self.open_modal(k)
+            return "clicked"
+        if script == "arguments[0].click()":
+            args[0].click()
+        return None
+
+    def execute_async_script(self, script, *args):
+        self.execute("executeAsyncScript")
+        bot = self.bot
+        if script is bot["WAIT_FOR_RENDER_SCRIPT"]:
+            self.simulated_ms += self.render_ms
+            rows = len(self.site.rows.get(self.current_day, []))
+            return {"reason": "settled", "elapsed": self.render_ms, "rows": rows, "fingerprint": self.site.fingerprint(self.current_day)}
+        if script is bot["WAIT_UNTIL_STILL_SCRIPT"]:
+            return {"reason": "still", "elapsed": 0}
+        if script is bot["CONFIRM_CLAIM_SCRIPT"]:
+            self.simulated_ms += self.confirm_ms
+            self.close_modal()
+            return "confirmed"
+        if script is bot["WAIT_FOR_CHANGES_SCRIPT"]:
+            self.simulated_ms += args[0]
+            return []
+        return None
+
+    def set_script_timeout(self, seconds):
+        self.execute("setTimeouts")
+
+    def get(self, url):
+        self.execute("get")
+
+    def refresh(self):
+        self.execute("refresh")
+        self.show_day(None)
+
+    def close(self):
+        self.execute("closeWindow")
+        self.tab_days.pop(self.current_window_handle, None)
+
+    def quit(self):
+        self.execute("quit")
+
+    def get_cookies(self):
+        self.execute("getAllCookies")
+        return []
+
+    def get_log(self, log_type):
+        self.execute("getLog")
+        return []
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self.execute("executeCdpCommand")
+        return {}
+
+def make_browser(bot, site, settings=None, **timing):
+    """Build a real Browser whose driver is a FakeDriver over `site`."""
+    driver = FakeDriver(bot, site, **timing)
+    bot["uc"].Chrome = lambda *args, **kwargs: driver
+    browser = bot["Browser"](settings)
+    return browser, driver
@@ -0,0 +1,102 @@
+"""Idle memory and CPU of the headless service against the Flet GUI launcher.
+
+Starts each launcher with the bot idle (no Chrome), lets it settle, then samples
+the resident memory of its whole process tree (the GUI's Flet client and bot
+worker included) and the CPU time it burns over a fixed window. Linux only, as it
+reads /proc. The GUI needs flet and a display and is skipped if it doesn't come up.
+
+    python benchmarks/footprint.py [--settle 5] [--seconds 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from common import ROOT, write_config
+
+TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+def read_stat(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        # The command name can contain spaces and parentheses; the fields after it can't
+        return f.read().rsplit(")", 1)[1].split()
+
+def process_tree(root):
+    children = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                children.setdefault(int(read_stat(entry)[1]), []).append(int(entry))
+            except (OSError, IndexError):
+                continue
+    tree, pending = [], [root]
+    while pending:
+        pid = pending.pop()
+        tree.append(pid)
+        pending.extend(children.get(pid, []))
+    return tree
+
+def rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+def cpu_seconds(pid):
+    try:
+        fields = read_stat(pid)
+        return (int(fields[11]) + int(fields[12])) / TICKS
+    except (OSError, IndexError):
+        return 0.0
+
+def measure(name, command, env, settle, seconds):
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        time.sleep(settle)
+        if process.poll() is not None:
+            print(f"{name:<28} skipped (exited with {process.returncode} during startup)")
+            return None
+        cpu_before = sum(cpu_seconds(pid) for pid in process_tree(process.pid))
+        samples = []
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            tree = process_tree(process.pid)
+            samples.append((len(tree), sum(rss_mb(pid) for pid in tree)))
+            time.sleep(0.5)
+        cpu = sum(cpu_seconds(pid) for pid in process_tree(process.pid)) - cpu_before
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    processes = max(count for count, _ in samples)
+    peak = max(rss for _, rss in samples)
+    average = sum(rss for _, rss in samples) / len(samples)
+    print(f"{name:<28} {processes:>9} {average:>12.1f} {peak:>10.1f} {cpu / seconds * 100:>8.2f}")
+    return {"processes": processes, "rss_mb": average, "peak_rss_mb": peak, "cpu_percent": cpu / seconds * 100}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--settle", type=float, default=5, help="Seconds to let each launcher start up before sampling")
+    parser.add_argument("--seconds", type=float, default=10, help="Sampling window")
+    args = parser.parse_args()
+    if not os.path.isdir("/proc"):
+        print("This benchmark reads /proc and only runs on Linux.")
+        return
+
+    env = dict(os.environ, ATOZ_CONFIG_FILE=write_config({"SHIFT_STORE": False}))
+    print(f"{'launcher':<28} {'processes':>9} {'avg RSS MB':>12} {'peak MB':>10} {'CPU %':>8}")
+    service = measure("atoz_service.py (idle)", [sys.executable, "atoz_service.py", "--port", "0"], env, args.settle, args.seconds)
+    gui = measure("gui_app.py (idle)", [sys.executable, "gui_app.py"], env, args.settle, args.seconds)
+    if service and gui:
+        print(f"The service uses {gui['rss_mb'] - service['rss_mb']:.0f} MB less memory than the GUI while idle.")
+
+if __name__ == "__main__":
+    main()
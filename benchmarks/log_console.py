@@ -0,0 +1,87 @@
+"""Stress test for the GUI log console model.
+
+Pipes --lines lines from a child process through LogBuffer/Flusher the way
+gui_app.py does, with a plain list standing in for the ListView's controls,
+and reports throughput, UI update count and memory. The old console (one
+control and one page.update() per line, never trimmed) is measured the same
+way for comparison.
+
+    python benchmarks/log_console.py [--lines 1000000] [--cap 2000] [--fps 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from log_buffer import LogBuffer, Flusher
+
+PRODUCER = "import sys\nfor k in range({count}):\n    sys.stdout.write(f'--- Checking Day {{k % 30}}: Monday, Oct 19 --- line {{k}}\\n')\n"
+
+def spawn(count):
+    return subprocess.Popen(
+        [sys.executable, "-c", PRODUCER.format(count=count)],
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+
+def run_buffered(count, cap, fps, spill_path):
+    controls = []
+    updates = [0]
+
+    def show_lines(lines, overflow):
+        controls.extend(lines)
+        if overflow:
+            del controls[:max(0, len(controls) - cap)]
+        updates[0] += 1
+
+    buffer = LogBuffer(cap, spill_path)
+    flusher = Flusher(buffer, show_lines, fps).start()
+    proc = spawn(count)
+    reader = threading.Thread(target=buffer.read_stream, args=(proc.stdout,), daemon=True)
+    reader.start()
+    reader.join()
+    proc.wait()
+    flusher.stop()
+    buffer.close()
+    return updates[0], controls, buffer.received
+
+def run_legacy(count):
+    controls = []
+    updates = 0
+    proc = spawn(count)
+    for line in proc.stdout:
+        controls.append(line.strip())
+        updates += 1
+    proc.wait()
+    return updates, controls, updates
+
+def measure(name, run, *args):
+    tracemalloc.start()
+    started = time.perf_counter()
+    updates, controls, received = run(*args)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} {received:>9} lines in {elapsed:6.2f}s  {updates:>9} UI updates  "
+          f"{len(controls):>9} lines held  {current / 2**20:7.1f} MiB retained  {peak / 2**20:7.1f} MiB peak")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--cap", type=int, default=2000)
+    parser.add_argument("--fps", type=int, default=10)
+    parser.add_argument("--spill", default=None, help="Also spill every line to this file")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    measure("buffered", run_buffered, args.lines, args.cap, args.fps, args.spill)
+    if not args.skip_legacy:
+        measure("legacy", run_legacy, args.lines)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Cost of the Metrics instrumentation with metrics disabled and enabled.
+
+Times the calls the scanning loop makes (Metrics.count, a @metered method and
+the round-trip counting wrapper around driver.execute) against an
+uninstrumented baseline, then scales the per-call cost to a typical sweep.
+
+    python benchmarks/metrics_overhead.py [--calls 1000000] [--days 30]
+"""
+import argparse
+import time
+
+from common import load_bot
+
+class Driver:
+    """Just enough of a WebDriver for Browser.count_round_trips to wrap."""
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+class Host:
+    def __init__(self):
+        self.driver = Driver()
+        self.round_trips = 0
+
+def per_call_ns(function, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - started) / calls * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=30, help="Days per sweep for the per-sweep estimate")
+    args = parser.parse_args()
+
+    bot = load_bot()
+    metrics = bot["metrics"]
+
+    def plain():
+        return None
+
+    metered = bot["metered"]("bench")(plain)
+
+    baseline_host = Host()
+    raw_execute = baseline_host.driver.execute
+    host = Host()
+    bot["Browser"].count_round_trips(host)
+
+    def count():
+        metrics.count("rows_evaluated_total", 5)
+
+    def count_labelled():
+        metrics.count("days_scanned_total", result="read")
+
+    def execute():
+        host.driver.execute("executeScript")
+
+    def raw():
+        raw_execute("executeScript")
+
+    cases = [
+        ("function call (baseline)", plain),
+        ("Metrics.count", count),
+        ("Metrics.count with labels", count_labelled),
+        ("@metered call", metered),
+        ("driver.execute (unwrapped)", raw),
+        ("driver.execute (wrapped)", execute),
+    ]
+    results = {}
+    for enabled in (False, True):
+        metrics.enabled = enabled
+        for name, function in cases:
+            results[(name, enabled)] = per_call_ns(function, args.calls)
+
+    print(f"{'':<28} {'disabled':>10} {'enabled':>10}   (ns per call)")
+    for name, _ in cases:
+        print(f"{name:<28} {results[(name, False)]:>10.0f} {results[(name, True)]:>10.0f}")
+
+    # Rough shape of one sweep: ~4 WebDriver commands and 3 counters per day, plus a handful of timers
+    commands, counters, timers = 4 * args.days, 3 * args.days, 2 * args.days + 4
+    for enabled in (False, True):
+        label = "enabled" if enabled else "disabled"
+        overhead = (
+            commands * (results[("driver.execute (wrapped)", enabled)] - results[("driver.execute (unwrapped)", enabled)])
+            + counters * results[("Metrics.count with labels", enabled)]
+            + timers * (results[("@metered call", enabled)] - results[("function call (baseline)", enabled)])
+        )
+        print(f"Estimated overhead per {args.days}-day sweep, metrics {label}: {overhead / 1000:.1f} us")
+
+if __name__ == "__main__":
+    main()
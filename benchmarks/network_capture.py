@@ -0,0 +1,54 @@
+"""Check that network capture decodes the same shifts the page renders.
+
+Starts benchmarks/fake_atoz.py, opens its SPA in Chrome through Browser with
+NETWORK_CAPTURE on, and compares the shifts decoded from the captured JSON with
+the rows scraped from the DOM day by day.
+
+    python benchmarks/network_capture.py [--days 7] [--rows 5]
+"""
+import argparse
+import time
+
+import fake_atoz
+from common import load_bot
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--rows", type=int, default=5)
+    args = parser.parse_args()
+
+    server, base_url = fake_atoz.start_server()
+    bot = load_bot({"SHIFT_STORE": False, "NETWORK_CAPTURE": True})
+    browser = bot["Browser"](bot["config"].snapshot())
+    try:
+        source = browser.network_source
+        source.begin_sweep()
+        browser.driver.get(f"{base_url}/find-shifts?source=api&days={args.days}&rows={args.rows}")
+        day_map = browser.read_day_map()
+
+        started = time.perf_counter()
+        source.poll()
+        network_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        mismatches = 0
+        for i, (current_dt, weekday) in day_map.items():
+            browser.driver.find_element(bot["By"].XPATH, f"{bot['DAY_SLIDER_XPATH']}[{i}]").click()
+            time.sleep(0.5)
+            dom = sorted(shift.text for shift in map(bot["Shift"].from_row, browser.read_shifts()) if shift)
+            network = sorted(shift.text for shift in source.shifts_for(current_dt.date()))
+            if dom != network:
+                mismatches += 1
+                print(f"{weekday} {current_dt:%b %d}: DOM {dom} != network {network}")
+        dom_time = time.perf_counter() - started
+    finally:
+        browser.exit()
+        server.shutdown()
+
+    print(f"Decoded {sum(len(day) for day in source.shifts_by_date.values())} shifts from {source.payloads} payloads "
+          f"in {network_time * 1000:.0f} ms; clicking through the DOM took {dom_time * 1000:.0f} ms.")
+    print("Network and DOM agree on every day." if not mismatches else f"{mismatches} days disagree.")
+
+if __name__ == "__main__":
+    main()
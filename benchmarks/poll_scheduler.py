@@ -0,0 +1,97 @@
+"""Offline simulation of the adaptive PollScheduler against fixed-interval polling.
+
+Generates a synthetic release timeline (a few weekly hot hours plus random
+one-off releases), replays it against each polling policy, and reports how
+many sweeps each policy made and how long releases waited to be detected.
+Shifts stay claimable for --lifetime minutes; releases nobody polled in time
+count as missed.
+
+    python benchmarks/poll_scheduler.py [--weeks 8] [--warmup 4] [--lifetime 10]
+"""
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from common import load_bot
+
+# (weekday, hour) pairs when the site reliably posts new shifts
+HOT_HOURS = [(1, 14), (3, 9), (4, 18)]
+
+def release_timeline(start, weeks, noise_per_week, seed):
+    rng = random.Random(seed)
+    releases = []
+    for week in range(weeks):
+        week_start = start + timedelta(weeks=week)
+        for weekday, hour in HOT_HOURS:
+            if rng.random() < 0.9:
+                releases.append(week_start + timedelta(days=weekday, hours=hour, minutes=rng.uniform(0, 60)))
+        for _ in range(noise_per_week):
+            releases.append(week_start + timedelta(minutes=rng.uniform(0, 7 * 24 * 60)))
+    return sorted(releases)
+
+def simulate(releases, start, end, lifetime, next_delay, record):
+    """Poll from start to end; return (sweeps, detection delays in seconds, missed releases)."""
+    now = start
+    pending = list(releases)
+    sweeps = 0
+    delays = []
+    missed = 0
+    while now < end:
+        sweeps += 1
+        new = 0
+        while pending and pending[0] <= now:
+            released = pending.pop(0)
+            if now - released <= lifetime:
+                delays.append((now - released).total_seconds())
+                new += 1
+            else:
+                missed += 1
+        record(now, new)
+        now += timedelta(seconds=next_delay(now))
+    return sweeps, delays, missed + len(pending)
+
+def summarize(name, sweeps, delays, missed):
+    delays = sorted(delays)
+    if delays:
+        p50 = delays[len(delays) // 2]
+        p90 = delays[int((len(delays) - 1) * 0.9)]
+        detail = f"p50 {p50:6.1f}s  p90 {p90:6.1f}s"
+    else:
+        detail = "no detections"
+    print(f"{name:<28} {sweeps:>8} sweeps  {len(delays):>4} detected  {missed:>3} missed  {detail}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--weeks", type=int, default=8, help="Length of the synthetic timeline")
+    parser.add_argument("--warmup", type=int, default=4, help="Weeks the scheduler learns from before measuring")
+    parser.add_argument("--lifetime", type=float, default=10, help="Minutes a released shift stays claimable")
+    parser.add_argument("--noise", type=int, default=5, help="Random one-off releases per week")
+    parser.add_argument("--fixed", type=float, nargs="+", default=[15, 60], help="Fixed intervals to compare against")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    bot = load_bot()
+    settings = bot["normalize_config"](bot["DEFAULT_CONFIG"])
+
+    start = datetime(2026, 1, 5)
+    measured_from = start + timedelta(weeks=args.warmup)
+    end = start + timedelta(weeks=args.weeks)
+    lifetime = timedelta(minutes=args.lifetime)
+    releases = release_timeline(start, args.weeks, args.noise, args.seed)
+    measured = [released for released in releases if released >= measured_from]
+    print(f"{len(releases)} releases over {args.weeks} weeks; measuring the last {args.weeks - args.warmup} weeks ({len(measured)} releases).")
+
+    for seconds in args.fixed:
+        summarize(f"fixed {seconds:g}s", *simulate(measured, measured_from, end, lifetime, lambda now: seconds, lambda now, new: None))
+
+    scheduler = bot["PollScheduler"].from_config(settings)
+    scheduler.rng = random.Random(args.seed)
+    # Warm-up weeks only train the histogram; their sweeps aren't counted
+    simulate([released for released in releases if released < measured_from], start, measured_from, lifetime, scheduler.next_delay, scheduler.record)
+    hot = sum(1 for bucket in range(bot["HOURS_PER_WEEK"]) if scheduler.is_hot(bucket))
+    name = f"adaptive {settings['POLL_MIN_SECONDS']:g}-{settings['POLL_MAX_SECONDS']:g}s"
+    summarize(name, *simulate(measured, measured_from, end, lifetime, scheduler.next_delay, scheduler.record))
+    print(f"Scheduler learned {hot} hot hours of the week.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Chrome launch time and profile size, with the bot's profile as it is and after pruning.
+
+Every launch runs on a fresh copy of the profile (the real one is never touched):
+Browser() is built against it as the bot would, timing uc.Chrome() and the whole
+constructor, which also loads the login page. The copy is then pruned with
+prune_profile() and timed again. Needs Chrome, and a profile that has been used
+for a while to show a difference. --cache-dir also moves the disk cache there
+(DISK_CACHE_DIR), e.g. /dev/shm on Linux.
+
+    python benchmarks/profile_launch.py [--profile ChromeBotProfile] [--launches 3] [--cache-dir /dev/shm]
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from common import ROOT, load_bot
+
+# Chrome's single-instance locks; a copy taken while the bot runs would otherwise look in use
+LOCKS = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile")
+
+def launch(bot, settings):
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        browser = bot["Browser"](settings)
+    total = time.perf_counter() - started
+    browser.driver.quit()
+    return browser.launch_time, total
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", default=os.path.join(ROOT, "ChromeBotProfile"))
+    parser.add_argument("--launches", type=int, default=3)
+    parser.add_argument("--cache-dir", default="", help="DISK_CACHE_DIR for the launches")
+    args = parser.parse_args()
+    if not os.path.isdir(args.profile):
+        print(f"No Chrome profile at {args.profile}. Run the bot once, or pass --profile.")
+        return
+
+    workspace = tempfile.mkdtemp(prefix="atoz-profile-")
+    copy = os.path.join(workspace, "ChromeBotProfile")
+    bot = load_bot({"SHIFT_STORE": False, "PROFILE_PRUNE": False, "DISK_CACHE_DIR": args.cache_dir}, profile=copy)
+    settings = bot["config"].snapshot()
+
+    try:
+        print(f"{'profile':<8} {'size MB':>9} {'uc.Chrome() s':>15} {'Browser() s':>13}")
+        for label, prune in (("as is", False), ("pruned", True)):
+            sizes, starts, totals = [], [], []
+            for _ in range(args.launches):
+                shutil.rmtree(copy, ignore_errors=True)
+                shutil.copytree(args.profile, copy, symlinks=True, ignore=shutil.ignore_patterns(*LOCKS))
+                if prune:
+                    bot["prune_profile"](copy)
+                sizes.append(bot["path_size"](copy) / 1024 / 1024)
+                chrome, total = launch(bot, settings)
+                starts.append(chrome)
+                totals.append(total)
+            print(f"{label:<8} {statistics.median(sizes):>9.0f} {statistics.median(starts):>15.2f} {statistics.median(totals):>13.2f}")
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Startup cost of the bot: import time, and how long Start takes to reach the first sweep.
+
+Compares the old Start, which spawned a fresh interpreter that ran AtoZ-Bot.py
+(gui_app.py --run-bot), with the persistent worker (gui_app.py --bot-worker) that
+the GUI spawns once and then tells to start. Browser construction, login and the
+first find_shifts run for real, against fake_driver.FakeDriver instead of Chrome,
+so the numbers are Python-side startup cost only.
+
+--frozen times a PyInstaller build's worker: spawn until ready, then loading
+AtoZ-Bot.py from the bundle. That needs no Chrome; starting a sweep in a frozen
+build does, so first-sweep latency is only measured for the dev layout.
+
+    python benchmarks/startup.py [--starts 3] [--frozen dist/Amazon_Shift_Picker/Amazon_Shift_Picker]
+"""
+import argparse
+import json
+import os
+import queue
+import runpy
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from common import BOT_SCRIPT, ROOT, write_config
+
+BENCH_CONFIG = {
+    "WEEKDAYS": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+    "CLICK_PAUSE_SECONDS": [0, 0],
+    "SHIFT_STORE": False,
+    "SECONDS_BETWEEN_CHECKS": 3600,
+}
+SITE_DAYS, SITE_ROWS = 14, 20
+SWEEP_DONE = "WebDriver round trips"
+
+def install_fake_chrome(bot):
+    from fake_driver import FakeDriver, FakeSite
+    site = FakeSite(bot, SITE_DAYS, SITE_ROWS)
+    bot["uc"].Chrome = lambda *args, **kwargs: FakeDriver(bot, site)
+
+def child_import():
+    """Print how long loading AtoZ-Bot.py and then importing the browser modules takes in this interpreter."""
+    started = time.perf_counter()
+    bot = runpy.run_path(BOT_SCRIPT, run_name="atoz_bot")
+    loaded = time.perf_counter()
+    bot["uc"].resolve()
+    bot["webdriver"].resolve()
+    bot["EC"].resolve()
+    print(json.dumps({"load_s": loaded - started, "browser_imports_s": time.perf_counter() - loaded}))
+
+def child_run_bot():
+    # What --run-bot did on every Start, with main() left running until the parent kills it
+    bot = runpy.run_path(BOT_SCRIPT, run_name="atoz_bot")
+    install_fake_chrome(bot)
+    bot["main"]()
+
+def child_worker():
+    sys.path.insert(0, ROOT)
+    import bot_worker
+
+    class FakeChromeRunner(bot_worker.BotRunner):
+        def load(self):
+            fresh = self.bot is None
+            bot = super().load()
+            if fresh:
+                install_fake_chrome(bot)
+            return bot
+
+    bot_worker.serve(FakeChromeRunner(BOT_SCRIPT))
+
+class Child:
+    """A child process whose stdout lines are timestamped as they arrive."""
+
+    def __init__(self, command, env):
+        self.started = time.perf_counter()
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, env=env)
+        self.lines = queue.SimpleQueue()
+        threading.Thread(target=self.read, daemon=True).start()
+
+    def read(self):
+        for line in self.process.stdout:
+            self.lines.put((time.perf_counter(), line.rstrip("\n")))
+        self.lines.put((time.perf_counter(), None))
+
+    def wait_for(self, text, timeout=120):
+        """Time at which a line containing `text` appeared."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                at, line = self.lines.get(timeout=max(0.01, deadline - time.perf_counter()))
+            except queue.Empty:
+                raise TimeoutError(f"no {text!r} within {timeout}s")
+            if line is None:
+                raise RuntimeError(f"child exited before printing {text!r}")
+            if text in line:
+                return at
+
+    def send(self, message):
+        self.process.stdin.write(json.dumps(message) + "\n")
+        self.process.stdin.flush()
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+def summary(values):
+    return f"median {statistics.median(values) * 1000:7.0f} ms  (min {min(values) * 1000:.0f}, max {max(values) * 1000:.0f}, n={len(values)})"
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        {"import": child_import, "run-bot": child_run_bot, "worker": child_worker}[sys.argv[2]]()
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--starts", type=int, default=3, help="Start presses to time for each mode")
+    parser.add_argument("--frozen", help="Path to a PyInstaller build of gui_app.py")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONUNBUFFERED="1", ATOZ_CONFIG_FILE=write_config(BENCH_CONFIG))
+    env.pop("ATOZ_EVENT_PORT", None)
+    me = [sys.executable, "-u", os.path.abspath(__file__), "--child"]
+    results = {}
+
+    imports = []
+    for _ in range(args.starts):
+        output = subprocess.run(me + ["import"], capture_output=True, text=True, env=env, check=True).stdout
+        imports.append(json.loads(output.strip().splitlines()[-1]))
+    results["load_s"] = [run["load_s"] for run in imports]
+    results["browser_imports_s"] = [run["browser_imports_s"] for run in imports]
+    print(f"Load AtoZ-Bot.py               {summary(results['load_s'])}")
+    print(f"  then import selenium + uc    {summary(results['browser_imports_s'])}")
+
+    cold = []
+    for _ in range(args.starts):
+        child = Child(me + ["run-bot"], env)
+        try:
+            cold.append(child.wait_for(SWEEP_DONE) - child.started)
+        finally:
+            child.close()
+    results["spawn_per_start_first_sweep_s"] = cold
+    print(f"Start -> first sweep, new process per Start   {summary(cold)}")
+
+    child = Child(me + ["worker"], env)
+    try:
+        results["worker_ready_s"] = child.wait_for("Bot worker ready.") - child.started
+        sent = time.perf_counter()
+        child.send({"cmd": "load"})
+        results["worker_load_s"] = child.wait_for("Loaded AtoZ-Bot.py") - sent
+        warm = []
+        for _ in range(args.starts):
+            sent = time.perf_counter()
+            child.send({"cmd": "start"})
+            warm.append(child.wait_for(SWEEP_DONE) - sent)
+            child.send({"cmd": "stop"})
+            child.wait_for("--- Bot stopped ---")
+        child.send({"cmd": "exit"})
+    finally:
+        child.close()
+    results["worker_first_sweep_s"] = warm
+    print(f"Worker spawn until ready       {results['worker_ready_s'] * 1000:7.0f} ms, load {results['worker_load_s'] * 1000:.0f} ms (both once per GUI session)")
+    print(f"Start -> first sweep, persistent worker       first {warm[0] * 1000:.0f} ms" + (f", then {summary(warm[1:])}" if len(warm) > 1 else ""))
+
+    if args.frozen:
+        frozen = Child([args.frozen, "--bot-worker"], env)
+        try:
+            results["frozen_worker_ready_s"] = frozen.wait_for("Bot worker ready.") - frozen.started
+            sent = time.perf_counter()
+            frozen.send({"cmd": "load"})
+            results["frozen_worker_load_s"] = frozen.wait_for("Loaded AtoZ-Bot.py") - sent
+            frozen.send({"cmd": "exit"})
+        finally:
+            frozen.close()
+        print(f"Frozen worker spawn until ready {results['frozen_worker_ready_s'] * 1000:7.0f} ms, load {results['frozen_worker_load_s'] * 1000:.0f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
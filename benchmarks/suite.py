@@ -0,0 +1,188 @@
+"""Offline benchmark suite for the filter helpers and Browser sweeps.
+
+Runs parse_hour/time_diff against the compiled ShiftFilter, then find_shifts and a
+full sweep (find_shifts + back_home) at several slider sizes, in bulk and
+per-element extraction modes. Sweeps run against fake_driver.FakeDriver, which
+counts WebDriver round trips and adds up simulated browser time (--latency per
+command, --render per day click) without sleeping, so the numbers repeat from run
+to run. With --browser the sweeps also run in a real Chrome against
+fixtures/find_shifts.html, whose day clicks wait --render ms before drawing rows.
+
+    python benchmarks/suite.py [--sizes 7x5 14x20 30x100] [--output results.json] [--compare old.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+from bench_filter import compiled_filter, legacy_filter, synthetic_rows, timed
+from common import FIXTURE, ROOT, load_bot
+from fake_driver import FakeSite, make_browser
+
+# Settings the sweeps run with, so results don't depend on the user's config.json
+BENCH_CONFIG = {
+    "WEEKDAYS": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+    "CLICK_PAUSE_SECONDS": [0, 0],
+    "SHIFT_STORE": False,
+    "NETWORK_CAPTURE": False,
+    "SCAN_TABS": 1,
+    "RESIDENT_MODE": False,
+    "INCREMENTAL_SWEEP": False,
+}
+
+# Metrics where a bigger number is a regression; everything is compared, these are just flagged
+LOWER_IS_BETTER = ("ns_per_row", "python_ms", "simulated_ms", "round_trips", "wall_ms")
+
+def parse_size(text):
+    days, _, rows = text.partition("x")
+    return int(days), int(rows)
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def bench_filter_helpers(bot, rows, repeat):
+    """ns per row for the legacy parse_hour/time_diff checks and for the compiled ShiftFilter."""
+    # The legacy checks want the raw config text; ShiftFilter wants the normalized snapshot
+    raw = {**bot["DEFAULT_CONFIG"], **BENCH_CONFIG}
+    shift_filter = bot["ShiftFilter"].from_config(bot["normalize_config"](raw))
+    synthetic = synthetic_rows(rows)
+    rows_by_day = {}
+    for row in synthetic:
+        rows_by_day.setdefault(row["day"], []).append(row)
+
+    results = []
+    cases = (
+        ("parse_hour+time_diff", legacy_filter, (bot, raw, synthetic)),
+        ("ShiftFilter", compiled_filter, (bot, shift_filter, rows_by_day)),
+    )
+    for name, function, function_args in cases:
+        best = min(timed(function, *function_args)[1] for _ in range(repeat))
+        results.append({"name": f"filter/{name}/{rows}", "ns_per_row": best / rows * 1e9})
+    return results
+
+def run_sweep(bot, days, rows, seed, latency, render, full):
+    site = FakeSite(bot, days, rows, seed)
+    browser, driver = make_browser(bot, site, latency_ms=latency, render_ms=render)
+    trips, simulated = browser.round_trips, driver.simulated_ms
+    started = time.perf_counter()
+    matches = browser.find_shifts()
+    if full:
+        browser.back_home()
+    elapsed = time.perf_counter() - started
+    return {
+        "round_trips": browser.round_trips - trips,
+        "simulated_ms": driver.simulated_ms - simulated,
+        "python_ms": elapsed * 1000,
+        "matches": len(matches),
+        "claimed": sum(1 for rows in site.rows.values() for _, claimed in rows if claimed),
+    }
+
+def bench_sweeps(bot, sizes, args):
+    results = []
+    for days, rows in sizes:
+        for bulk in (True, False):
+            bot["config"].apply_overrides({"BULK_EXTRACTION": bulk})
+            mode = "bulk" if bulk else "per-element"
+            for kind, full in (("find_shifts", False), ("sweep", True)):
+                runs = [run_sweep(bot, days, rows, args.seed, args.latency, args.render, full) for _ in range(args.repeat)]
+                result = dict(runs[0])
+                result["python_ms"] = statistics.median(run["python_ms"] for run in runs)
+                results.append({"name": f"{kind}/{mode}/{days}x{rows}", **result})
+    bot["config"].apply_overrides({"BULK_EXTRACTION": True})
+    return results
+
+def bench_browser(bot, sizes, args):
+    """Real-Chrome sweeps against the fixture page; slow, and only as repeatable as Chrome is."""
+    bot["config"].apply_overrides({"RESIDENT_MODE": True, "RESIDENT_RELOAD_EVERY": 0})
+    browser = bot["Browser"]()
+    results = []
+    try:
+        for days, rows in sizes:
+            browser.driver.get(f"{FIXTURE}?days={days}&rows={rows}&latency={args.render:g}&seed={args.seed}")
+            trips = browser.round_trips
+            started = time.perf_counter()
+            matches = browser.find_shifts()
+            results.append({
+                "name": f"browser/find_shifts/{days}x{rows}",
+                "round_trips": browser.round_trips - trips,
+                "wall_ms": (time.perf_counter() - started) * 1000,
+                "matches": len(matches),
+            })
+    finally:
+        browser.driver.quit()
+        bot["config"].apply_overrides({"RESIDENT_MODE": False})
+    return results
+
+def compare(report, previous):
+    old = {case["name"]: case for case in previous["cases"]}
+    print(f"\nCompared with {previous.get('commit') or 'previous run'} ({previous.get('created', '?')}):")
+    if previous.get("settings") != report["settings"]:
+        print(f"  Note: settings differ ({previous.get('settings')} before), so simulated times are not like for like.")
+    for case in report["cases"]:
+        before = old.get(case["name"])
+        if before is None:
+            continue
+        for key in LOWER_IS_BETTER:
+            if key in case and before.get(key):
+                change = (case[key] - before[key]) / before[key] * 100
+                flag = "  <-- slower" if change > 10 else ""
+                print(f"  {case['name']:<36} {key:<13} {before[key]:>12.1f} -> {case[key]:>12.1f}  ({change:+.1f}%){flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=["7x5", "14x20", "30x100"], help="Slider sizes as DAYSxROWS")
+    parser.add_argument("--filter-rows", type=int, default=100_000, help="Rows for the filter helper microbenchmark")
+    parser.add_argument("--latency", type=float, default=30, help="Simulated ms per WebDriver command")
+    parser.add_argument("--render", type=float, default=400, help="Simulated (or, with --browser, real) ms for a day's rows to render")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--browser", action="store_true", help="Also sweep the fixture page in a real Chrome")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Print the change against an earlier --output file")
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes]
+    bot = load_bot(BENCH_CONFIG)
+    bot["config"].snapshot()
+
+    results = bench_filter_helpers(bot, args.filter_rows, args.repeat)
+    # Sweeps print their own progress; keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        results += bench_sweeps(bot, sizes, args)
+        if args.browser:
+            results += bench_browser(bot, sizes, args)
+
+    print(f"{'case':<36} {'round trips':>11} {'simulated ms':>13} {'python ms':>10} {'matches':>8}")
+    for case in results:
+        if "ns_per_row" in case:
+            print(f"{case['name']:<36} {case['ns_per_row']:>47.0f} ns/row")
+            continue
+        simulated = case.get("simulated_ms", case.get("wall_ms", 0))
+        python_ms = case.get("python_ms", 0)
+        print(f"{case['name']:<36} {case['round_trips']:>11} {simulated:>13.0f} {python_ms:>10.1f} {case['matches']:>8}")
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "settings": {"latency_ms": args.latency, "render_ms": args.render, "repeat": args.repeat, "seed": args.seed},
+        "cases": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+if __name__ == "__main__":
+    main()
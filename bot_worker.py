@@ -0,0 +1,106 @@
+import json
+import runpy
+import sys
+import threading
+import time
+import traceback
+
+# Long-lived bot process for gui_app.py. The GUI spawns it once and writes one JSON command
+# per line to its stdin:
+#   {"cmd": "load"}                       load AtoZ-Bot.py now so the first Start doesn't wait for it
+#   {"cmd": "start"} / {"cmd": "stop"}    run main() on a thread / end it at the next wait or day
+#   {"cmd": "exit"}
+# AtoZ-Bot.py is loaded once and kept, so a second Start only has to build a new Browser.
+# Settings aren't sent here: the GUI saves config.json and the bot reloads it when it changes.
+
+class BotRunner:
+    def __init__(self, bot_script):
+        self.bot_script = bot_script
+        self.bot = None
+        self.thread = None
+        self.lock = threading.Lock()
+        # A Start that arrived while the last run was still stopping; a Stop cancels it
+        self.start_pending = False
+        self.restart = None
+        self.state_lock = threading.Lock()
+
+    def load(self):
+        with self.lock:
+            if self.bot is None:
+                started = time.perf_counter()
+                self.bot = runpy.run_path(self.bot_script, run_name="atoz_bot")
+                print(f"Loaded AtoZ-Bot.py in {time.perf_counter() - started:.2f}s.")
+        return self.bot
+
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        if self.running():
+            if not self.bot["stop_requested"].is_set():
+                print("Bot is already running.")
+                return
+            # Stop was pressed but the last run hasn't reached a stopping point yet. Wait for it off
+            # the command thread, which has to stay free for Stop and exit meanwhile.
+            with self.state_lock:
+                self.start_pending = True
+            if self.restart is None or not self.restart.is_alive():
+                print("Waiting for the last run to stop before starting again.")
+                self.restart = threading.Thread(target=self.start_after, args=(self.thread,), daemon=True)
+                self.restart.start()
+            return
+        self.launch()
+
+    def start_after(self, thread):
+        thread.join()
+        self.launch(pending_only=True)
+
+    def launch(self, pending_only=False):
+        bot = self.load()
+        with self.state_lock:
+            if pending_only and not self.start_pending:
+                return
+            self.start_pending = False
+            bot["stop_requested"].clear()
+            self.thread = threading.Thread(target=self.run, args=(bot,), daemon=True)
+            self.thread.start()
+
+    def run(self, bot):
+        try:
+            bot["main"]()
+        except SystemExit:
+            pass
+        except Exception:
+            traceback.print_exc()
+        print("--- Bot stopped ---")
+
+    def stop(self, timeout=None):
+        with self.state_lock:
+            self.start_pending = False
+            if self.bot is not None:
+                self.bot["stop_requested"].set()
+        if timeout is not None and self.running():
+            self.thread.join(timeout)
+
+def serve(runner, commands=None):
+    """Run commands from `commands` (stdin by default) until "exit" or EOF."""
+    print("Bot worker ready.")
+    for line in commands or sys.stdin:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        command = message.get("cmd")
+        try:
+            if command == "load":
+                runner.load()
+            elif command == "start":
+                runner.start()
+            elif command == "stop":
+                runner.stop()
+            elif command == "exit":
+                break
+        except Exception:
+            traceback.print_exc()
+    # EOF means the GUI went away; give the bot a moment to close Chrome cleanly
+    runner.stop(timeout=30)
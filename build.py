@@ -17,6 +17,7 @@ def build_executable():
         '--noconfirm',
         '--add-data=config.json;.', # Default Config
         '--add-data=AtoZ-Bot.py;.', # Bot Script itself
+        '--hidden-import=shift_clock', # Imported by the bot script, which PyInstaller doesn't analyze
         '--collect-all=selenium',
         '--collect-all=undetected_chromedriver',
         '--hidden-import=requests',
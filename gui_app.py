@@ -1,12 +1,17 @@
 import sys
 import os
 
-if len(sys.argv) > 1 and sys.argv[1] == '--run-bot':
+if len(sys.argv) > 1 and sys.argv[1] in ('--run-bot', '--bot-worker'):
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True, write_through=True)
     sys.stderr = sys.stdout
-    import runpy
     bot_script = os.path.join(sys._MEIPASS, "AtoZ-Bot.py") if getattr(sys, 'frozen', False) else os.path.join(os.path.dirname(os.path.abspath(__file__)), "AtoZ-Bot.py")
+    if sys.argv[1] == '--bot-worker':
+        # One process for the whole GUI session, driven over stdin (see bot_worker.py)
+        import bot_worker
+        bot_worker.serve(bot_worker.BotRunner(bot_script))
+        sys.exit(0)
+    import runpy
     try:
         runpy.run_path(bot_script, run_name="__main__")
     except Exception as e:
@@ -17,8 +22,10 @@ if len(sys.argv) > 1 and sys.argv[1] == '--run-bot':
 import flet as ft
 import json
 import subprocess
+import socket
 import threading
 import traceback
+from log_buffer import LogBuffer, Flusher
 
 def get_base_path():
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -62,8 +69,11 @@ def load_config():
     return {}
 
 def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
+    # A running bot reloads config.json when it changes, so never let it see half a file
+    temporary = f"{CONFIG_FILE}.tmp"
+    with open(temporary, "w") as f:
         json.dump(config, f, indent=4)
+    os.replace(temporary, CONFIG_FILE)
 
 def main(page: ft.Page):
     page.title = "Amazon Shift Picker Pro"
@@ -105,51 +115,146 @@ def main(page: ft.Page):
         cb = ft.Checkbox(label=day, value=(day in selected_days), fill_color=ft.Colors.PRIMARY, on_change=lambda e: handle_save())
         weekdays_controls.append(cb)
 
-    bot_process = None
+    worker = None
 
     log_output = ft.ListView(expand=True, spacing=5, auto_scroll=True)
+
+    # The console holds at most LOG_MAX_LINES controls and is redrawn at most LOG_FPS times a second;
+    # LOG_FILE, if set, keeps the whole history on disk
+    log_file = config.get("LOG_FILE") or None
+    if log_file and not os.path.isabs(log_file):
+        log_file = os.path.join(os.path.dirname(CONFIG_FILE), log_file)
+    log_buffer = LogBuffer(config.get("LOG_MAX_LINES", 2000), log_file)
+
+    def show_lines(lines, overflow):
+        log_output.controls.extend(ft.Text(line, selectable=True, font_family="Consolas") for line in lines)
+        if overflow:
+            del log_output.controls[:max(0, len(log_output.controls) - log_buffer.capacity)]
+        page.update()
+
+    log_flusher = Flusher(log_buffer, show_lines, config.get("LOG_FPS", 10)).start()
     
     def log_message(msg):
-        log_output.controls.append(ft.Text(msg, selectable=True, font_family="Consolas"))
+        log_buffer.append(msg)
+
+    # The bot connects back to this socket (ATOZ_EVENT_PORT) and sends one JSON event per line
+    event_server = socket.create_server(("127.0.0.1", 0))
+    event_buffer = LogBuffer(500)
+    stats = {"sweeps": 0, "days": 0, "matches": 0, "claimed": 0, "failed": 0, "errors": 0}
+    sweep_durations = []
+
+    def accept_events():
+        while True:
+            try:
+                connection, _ = event_server.accept()
+            except OSError:
+                return
+            threading.Thread(target=read_events, args=(connection,), daemon=True).start()
+
+    def read_events(connection):
+        try:
+            with connection.makefile("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event_buffer.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+
+    def stat_tile(label):
+        value = ft.Text("0", size=20, weight=ft.FontWeight.BOLD, color=ft.Colors.PRIMARY)
+        tile = ft.Container(content=ft.Column([value, ft.Text(label, size=11, color=ft.Colors.ON_SURFACE)], spacing=2), expand=True)
+        return value, tile
+
+    sweeps_text, sweeps_tile = stat_tile("Sweeps")
+    last_sweep_text, last_sweep_tile = stat_tile("Last Sweep")
+    days_text, days_tile = stat_tile("Days Scanned")
+    matches_text, matches_tile = stat_tile("Matches")
+    claims_text, claims_tile = stat_tile("Claimed / Failed")
+    errors_text, errors_tile = stat_tile("Errors")
+    sweep_series = ft.LineChartData(data_points=[], stroke_width=2, color=ft.Colors.PRIMARY, curved=True)
+    sweep_chart = ft.LineChart(data_series=[sweep_series], min_y=0, expand=True)
+
+    def show_events(batch, overflow):
+        for event in batch:
+            kind = event.get("type")
+            if kind == "sweep_end":
+                stats["sweeps"] += 1
+                sweep_durations.append(event.get("duration", 0))
+                last_sweep_text.value = f"{event.get('duration', 0):.1f}s"
+            elif kind == "day_scanned":
+                stats["days"] += 1
+            elif kind == "shift_matched":
+                stats["matches"] += 1
+            elif kind == "claim":
+                stats["claimed" if event.get("outcome") == "confirmed" else "failed"] += 1
+            elif kind == "error":
+                stats["errors"] += 1
+        # Chart the last 50 sweep durations
+        del sweep_durations[:-50]
+        sweep_series.data_points = [ft.LineChartDataPoint(k, seconds) for k, seconds in enumerate(sweep_durations)]
+        sweeps_text.value = str(stats["sweeps"])
+        days_text.value = str(stats["days"])
+        matches_text.value = str(stats["matches"])
+        claims_text.value = f"{stats['claimed']} / {stats['failed']}"
+        errors_text.value = str(stats["errors"])
         page.update()
 
+    threading.Thread(target=accept_events, daemon=True).start()
+    event_flusher = Flusher(event_buffer, show_events, config.get("LOG_FPS", 10)).start()
+
     def read_output(proc):
-        import time
-        while True:
-            line = proc.stdout.readline()
-            if not line:
-                break
-            log_message(line.strip())
-            time.sleep(0.01) # Yield GIL to Flet asyncio event loop!
+        log_buffer.read_stream(proc.stdout)
         proc.wait()
-        log_message("--- Bot process terminated ---")
+        log_message("--- Bot worker exited ---")
 
-    def start_bot(e):
-        nonlocal bot_process
-        if bot_process is not None and bot_process.poll() is None:
-            log_message("Bot is already running.")
-            return
+    def spawn_worker():
+        # The worker outlives each Start/Stop, so the interpreter (or the frozen bundle) only starts once per session
+        nonlocal worker
+        cmd = [sys.executable, "--bot-worker"]
+        if not getattr(sys, 'frozen', False):
+            cmd = [sys.executable, "-u", os.path.abspath(__file__), "--bot-worker"]
+
+        env = os.environ.copy()
+        env["PYTHONUNBUFFERED"] = "1"
+        env["ATOZ_EVENT_PORT"] = str(event_server.getsockname()[1])
+
+        worker = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
+            env=env
+        )
+        # Daemon thread to read stdout
+        threading.Thread(target=read_output, args=(worker,), daemon=True).start()
+        send_worker({"cmd": "load"})
 
+    def send_worker(message):
+        if worker is None or worker.poll() is not None:
+            return False
         try:
-            cmd = [sys.executable, "--run-bot"]
-            if not getattr(sys, 'frozen', False):
-                cmd = [sys.executable, "-u", os.path.abspath(__file__), "--run-bot"]
-                
-            env = os.environ.copy()
-            env["PYTHONUNBUFFERED"] = "1"
-            
-            bot_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
-                env=env
-            )
-            # Daemon thread to read stdout
-            threading.Thread(target=read_output, args=(bot_process,), daemon=True).start()
-            
+            worker.stdin.write(json.dumps(message) + "\n")
+            worker.stdin.flush()
+            return True
+        except OSError:
+            return False
+
+    try:
+        spawn_worker()
+    except Exception as ex:
+        log_message(f"Failed to start the bot worker: {ex}")
+
+    def start_bot(e):
+        try:
+            if worker is None or worker.poll() is not None:
+                spawn_worker()
+            send_worker({"cmd": "start"})
+
             start_btn.disabled = True
             stop_btn.disabled = False
             log_message("--- Bot Started ---")
@@ -160,9 +265,7 @@ def main(page: ft.Page):
         page.update()
 
     def stop_bot(e):
-        nonlocal bot_process
-        if bot_process is not None and bot_process.poll() is None:
-            bot_process.terminate()
+        if send_worker({"cmd": "stop"}):
             log_message("--- Stop signal sent to bot ---")
         
         start_btn.disabled = False
@@ -274,7 +377,10 @@ def main(page: ft.Page):
                 ft.Text("Dashboard", size=24, weight=ft.FontWeight.W_800, color=ft.Colors.WHITE),
                 ft.Container(height=10),
                 ft.Row([start_btn, stop_btn]),
-                ft.Container(height=20),
+                ft.Container(height=15),
+                ft.Row([sweeps_tile, last_sweep_tile, days_tile, matches_tile, claims_tile, errors_tile]),
+                ft.Container(content=sweep_chart, height=100),
+                ft.Container(height=10),
                 ft.Text("Live Protocol Console", size=14, weight=ft.FontWeight.BOLD, color=ft.Colors.ON_SURFACE),
                 ft.Container(
                     content=log_output,
@@ -293,8 +399,16 @@ def main(page: ft.Page):
     # Clean up on exit
     def window_event(e):
         if e.data == "close":
-            if bot_process is not None and bot_process.poll() is None:
-                bot_process.terminate()
+            if send_worker({"cmd": "exit"}):
+                try:
+                    # Lets a running bot close Chrome (or detach from it) before the worker exits
+                    worker.wait(timeout=15)
+                except subprocess.TimeoutExpired:
+                    worker.terminate()
+            log_flusher.stop()
+            log_buffer.close()
+            event_flusher.stop()
+            event_server.close()
             page.window_destroy()
 
     page.on_window_event = window_event
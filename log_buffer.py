@@ -0,0 +1,85 @@
+import collections
+import queue
+import threading
+
+# Console model for gui_app.py. Any thread can append lines; a timer thread drains them in
+# batches at a fixed frame rate, so one page.update() covers however many lines arrived
+# since the last frame. Only the newest `capacity` lines are kept in memory; with a spill
+# file set, every line is also appended there so the full history survives.
+
+class LogBuffer:
+    def __init__(self, capacity=2000, spill_path=None):
+        self.capacity = max(1, int(capacity))
+        self.lines = collections.deque(maxlen=self.capacity)
+        self.pending = queue.SimpleQueue()
+        self.spill_path = spill_path
+        self.spill_file = open(spill_path, "a", encoding="utf-8") if spill_path else None
+        self.received = 0
+        self.evicted = 0
+        self.flushes = 0
+
+    def append(self, line):
+        """Queue one line; safe to call from any thread."""
+        self.pending.put(line)
+
+    def read_stream(self, stream):
+        """Drain a text stream (e.g. a bot's stdout) into the buffer until EOF. Meant for a reader thread."""
+        for line in stream:
+            self.pending.put(line.rstrip("\r\n"))
+
+    def drain(self):
+        """Move every queued line into the ring and return (new lines to show, lines that fell off the top)."""
+        batch = []
+        try:
+            while True:
+                batch.append(self.pending.get_nowait())
+        except queue.Empty:
+            pass
+        if not batch:
+            return [], 0
+
+        self.received += len(batch)
+        self.flushes += 1
+        if self.spill_file is not None:
+            self.spill_file.write("\n".join(batch) + "\n")
+            self.spill_file.flush()
+
+        overflow = max(0, len(self.lines) + len(batch) - self.capacity)
+        self.evicted += overflow
+        self.lines.extend(batch)
+        # Lines older than the cap would be evicted straight away, so the view never needs them
+        return batch[-self.capacity:], overflow
+
+    def close(self):
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
+
+class Flusher:
+    """Calls `on_batch(lines, overflow)` from a daemon thread at most `fps` times a second while lines keep arriving."""
+
+    def __init__(self, buffer, on_batch, fps=10):
+        self.buffer = buffer
+        self.on_batch = on_batch
+        self.interval = 1 / max(1, fps)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        lines, overflow = self.buffer.drain()
+        if lines:
+            self.on_batch(lines, overflow)
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread.is_alive():
+            self.thread.join()
+        self.flush()
@@ -0,0 +1,80 @@
+import argparse
+import csv
+import json
+import os
+import statistics
+import sys
+
+# Summarizes the memory log AtoZ-Bot.py writes every MEMORY_CHECK_EVERY sweeps: how the JS heap,
+# Chrome's memory and sweep time grew over each tab or browser, and how sweep time changed
+# across each recycle.
+#
+#     python memory_stats.py [--log accounts/alice/memory_log.csv]
+
+if getattr(sys, 'frozen', False):
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILE = os.environ.get("ATOZ_CONFIG_FILE", os.path.join(BASE_DIR, "config.json"))
+
+def default_log():
+    name = "memory_log.csv"
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            name = json.load(f).get("MEMORY_LOG_FILE") or name
+    except (OSError, ValueError):
+        pass
+    return os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), name)
+
+def number(text):
+    return float(text) if text else None
+
+def span(rows, key, unit):
+    values = [row[key] for row in rows if row[key] is not None]
+    if not values:
+        return "-"
+    return f"{values[0]:.0f} -> {values[-1]:.0f} {unit}" if len(values) > 1 else f"{values[0]:.0f} {unit}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Show sweep time against memory from the bot's memory log.")
+    parser.add_argument("--log", default=default_log())
+    args = parser.parse_args()
+
+    if not os.path.exists(args.log):
+        print(f"No memory log at {args.log}. Run the bot with MEMORY_CHECK_EVERY and MEMORY_LOG_FILE set first.")
+        return
+
+    with open(args.log, newline="") as f:
+        rows = [
+            {**row, "sweep_seconds": number(row["sweep_seconds"]), "js_heap_mb": number(row["js_heap_mb"]), "rss_mb": number(row["rss_mb"])}
+            for row in csv.DictReader(f)
+        ]
+    if not rows:
+        print("No samples logged yet.")
+        return
+
+    generations = {}
+    for row in rows:
+        generations.setdefault(row["generation"], []).append(row)
+
+    print(f"{len(rows)} samples from {rows[0]['time']} to {rows[-1]['time']} over {len(generations)} tabs or browsers.")
+    print(f"{'#':>3} {'Sweeps':>7} {'JS heap':>16} {'Chrome RSS':>18} {'Sweep time':>16} {'Ended by':>9}")
+    for generation, samples in generations.items():
+        sweeps = samples[-1]["sweeps"]
+        times = span([{"t": row["sweep_seconds"] * 1000} for row in samples], "t", "ms")
+        ended = samples[-1]["recycled"] or "-"
+        print(f"{generation:>3} {sweeps:>7} {span(samples, 'js_heap_mb', 'MB'):>16} {span(samples, 'rss_mb', 'MB'):>18} {times:>16} {ended:>9}")
+
+    # The sample that triggered a recycle against the first one taken on the fresh tab or browser
+    changes = [
+        (before["sweep_seconds"], after["sweep_seconds"])
+        for before, after in zip(rows, rows[1:])
+        if before["recycled"] and after["generation"] != before["generation"]
+    ]
+    if changes:
+        saved = [before - after for before, after in changes]
+        print(f"Across {len(changes)} recycles, sweeps got {statistics.median(saved) * 1000:.0f} ms faster (median), "
+              f"{statistics.mean(before for before, _ in changes):.2f}s before vs {statistics.mean(after for _, after in changes):.2f}s after.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+import argparse
+import ctypes
+import json
+import os
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+# Runs AtoZ-Bot.py for several associates from one process. Each account gets its own
+# config.json and ChromeBotProfile under accounts/<name>/, the number of Chrome instances
+# running at once is capped to fit in RAM, and sweeps are staggered across the interval.
+#
+# accounts.json is a list of objects: {"name": "alice", "Amazon_Login": "alice", ...}.
+# Anything besides "name" overrides the shared config.json for that account.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BOT_SCRIPT = os.path.join(BASE_DIR, "AtoZ-Bot.py")
+BASE_CONFIG_FILE = os.path.join(BASE_DIR, "config.json")
+
+# Rough resident size of one bot worker: Chrome with the A to Z SPA open plus chromedriver and Python
+DEFAULT_CHROME_RAM_MB = 700
+
+def available_memory_mb():
+    """Memory that can still be handed out, or None if the platform doesn't tell us."""
+    try:
+        if sys.platform == "win32":
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+            return status.ullAvailPhys // (1024 * 1024)
+        if os.path.exists("/proc/meminfo"):
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) // 1024
+        # macOS has no cheap "available" figure; assume half of physical memory is usable
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (2 * 1024 * 1024)
+    except Exception:
+        return None
+
+def load_json(path, default):
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            return json.load(f)
+    return default
+
+class Worker:
+    def __init__(self, name, overrides, accounts_dir):
+        self.name = name
+        self.overrides = overrides
+        self.directory = os.path.join(accounts_dir, name)
+        self.config_file = os.path.join(self.directory, "config.json")
+        self.profile_dir = os.path.join(self.directory, "ChromeBotProfile")
+        self.process = None
+        self.state = "queued"
+        self.started_at = None
+        self.sweeps = 0
+        self.claims = 0
+        self.errors = 0
+        self.event_server = None
+
+    def write_config(self, base_config, offset):
+        os.makedirs(self.directory, exist_ok=True)
+        account_config = {**base_config, **self.overrides, "SWEEP_OFFSET_SECONDS": round(offset, 1)}
+        with open(self.config_file, "w") as f:
+            json.dump(account_config, f, indent=4)
+
+    def start(self, lines):
+        env = os.environ.copy()
+        env["PYTHONUNBUFFERED"] = "1"
+        env["ATOZ_CONFIG_FILE"] = self.config_file
+        env["ATOZ_PROFILE_DIR"] = self.profile_dir
+        # The bot reports sweeps, claims and errors as JSON lines over this socket, the channel the GUI uses
+        self.event_server = socket.create_server(("127.0.0.1", 0))
+        env["ATOZ_EVENT_PORT"] = str(self.event_server.getsockname()[1])
+        threading.Thread(target=self.read_events, args=(self.event_server,), daemon=True).start()
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", BOT_SCRIPT],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=env,
+        )
+        self.state = "running"
+        self.started_at = time.time()
+        threading.Thread(target=self.read_output, args=(lines,), daemon=True).start()
+
+    def read_output(self, lines):
+        for line in self.process.stdout:
+            lines.put(f"[{self.name}] {line.rstrip()}")
+        self.process.wait()
+        self.event_server.close()
+        self.state = f"exited ({self.process.returncode})"
+
+    def read_events(self, server):
+        try:
+            connection, _ = server.accept()
+        except OSError:
+            return
+        try:
+            with connection, connection.makefile("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.record(event)
+        except OSError:
+            pass
+
+    def record(self, event):
+        kind = event.get("type")
+        if kind == "sweep_end":
+            self.sweeps += 1
+        elif kind == "claim" and event.get("outcome") == "confirmed":
+            self.claims += 1
+        elif kind == "error":
+            self.errors += 1
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+
+    def status(self):
+        if self.state != "running":
+            return f"{self.name}: {self.state}"
+        uptime = (time.time() - self.started_at) / 60
+        return f"{self.name}: running {uptime:.0f}m, {self.sweeps} sweeps, {self.claims} claims, {self.errors} errors"
+
+def run(accounts, max_instances, status_every, accounts_dir):
+    base_config = load_json(BASE_CONFIG_FILE, {})
+    interval = float(base_config.get("SECONDS_BETWEEN_CHECKS", 15))
+
+    workers = []
+    for k, account in enumerate(accounts):
+        overrides = {key: value for key, value in account.items() if key != "name"}
+        worker = Worker(account["name"], overrides, accounts_dir)
+        # Each account sweeps at its own offset into every check interval (see sweep_slot in AtoZ-Bot.py)
+        worker.write_config(base_config, k * interval / len(accounts))
+        workers.append(worker)
+
+    print(f"Managing {len(workers)} accounts, at most {max_instances} Chrome instances at once.")
+    lines = queue.Queue()
+    pending = list(workers)
+    next_status = time.time() + status_every
+    try:
+        while True:
+            running = [worker for worker in workers if worker.state == "running"]
+            while pending and len(running) < max_instances:
+                worker = pending.pop(0)
+                worker.start(lines)
+                running.append(worker)
+                print(f"Started {worker.name} (profile: {worker.profile_dir}).")
+
+            try:
+                print(lines.get(timeout=1))
+                while not lines.empty():
+                    print(lines.get_nowait())
+            except queue.Empty:
+                pass
+
+            if time.time() >= next_status:
+                print("[status] " + " | ".join(worker.status() for worker in workers))
+                next_status = time.time() + status_every
+
+            if not pending and not any(worker.state == "running" for worker in workers):
+                break
+    except KeyboardInterrupt:
+        print("\nStopping all accounts...")
+        for worker in workers:
+            worker.stop()
+    print("[status] " + " | ".join(worker.status() for worker in workers))
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the shift bot for several accounts at once.")
+    parser.add_argument("accounts", nargs="?", default=os.path.join(BASE_DIR, "accounts.json"))
+    parser.add_argument("--max-instances", type=int, default=None, help="Cap on concurrent Chrome instances (default: fit to free RAM)")
+    parser.add_argument("--chrome-ram-mb", type=int, default=DEFAULT_CHROME_RAM_MB, help="Memory budgeted per Chrome instance")
+    parser.add_argument("--status-every", type=float, default=60, help="Seconds between aggregated status lines")
+    parser.add_argument("--accounts-dir", default=os.path.join(BASE_DIR, "accounts"))
+    args = parser.parse_args()
+
+    accounts = load_json(args.accounts, [])
+    if not accounts:
+        print(f"No accounts found in {args.accounts}.")
+        return
+
+    max_instances = args.max_instances
+    if max_instances is None:
+        free_mb = available_memory_mb()
+        max_instances = len(accounts) if free_mb is None else max(1, free_mb // args.chrome_ram_mb)
+        print(f"Free memory: {free_mb if free_mb is not None else 'unknown'} MB.")
+    run(accounts, min(max_instances, len(accounts)), args.status_every, args.accounts_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Clock helpers shared by AtoZ-Bot.py and the tools that read its data."""
+
+MINUTES_PER_DAY = 24 * 60
+
+def format_clock(minutes):
+    """Minutes since midnight as the site writes them, e.g. 1110 -> "6:30pm"."""
+    hour, minute = divmod(minutes % MINUTES_PER_DAY, 60)
+    return f"{(hour % 12) or 12}:{minute:02d}{'am' if hour < 12 else 'pm'}"
@@ -0,0 +1,80 @@
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+from datetime import datetime
+
+from shift_clock import format_clock
+
+# Summarizes the shift history AtoZ-Bot.py keeps in shifts.db: shifts seen per day, how long
+# they stayed up before someone took them, and how claim attempts turned out.
+#
+#     python shift_stats.py [--db accounts/alice/shifts.db] [--days 14]
+
+if getattr(sys, 'frozen', False):
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILE = os.environ.get("ATOZ_CONFIG_FILE", os.path.join(BASE_DIR, "config.json"))
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "shifts.db")
+
+def format_duration(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 120:
+        return f"{seconds:.0f}s"
+    if seconds < 2 * 60 * 60:
+        return f"{seconds / 60:.1f}m"
+    return f"{seconds / 3600:.1f}h"
+
+def median(values):
+    return statistics.median(values) if values else None
+
+def main():
+    parser = argparse.ArgumentParser(description="Show stats from the bot's shift history.")
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--days", type=int, default=14, help="How many of the most recent shift dates to list")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"No shift history at {args.db}. Run the bot with SHIFT_STORE enabled first.")
+        return
+
+    connection = sqlite3.connect(f"file:{args.db}?mode=ro", uri=True)
+    rows = connection.execute("SELECT date, first_seen, gone_at FROM shifts ORDER BY date").fetchall()
+    if not rows:
+        print("No shifts recorded yet.")
+        return
+
+    by_date = {}
+    for date, first_seen, gone_at in rows:
+        by_date.setdefault(date, []).append(None if gone_at is None else gone_at - first_seen)
+    all_gone = [seconds for lifetimes in by_date.values() for seconds in lifetimes if seconds is not None]
+
+    print(f"{len(rows)} shifts over {len(by_date)} dates; median time-to-gone {format_duration(median(all_gone))}.")
+    print(f"{'Date':<12} {'Day':<10} {'Seen':>5} {'Gone':>5} {'Median up':>10}")
+    for date in sorted(by_date)[-args.days:]:
+        lifetimes = by_date[date]
+        gone = [seconds for seconds in lifetimes if seconds is not None]
+        weekday = datetime.strptime(date, "%Y-%m-%d").strftime("%A")
+        print(f"{date:<12} {weekday:<10} {len(lifetimes):>5} {len(gone):>5} {format_duration(median(gone)):>10}")
+
+    claims = connection.execute(
+        "SELECT outcome, COUNT(*), AVG(click_ms), AVG(confirm_ms) FROM claims GROUP BY outcome ORDER BY COUNT(*) DESC"
+    ).fetchall()
+    if claims:
+        print("Claim attempts:")
+        for outcome, count, click_ms, confirm_ms in claims:
+            timing = f", avg click {click_ms:.0f} ms" if click_ms is not None else ""
+            timing += f", avg confirm {confirm_ms:.0f} ms" if confirm_ms is not None else ""
+            print(f"  {outcome}: {count}{timing}")
+        recent = connection.execute(
+            "SELECT date, start, end, outcome FROM claims ORDER BY attempted_at DESC LIMIT 5"
+        ).fetchall()
+        for date, start, end, outcome in recent:
+            print(f"  {date} {format_clock(start)} - {format_clock(end)}: {outcome}")
+    connection.close()
+
+if __name__ == "__main__":
+    main()